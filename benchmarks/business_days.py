@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+"""Time adding business days to many dates, one at a time and as an array."""
+import sys
+import timeit
+
+from convertdate import gregorian
+from convertdate.business import BusinessCalendar
+
+
+def main(size=100000):
+    cal = BusinessCalendar()
+    start = gregorian.to_jd(1990, 1, 1)
+    jds = [start + i % 12000 for i in range(size)]
+    # warm the cache of business days
+    cal.add_business_days(jds[0], 0)
+    cal.add_business_days(jds[-1], 0)
+
+    single = timeit.timeit(lambda: [cal.add_business_days(jd, 2) for jd in jds], number=1)
+    print('add_business_days       {:>12,.0f} dates/sec'.format(size / single))
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+
+    array = numpy.array(jds)
+    vectorized = timeit.timeit(lambda: cal.add_business_days_array(array, 2), number=1)
+    print('add_business_days_array {:>12,.0f} dates/sec'.format(size / vectorized))
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+"""Compare the throughput of the scalar and array Gregorian conversions."""
+import sys
+import timeit
+
+import numpy
+
+from convertdate import gregorian
+
+
+def main(rows=1_000_000):
+    jds = numpy.arange(2159677, 2159677 + rows) + 0.5
+    years, months, days = gregorian.from_jd_array(jds)
+    dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+    jdlist = jds.tolist()
+
+    timings = {
+        'to_jd (loop)': timeit.timeit(lambda: [gregorian.to_jd(*d) for d in dates], number=1),
+        'to_jd_array': timeit.timeit(lambda: gregorian.to_jd_array(years, months, days), number=1),
+        'from_jd (loop)': timeit.timeit(lambda: [gregorian.from_jd(j) for j in jdlist], number=1),
+        'from_jd_array': timeit.timeit(lambda: gregorian.from_jd_array(jds), number=1),
+    }
+
+    for name, seconds in timings.items():
+        print('{:<16} {:>14,.0f} rows/sec'.format(name, rows / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
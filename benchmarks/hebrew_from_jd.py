@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+"""Compare hebrew.from_jd with the earlier year-probing implementation."""
+import sys
+import timeit
+from math import floor
+
+from convertdate import hebrew
+
+JDCS = range(2159677, 2488395, 2000)
+
+
+def probing_from_jd(jd):
+    '''The previous algorithm: probe years with to_jd, then walk the months.'''
+    jd = floor(jd) + 0.5
+    count = floor(((jd - hebrew.EPOCH) * 98496.0) / 35975351.0)
+    year = count - 1
+    i = count
+    while jd >= hebrew.to_jd(i, hebrew.TISHRI, 1):
+        i += 1
+        year += 1
+
+    first = hebrew.TISHRI if jd < hebrew.to_jd(year, hebrew.NISAN, 1) else hebrew.NISAN
+
+    month = i = first
+    while jd > hebrew.to_jd(year, i, hebrew.month_length(year, i)):
+        i += 1
+        month += 1
+
+    day = int(jd - hebrew.to_jd(year, month, 1)) + 1
+    return (year, month, day)
+
+
+def main(step=1):
+    jds = [j + 0.5 for j in range(JDCS.start, JDCS.stop, step)]
+    assert [hebrew.from_jd(j) for j in jds] == [probing_from_jd(j) for j in jds]
+
+    for name, func in (('probing', probing_from_jd), ('from_jd', hebrew.from_jd)):
+        seconds = timeit.timeit(lambda f=func: [f(j) for j in jds], number=1)
+        print('{:<10} {:>12,.0f} conversions/sec'.format(name, len(jds) / seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
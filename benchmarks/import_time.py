@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+"""Report the import time of convertdate and its modules using ``python -X importtime``."""
+import subprocess
+import sys
+
+STATEMENTS = (
+    'import convertdate',
+    'from convertdate import gregorian, julian',
+    'from convertdate import hebrew',
+    'from convertdate import persian',
+    'import convertdate.holidays',
+)
+
+
+def import_time(statement):
+    '''Return the cumulative import time (microseconds) of the convertdate modules imported by statement.'''
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        # Only count modules at the top of the import tree, their dependencies are included
+        if name.startswith(' convertdate'):
+            total += int(cumulative)
+
+    return total
+
+
+def main(repeat=5):
+    for statement in STATEMENTS:
+        best = min(import_time(statement) for _ in range(repeat))
+        print('{:<45} {:>8,} us'.format(statement, best))
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
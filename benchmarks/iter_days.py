@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+"""Compare generating every day in a range with iter_days and with from_jd."""
+import sys
+import timeit
+
+from convertdate import bahai, gregorian, hebrew, persian
+
+
+def main(years=100):
+    start = gregorian.to_jd(1950, 1, 1)
+    end = gregorian.to_jd(1950 + years, 1, 1)
+    days = int(end - start)
+
+    for module in (bahai, hebrew, persian):
+        # warm caches
+        list(module.iter_days(start, end))
+
+        loop = timeit.timeit(lambda: [module.from_jd(start + i) for i in range(days)], number=1)
+        iterated = timeit.timeit(lambda: list(module.iter_days(start, end)), number=1)
+        name = module.__name__.split('.')[-1]
+        template = '{:<8} from_jd {:>12,.0f} days/sec  iter_days {:>12,.0f} days/sec'
+        print(template.format(name, days / loop, days / iterated))
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
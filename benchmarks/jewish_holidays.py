@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+"""Compare calculating a range of years of Jewish holidays in one batch and one holiday at a time."""
+import sys
+import timeit
+
+from convertdate import holidays
+
+
+def each(start, end):
+    return {
+        year: {name: getattr(holidays, name)(year) for name, _, _ in holidays.JEWISH_HOLIDAYS}
+        for year in range(start, end + 1)
+    }
+
+
+def main(years=200):
+    start, end = 1900, 1900 + years - 1
+    # warm caches
+    holidays.jewish_holidays_range(start, end)
+
+    single = timeit.timeit(lambda: each(start, end), number=1)
+    batch = timeit.timeit(lambda: holidays.jewish_holidays_range(start, end), number=1)
+    print('{} years: one at a time {:.3f}s  jewish_holidays_range {:.3f}s'.format(years, single, batch))
+
+
+if __name__ == '__main__':
+    main(*(int(a) for a in sys.argv[1:]))
@@ -17,36 +17,28 @@ which was developed by John Walker.
 
 The algorithms are believed to be derived from: Meeus, Jean. `Astronomical Algorithms`,
 Richmond: Willmann-Bell, 1991 (ISBN 0-943396-35-2)
+
+Use :meth:`convertdate.convert` to convert directly between two calendars.
+
+Calendar modules are imported when first accessed, so ``import convertdate`` doesn't
+pay for loading pymeeus or the data tables of calendars that aren't used.
 """
-from . import (
-    armenian,
-    bahai,
-    coptic,
-    daycount,
-    dublin,
-    french_republican,
-    gregorian,
-    hebrew,
-    holidays,
-    indian_civil,
-    islamic,
-    iso,
-    julian,
-    julianday,
-    mayan,
-    ordinal,
-    persian,
-    positivist,
-    utils,
-)
+import importlib
 
 __version__ = '2.4.1'
 
 __all__ = [
     'armenian',
+    'astro',
     'bahai',
+    'business',
     'coptic',
+    # convert and convert_many are looked up in dispatch by __getattr__, see _FUNCTIONS
+    'convert',  # pylint: disable=undefined-all-variable
+    'convert_many',  # pylint: disable=undefined-all-variable
+    'dates',
     'daycount',
+    'dispatch',
     'dublin',
     'french_republican',
     'gregorian',
@@ -57,9 +49,32 @@ __all__ = [
     'iso',
     'julian',
     'julianday',
+    'lookup',
     'mayan',
     'ordinal',
     'persian',
     'positivist',
+    'umalqura',
     'utils',
 ]
+
+
+# Functions exported from submodules
+_FUNCTIONS = {
+    'convert': 'dispatch',
+    'convert_many': 'dispatch',
+}
+
+
+def __getattr__(name):
+    if name in _FUNCTIONS:
+        return getattr(importlib.import_module('.' + _FUNCTIONS[name], __name__), name)
+
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
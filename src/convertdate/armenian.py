@@ -18,13 +18,16 @@ used beginning with the Armenian year 533 (11 August 1084) by passing the
 parameter ``method='sarkawag'`` to the relevant functions.
 """
 
-from math import trunc
+from math import floor
 
-from . import gregorian, julian
-from .utils import jwday, monthcalendarhelper
+from . import gregorian, julian, utils
+from .dates import MethodDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 EPOCH = 1922501.5  # beginning of proleptic year 0, day 0 of the moveable calendar
 EPOCH_SARKAWAG = 2117210.5  # last day of Sarkawag's first cycle
+EPOCH_JDN = int(EPOCH + 0.5)
+EPOCH_SARKAWAG_JDN = int(EPOCH_SARKAWAG + 0.5)
 MONTHS = [
     "nawasard",
     "hoṙi",
@@ -96,63 +99,154 @@ def leap(year):
     return year % 4 == 0
 
 
-def to_jd(year, month, day, method=None):
-    """Convert Armenian date to Julian day count. Use the method of Sarkawag if requested."""
+def to_jdn(year, month, day, method=None):
+    """Convert Armenian date to julian day number. Use the method of Sarkawag if requested."""
     _valid_date(year, month, day, method)
     yeardays = (month - 1) * 30 + day
     if method == "sarkawag":
         yeardelta = year - 533
-        leapdays = trunc(yeardelta / 4)
-        return EPOCH_SARKAWAG + (365 * yeardelta) + leapdays + yeardays
+        leapdays = yeardelta // 4
+        return EPOCH_SARKAWAG_JDN + (365 * yeardelta) + leapdays + yeardays
 
-    return EPOCH + (365 * year) + yeardays
+    return EPOCH_JDN + (365 * year) + yeardays
 
 
-def from_jd(jd, method=None):
-    """Convert a Julian day count to an Armenian date. Use the method of Sarkawag if requested."""
+def to_jd(year, month, day, method=None):
+    """Convert Armenian date to Julian day count. Use the method of Sarkawag if requested."""
+    return to_jdn(year, month, day, method) - 0.5
+
+
+def from_jdn(jdn, method=None):
+    """Convert a julian day number to an Armenian date. Use the method of Sarkawag if requested."""
     if method == "sarkawag":
-        dc = jd - EPOCH_SARKAWAG
+        dc = jdn - EPOCH_SARKAWAG_JDN
         if dc < 0:
             raise ValueError("Day count out of range for method")
-        years = trunc(dc / 365.25)
-        yeardays = dc - (365 * years + trunc(years / 4))
+        years = (4 * dc) // 1461
+        yeardays = dc - (365 * years + years // 4)
         if yeardays == 0:
             yeardays = 366 if years % 4 == 0 else 365
             years -= 1
-        months = trunc((yeardays - 1) / 30)
+        months = (yeardays - 1) // 30
         days = yeardays - (30 * months)
-        return years + 533, months + 1, trunc(days)
+        return years + 533, months + 1, days
 
-    dc = jd - EPOCH
+    dc = jdn - EPOCH_JDN
 
     if dc < 0:
         raise ValueError("Day count out of range")
 
-    years = trunc((dc - 1) / 365)
-    months = trunc(((dc - 1) % 365) / 30)
+    years, yeardays = divmod(dc - 1, 365)
+    months = yeardays // 30
     days = dc - (365 * years) - (30 * months)
 
-    return years, months + 1, trunc(days)
+    return years, months + 1, days
+
+
+def from_jd(jd, method=None):
+    """Convert a Julian day count to an Armenian date. Use the method of Sarkawag if requested."""
+    return from_jdn(floor(jd + 0.5), method)
+
+
+def to_jdn_array(years, months, days, method=None):
+    '''
+    Convert arrays of Armenian dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Use the method of Sarkawag if requested. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Armenian date.
+    '''
+    np = require_numpy()
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+
+    if method == "sarkawag":
+        year_min, epagomenal = 533, 5 + ((years % 4 == 0) & (years >= 533))
+    else:
+        year_min, epagomenal = 1, 5
+
+    day_max = np.where(months == 13, epagomenal, 30)
+    illegal = (months < 1) | (months > 13) | (years < year_min) | (days < 1) | (days > day_max)
+    if illegal.any():
+        i = np.argmax(illegal)
+        raise ValueError("Invalid Armenian date: ({}, {}, {})".format(years.flat[i], months.flat[i], days.flat[i]))
+
+    yeardays = (months - 1) * 30 + days
+    if method == "sarkawag":
+        yeardelta = years - 533
+        return EPOCH_SARKAWAG_JDN + (365 * yeardelta) + yeardelta // 4 + yeardays
+
+    return EPOCH_JDN + (365 * years) + yeardays
+
+
+def to_jd_array(years, months, days, method=None):
+    '''
+    Convert arrays of Armenian dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Use the method of Sarkawag if requested. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days, method) - 0.5
+
+
+def from_jdn_array(jdns, method=None):
+    '''Return Armenian dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    jdns = np.asarray(jdns, dtype=np.int64)
+
+    if method == "sarkawag":
+        dc = jdns - EPOCH_SARKAWAG_JDN
+        if (dc < 0).any():
+            raise ValueError("Day count out of range for method")
+        years = (4 * dc) // 1461
+        yeardays = dc - (365 * years + years // 4)
+        # The last day of each year counts as day 0 of the next
+        last = yeardays == 0
+        yeardays = np.where(last, np.where(years % 4 == 0, 366, 365), yeardays)
+        years = years - last
+        months = (yeardays - 1) // 30
+        return years + 533, months + 1, yeardays - (30 * months)
+
+    dc = jdns - EPOCH_JDN
+    if (dc < 0).any():
+        raise ValueError("Day count out of range")
+
+    years, yeardays = np.divmod(dc - 1, 365)
+    months = yeardays // 30
+    return years, months + 1, dc - (365 * years) - (30 * months)
+
+
+def from_jd_array(jds, method=None):
+    '''Return Armenian dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64) + 0.5).astype(np.int64), method)
 
 
 def to_julian(year, month, day, method=None):
     """Convert an Armenian date to a Julian date"""
-    return julian.from_jd(to_jd(year, month, day, method))
+    return julian.from_jdn(to_jdn(year, month, day, method))
 
 
 def from_julian(year, month, day, method=None):
     """Convert a Julian date to an Armenian date"""
-    return from_jd(julian.to_jd(year, month, day), method)
+    return from_jdn(julian.to_jdn(year, month, day), method)
 
 
 def to_gregorian(year, month, day, method=None):
     """Convert an Armenian date to a Gregorian date"""
-    return gregorian.from_jd(to_jd(year, month, day, method))
+    return gregorian.from_jdn(to_jdn(year, month, day, method))
 
 
 def from_gregorian(year, month, day, method=None):
     """Convert a Gregorian date to an Armenian date"""
-    return from_jd(gregorian.to_jd(year, month, day), method)
+    return from_jdn(gregorian.to_jdn(year, month, day), method)
+
+
+def from_gregorian_array(years, months, days, method=None):
+    '''Convert arrays of Gregorian dates to Armenian dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days), method)
+
+
+def to_gregorian_array(years, months, days, method=None):
+    '''Convert arrays of Armenian dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days, method))
 
 
 def month_length(year, month, method=None):
@@ -188,3 +282,23 @@ def format(year, month, day, lang=None):
 def tostring(year, month, day, lang=None):
     """Kept for backwards compatibility, the format function name will be standard across the library"""
     return format(year, month, day, lang)
+
+
+def iter_days(start_jd, end_jd, method=None):
+    '''Generate Armenian dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(
+        start_jd,
+        end_jd,
+        lambda jd: from_jd(jd, method=method),
+        lambda year, month: month_length(year, month, method=method),
+        lambda year: range(1, 14),
+    )
+
+
+class ArmenianDate(MethodDate):
+    '''A date in the Armenian calendar'''
+
+    __slots__ = ()
+    calendar = 'armenian'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+"""
+Astronomical events used by the solar calendars. All calls to pymeeus go through this module.
+
+Results are memoized in size-bounded LRU caches keyed on the year, the event and the
+correction options. Use :meth:`cache_info` to inspect hits and misses, :meth:`set_cache_size`
+to size the caches for a workload and :meth:`cache_clear` to empty them.
+"""
+from functools import lru_cache
+
+from pymeeus.Angle import Angle
+from pymeeus.Epoch import Epoch
+from pymeeus.Sun import Sun
+
+CACHE_SIZE = 1024
+
+# Month in which each equinox or solstice falls, used for the Delta T correction
+SEASONS = {'spring': 3, 'summer': 6, 'autumn': 9, 'winter': 12}
+
+
+def _equinox_solstice(year, season, ut, apparent):
+    epoch = Sun.get_equinox_solstice(year, target=season)
+
+    if ut:
+        epoch = epoch - Epoch.tt2ut(year, SEASONS[season]) / (24 * 60 * 60.0)
+
+    if apparent:
+        epoch = epoch + (Sun.equation_of_time(epoch)[0] / (24 * 60.0))
+
+    return epoch.jde()
+
+
+def _sunset(year, month, day, latitude, longitude):
+    return Epoch(year, month, day).rise_set(Angle(latitude), Angle(longitude))[1].jde()
+
+
+_equinox_solstice_cache = lru_cache(maxsize=CACHE_SIZE)(_equinox_solstice)
+_sunset_cache = lru_cache(maxsize=CACHE_SIZE)(_sunset)
+
+
+def equinox_solstice(year, season, ut=False, apparent=False):
+    """
+    Julian day of an equinox or solstice.
+
+    Arguments:
+        year (int): Gregorian year
+        season (str): 'spring', 'summer', 'autumn' or 'winter' (northern hemisphere)
+        ut (bool): Convert from dynamical time to universal time
+        apparent (bool): Correct by the equation of time, giving apparent solar time
+    """
+    if season not in SEASONS:
+        raise ValueError("Unknown season. Try: spring, summer, autumn or winter")
+
+    return _equinox_solstice_cache(year, season, bool(ut), bool(apparent))
+
+
+def sunset(year, month, day, latitude, longitude):
+    """
+    Julian day of sunset on a Gregorian date at a location.
+
+    Arguments:
+        latitude (float): degrees north
+        longitude (float): degrees east
+    """
+    return _sunset_cache(year, month, day, latitude, longitude)
+
+
+def cache_info():
+    """Return a dict of ``functools`` cache statistics (hits, misses, maxsize, currsize) for each event type."""
+    return {
+        'equinox_solstice': _equinox_solstice_cache.cache_info(),
+        'sunset': _sunset_cache.cache_info(),
+    }
+
+
+def cache_clear():
+    """Empty all caches."""
+    _equinox_solstice_cache.cache_clear()
+    _sunset_cache.cache_clear()
+
+
+def set_cache_size(maxsize):
+    """Replace the caches with empty caches holding at most ``maxsize`` results each (``None`` for unbounded)."""
+    # pylint: disable=global-statement
+    global _equinox_solstice_cache, _sunset_cache
+    _equinox_solstice_cache = lru_cache(maxsize=maxsize)(_equinox_solstice)
+    _sunset_cache = lru_cache(maxsize=maxsize)(_sunset)
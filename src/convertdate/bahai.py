@@ -23,15 +23,12 @@ reported as month 20.
    # (2019, 3, 2)
 
 """
-from calendar import isleap
-from math import ceil, trunc
+from math import trunc
 
-from pymeeus.Angle import Angle
-from pymeeus.Epoch import Epoch
-from pymeeus.Sun import Sun
-
-from . import gregorian
-from .utils import jwday, monthcalendarhelper
+from . import astro, gregorian, utils
+from .data import bahai_nawruz
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 EPOCH = 2394646.5
 EPOCH_GREGORIAN_YEAR = 1844
@@ -112,89 +109,140 @@ def gregorian_nawruz(year):
     """
     Return Nawruz in the Gregorian calendar.
     Returns a tuple (month, day), where month is always 3
+
+    Years between ``bahai_nawruz.FIRST_YEAR`` and ``bahai_nawruz.LAST_YEAR`` are read
+    from a precomputed table, others are computed from the equinox and sunset in Tehran.
     """
+    if bahai_nawruz.FIRST_YEAR <= year <= bahai_nawruz.LAST_YEAR:
+        return 3, bahai_nawruz.NAWRUZ_MARCH_DAY[year - bahai_nawruz.FIRST_YEAR]
+
+    return _gregorian_nawruz_astro(year)
+
+
+def _gregorian_nawruz_astro(year):
     if year == 2059:
         return 3, 20
 
     # Timestamp of spring equinox.
-    equinox = Sun.get_equinox_solstice(year, "spring")
+    equinox = astro.equinox_solstice(year, "spring")
 
     # Get times of sunsets in Tehran near vernal equinox.
-    x, y = Angle(TEHRAN[0]), Angle(TEHRAN[1])
-    days = trunc(equinox.get_date()[2]), ceil(equinox.get_date()[2])
+    day = gregorian.from_jd(equinox)[2]
 
-    for day in days:
-        sunset = Epoch(year, 3, day).rise_set(y, x)[1]
+    for d in (day, day + 1):
+        sunset = astro.sunset(year, 3, d, TEHRAN[1], TEHRAN[0])
         if sunset > equinox:
-            return 3, day
+            return 3, d
 
     raise ValueError("Couldn't find date of Nawruz.")
 
 
-def to_jd(year, month, day):
-    '''Determine Julian day from Bahai date'''
+def _nawruz_jdn(gyear):
+    '''Julian day number of Nawruz in the given Gregorian year'''
+    return gregorian.to_jdn(gyear, *gregorian_nawruz(gyear))
+
+
+def to_jdn(year, month, day):
+    '''Determine julian day number from Bahai date'''
+    gy = year - 1 + EPOCH_GREGORIAN_YEAR
     if month <= 18:
-        gy = year - 1 + EPOCH_GREGORIAN_YEAR
-        n_month, n_day = gregorian_nawruz(gy)
-        return gregorian.to_jd(gy, n_month, n_day - 1) + day + (month - 1) * 19
+        return _nawruz_jdn(gy) - 1 + day + (month - 1) * 19
     if month == 19:
         # Count Ayyám-i-Há from the last day of Mulk
-        return to_jd(year, month - 1, 19) + day
+        return _nawruz_jdn(gy) - 1 + (18 * 19) + day
     # For the month of ‘Alá we will count _backwards_ from the next Naw Rúz
-    gy = year + EPOCH_GREGORIAN_YEAR
-    n_month, n_day = gregorian_nawruz(gy)
-    return gregorian.to_jd(gy, n_month, n_day) - 20 + day
+    return _nawruz_jdn(gy + 1) - 20 + day
+
+
+def to_jd(year, month, day):
+    '''Determine Julian day from Bahai date'''
+    return to_jdn(year, month, day) - 0.5
+
+
+def from_jdn(jdn):
+    '''Calculate Bahai date from julian day number'''
+    gy = gregorian.from_jdn(jdn)[0]
+    nawruz = _nawruz_jdn(gy)
+
+    if jdn < nawruz:
+        gy = gy - 1
+        nawruz = _nawruz_jdn(gy)
+
+    year = gy - EPOCH_GREGORIAN_YEAR + 1
+    days = jdn - nawruz
+
+    if days < 18 * 19:
+        return year, days // 19 + 1, days % 19 + 1
+
+    # ‘Alá is the last 19 days before the next Naw Rúz
+    ala = _nawruz_jdn(gy + 1) - 19
+    if jdn >= ala:
+        return year, ALA, jdn - ala + 1
+
+    return year, AYYAMIHA, days - (18 * 19) + 1
 
 
 def from_jd(jd):
     '''Calculate Bahai date from Julian day'''
-    jd = trunc(jd) + 0.5
-    g = gregorian.from_jd(jd)
-    gy = g[0]
-    n_month, n_day = gregorian_nawruz(gy)
+    return from_jdn(trunc(jd) + 1)
 
-    bstarty = EPOCH_GREGORIAN_YEAR
 
-    if jd <= gregorian.to_jd(gy, n_month, 20):
-        x = 1
-    else:
-        x = 0
-    # verify this next line...
-    bys = gy - (bstarty + (((gregorian.to_jd(gy, 1, 1) <= jd) and x)))
+def _month_order(year):
+    return range(1, 21)
 
-    year = bys + 1
-    days = jd - to_jd(year, 1, 1)
-    bld = to_jd(year, n_day - 1, 1)
 
-    if jd >= bld:
-        month = 20
-    else:
-        month = trunc(days / 19) + 1
-    day = int((jd + 1) - to_jd(year, month, 1))
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Bahai dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Bahai date.
+    '''
+    return utils.to_jdn_array(years, months, days, to_jdn, month_length, _month_order)
+
 
-    return year, month, day
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Bahai dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def from_jdn_array(jdns):
+    '''Return Bahai dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    return utils.from_jdn_array(jdns, from_jdn, to_jdn, month_length, _month_order)
+
+
+def from_jd_array(jds):
+    '''Return Bahai dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.trunc(np.asarray(jds, dtype=np.float64)).astype(np.int64) + 1)
 
 
 def from_gregorian(year, month, day):
-    return from_jd(gregorian.to_jd(year, month, day))
+    return from_jdn(gregorian.to_jdn(year, month, day))
 
 
 def to_gregorian(year, month, day):
-    return gregorian.from_jd(to_jd(year, month, day))
+    return gregorian.from_jdn(to_jdn(year, month, day))
 
 
-def month_length(year, month):
-    gy = year + EPOCH_GREGORIAN_YEAR - 1
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Bahai dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
 
-    if month == 19:
-        _, nawruz_future = gregorian_nawruz(gy + 1)
-        _, nawruz_past = gregorian_nawruz(gy)
-        length_of_year = nawruz_future + 365 - nawruz_past
 
-        if isleap(gy + 1):
-            length_of_year = length_of_year + 1
+def to_gregorian_array(years, months, days):
+    '''Convert arrays of Bahai dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days))
 
-        return length_of_year - 19 * 19
+
+def month_length(year, month):
+    if month == 19:
+        gy = year + EPOCH_GREGORIAN_YEAR - 1
+        return _nawruz_jdn(gy + 1) - _nawruz_jdn(gy) - 19 * 19
 
     return 19
 
@@ -215,3 +263,17 @@ def format(year, month, day, lang=None):
         month_name = ENGLISH_MONTHS[month - 1]
 
     return "{0:d} {1:} {2:d}".format(day, month_name, year)
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Bahá'í dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(start_jd, end_jd, from_jd, month_length, _month_order)
+
+
+class BahaiDate(CalendarDate):
+    '''A date in the Bahá'í calendar'''
+
+    __slots__ = ()
+    calendar = 'bahai'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+"""
+Business day arithmetic, skipping weekends and holidays.
+
+A :class:`BusinessCalendar` is built from functions in :mod:`convertdate.holidays`.
+The first time a Gregorian year is used, the calendar works out which of its days are
+business days and keeps the result, so later calculations in that year don't call the
+holiday functions again.
+
+.. code-block:: python
+
+   from convertdate import gregorian
+   from convertdate.business import BusinessCalendar
+
+   cal = BusinessCalendar()
+   jd = cal.add_business_days(gregorian.to_jd(2023, 12, 22), 2)
+   gregorian.from_jd(jd)
+   # (2023, 12, 27)
+
+Days are Julian days, and are mapped to the day that contains them, as in :meth:`gregorian.from_jd`.
+Business day offsets follow ``numpy.busday_offset`` with ``roll='forward'``.
+"""
+from functools import partial
+from math import floor
+
+from . import gregorian, holidays
+from .holidays import SAT, SUN
+from .utils import require_numpy
+
+
+def observed_since(first_year, holiday):
+    '''
+    A holiday function that gives ``None`` for the years before ``first_year``,
+    for holidays that were created in that year.
+    '''
+
+    def func(year):
+        return holiday(year) if year >= first_year else None
+
+    return func
+
+
+# Federal holidays in the United States, on the days they're observed
+FEDERAL_HOLIDAYS = (
+    partial(holidays.new_years, observed=True),
+    observed_since(1986, holidays.martin_luther_king_day),
+    holidays.presidents_day,
+    holidays.memorial_day,
+    observed_since(2021, partial(holidays.juneteenth, observed=True)),
+    partial(holidays.independence_day, observed=True),
+    holidays.labor_day,
+    holidays.indigenous_peoples_day,
+    partial(holidays.veterans_day, observed=True),
+    holidays.thanksgiving,
+    partial(holidays.christmas, observed=True),
+)
+
+
+class BusinessCalendar:
+    """
+    Business days for a set of holidays.
+
+    Arguments:
+        holidays (list): functions that take a Gregorian year and return the Gregorian (year, month, day)
+            of a holiday, or ``None`` if there's none that year. Defaults to :data:`FEDERAL_HOLIDAYS`.
+        weekend (list): days of the week that aren't business days, 0 = Monday
+    """
+
+    def __init__(self, holidays=FEDERAL_HOLIDAYS, weekend=(SAT, SUN)):
+        # pylint: disable=redefined-outer-name
+        if len(set(weekend)) >= 7:
+            raise ValueError("A week needs at least one business day")
+
+        self.holidays = tuple(holidays)
+        self.weekend = frozenset(weekend)
+        self._years = {}
+
+    def __repr__(self):
+        return 'BusinessCalendar({} holidays, weekend={})'.format(len(self.holidays), sorted(self.weekend))
+
+    def _holidays(self, year):
+        '''Julian day numbers of the holidays in a Gregorian year'''
+        days = set()
+        # An observed holiday can fall in the neighbouring year, e.g. new year's on December 31
+        for y in (year - 1, year, year + 1):
+            for func in self.holidays:
+                date = func(y)
+                if date is not None and date[0] == year:
+                    days.add(gregorian.to_jdn(*date))
+
+        return days
+
+    def _year(self, year):
+        """
+        Business days in a Gregorian year.
+
+        Returns:
+            tuple - julian day number of January 1, a bitmap with a 1 for each business day,
+            the number of business days before each day of the year, and the index of each business day
+        """
+        try:
+            return self._years[year]
+        except KeyError:
+            pass
+
+        start = gregorian.to_jdn(year, 1, 1)
+        end = gregorian.to_jdn(year + 1, 1, 1)
+        closed = self._holidays(year)
+        bitmap = bytearray(0 if jdn % 7 in self.weekend or jdn in closed else 1 for jdn in range(start, end))
+
+        counts = [0] * (len(bitmap) + 1)
+        for i, workday in enumerate(bitmap):
+            counts[i + 1] = counts[i] + workday
+
+        workdays = [i for i, workday in enumerate(bitmap) if workday]
+        self._years[year] = start, bitmap, counts, workdays
+        return self._years[year]
+
+    def _locate(self, jdn):
+        '''The Gregorian year that contains a julian day number, and the index of the day in it'''
+        year = gregorian.from_jdn(jdn)[0]
+        return year, jdn - self._year(year)[0]
+
+    def is_business_day(self, jd):
+        '''Check if a Julian day is a business day.'''
+        year, i = self._locate(floor(jd + 0.5))
+        return self._year(year)[1][i] == 1
+
+    def add_business_days(self, jd, days):
+        """
+        Move a number of business days from a Julian day. A day that isn't a
+        business day is first moved forward to the next business day.
+
+        Arguments:
+            jd (float): Julian day
+            days (int): number of business days to move, negative to move backward
+
+        Returns:
+            float - Julian day
+        """
+        year, i = self._locate(floor(jd + 0.5))
+        _, _, counts, workdays = self._year(year)
+        k = counts[i] + days
+
+        while k >= len(workdays):
+            k -= len(workdays)
+            year += 1
+            workdays = self._year(year)[3]
+
+        while k < 0:
+            year -= 1
+            workdays = self._year(year)[3]
+            k += len(workdays)
+
+        return self._year(year)[0] + workdays[k] - 0.5
+
+    def next_business_day(self, jd):
+        '''The first business day after a Julian day.'''
+        return self.add_business_days(jd + 1, 0)
+
+    def previous_business_day(self, jd):
+        '''The last business day before a Julian day.'''
+        return self.add_business_days(jd, -1)
+
+    def business_days_between(self, jd1, jd2):
+        """
+        Count the business days from ``jd1`` up to, but not including, ``jd2``.
+        If ``jd2`` is before ``jd1``, the count is the negative of ``business_days_between(jd2, jd1)``.
+        """
+        jdn1, jdn2 = floor(jd1 + 0.5), floor(jd2 + 0.5)
+        if jdn2 < jdn1:
+            return -self.business_days_between(jd2, jd1)
+
+        year1, i1 = self._locate(jdn1)
+        year2, i2 = self._locate(jdn2)
+        count = sum(len(self._year(y)[3]) for y in range(year1, year2))
+        return count + self._year(year2)[2][i2] - self._year(year1)[2][i1]
+
+    def _span(self, start_year, end_year):
+        """
+        Business days in a range of Gregorian years (inclusive) as numpy arrays.
+
+        Returns:
+            tuple - julian day number of the first day, number of business days before each day,
+            and julian day number of each business day
+        """
+        numpy = require_numpy()
+        bitmap = numpy.concatenate(
+            [numpy.frombuffer(self._year(y)[1], dtype=numpy.uint8) for y in range(start_year, end_year + 1)]
+        )
+        start = self._year(start_year)[0]
+        counts = numpy.zeros(len(bitmap) + 1, dtype=numpy.int64)
+        numpy.cumsum(bitmap, dtype=numpy.int64, out=counts[1:])
+        return start, counts, numpy.flatnonzero(bitmap) + start
+
+    def busdaycalendar(self, start_year, end_year):
+        '''
+        Create a ``numpy.busdaycalendar`` with the same business days as this calendar
+        in a range of Gregorian years (inclusive). Requires numpy.
+        '''
+        numpy = require_numpy()
+        start, counts, _ = self._span(start_year, end_year)
+        jdn = numpy.arange(start, start + len(counts) - 1)
+        closed = (numpy.diff(counts) == 0) & ~numpy.isin(jdn % 7, list(self.weekend))
+        weekmask = [0 if weekday in self.weekend else 1 for weekday in range(7)]
+        days = (jdn[closed] - holidays.DATETIME64_EPOCH_JDN).astype('datetime64[D]')
+        return numpy.busdaycalendar(weekmask=weekmask, holidays=days)
+
+    def _jdn_years(self, jdn):
+        '''Range of Gregorian years of an array of julian day numbers'''
+        return gregorian.from_jdn(int(jdn.min()))[0], gregorian.from_jdn(int(jdn.max()))[0]
+
+    def is_business_day_array(self, jd):
+        '''Check if each Julian day in an array is a business day.'''
+        numpy = require_numpy()
+        jdn = numpy.floor(numpy.asarray(jd, dtype=numpy.float64) + 0.5).astype(numpy.int64)
+        start, counts, _ = self._span(*self._jdn_years(jdn))
+        i = jdn - start
+        return counts[i + 1] > counts[i]
+
+    def add_business_days_array(self, jd, days):
+        '''Vectorized :meth:`add_business_days`. ``jd`` and ``days`` are broadcast against each other.'''
+        numpy = require_numpy()
+        jdn = numpy.floor(numpy.asarray(jd, dtype=numpy.float64) + 0.5).astype(numpy.int64)
+        jdn, days = numpy.broadcast_arrays(jdn, numpy.asarray(days, dtype=numpy.int64))
+        if jdn.size == 0:
+            return numpy.empty(jdn.shape, dtype=numpy.float64)
+
+        start_year, end_year = self._jdn_years(jdn)
+        # Years on either side that the offsets might reach, widened until it's enough
+        margin = int(numpy.abs(days).max()) // 200 + 1
+
+        while True:
+            start, counts, workdays = self._span(start_year - margin, end_year + margin)
+            k = counts[jdn - start] + days
+            if k.min() >= 0 and k.max() < len(workdays):
+                return workdays[k] - 0.5
+            margin *= 2
+
+    def next_business_day_array(self, jd):
+        '''Vectorized :meth:`next_business_day`.'''
+        numpy = require_numpy()
+        return self.add_business_days_array(numpy.asarray(jd, dtype=numpy.float64) + 1, 0)
+
+    def business_days_between_array(self, jd1, jd2):
+        '''Vectorized :meth:`business_days_between`. ``jd1`` and ``jd2`` are broadcast against each other.'''
+        numpy = require_numpy()
+        jdn1 = numpy.floor(numpy.asarray(jd1, dtype=numpy.float64) + 0.5).astype(numpy.int64)
+        jdn2 = numpy.floor(numpy.asarray(jd2, dtype=numpy.float64) + 0.5).astype(numpy.int64)
+        jdn1, jdn2 = numpy.broadcast_arrays(jdn1, jdn2)
+        if jdn1.size == 0:
+            return numpy.zeros(jdn1.shape, dtype=numpy.int64)
+
+        start_year = min(self._jdn_years(jdn1)[0], self._jdn_years(jdn2)[0])
+        end_year = max(self._jdn_years(jdn1)[1], self._jdn_years(jdn2)[1])
+        start, counts, _ = self._span(start_year, end_year)
+        return counts[jdn2 - start] - counts[jdn1 - start]
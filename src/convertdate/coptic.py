@@ -15,10 +15,12 @@ It consists of twelve months of 30 days, followed by a "little month" of five da
 """
 from math import floor
 
-from . import gregorian
-from .utils import jwday, monthcalendarhelper
+from . import gregorian, utils
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 EPOCH = 1825029.5
+EPOCH_JDN = int(EPOCH + 0.5)
 MONTHS = [
     "Thout",
     "Paopi",
@@ -42,29 +44,84 @@ def is_leap(year):
     return year % 4 == 3 or year % 4 == -1
 
 
+def to_jdn(year, month, day):
+    "Retrieve the julian day number for this date"
+    return day + (month - 1) * 30 + (year - 1) * 365 + year // 4 + EPOCH_JDN - 1
+
+
 def to_jd(year, month, day):
     "Retrieve the Julian date equivalent for this date"
-    return day + (month - 1) * 30 + (year - 1) * 365 + floor(year / 4) + EPOCH - 1
+    return to_jdn(year, month, day) - 0.5
+
+
+def from_jdn(jdn):
+    "Create a new date from a julian day number."
+    cdc = jdn - EPOCH_JDN
+    year = (cdc - (cdc + 366) // 1461) // 365 + 1
+
+    yday = jdn - to_jdn(year, 1, 1)
+
+    month = yday // 30 + 1
+    day = yday - (month - 1) * 30 + 1
+    return year, month, day
 
 
 def from_jd(jdc):
     "Create a new date from a Julian date."
-    cdc = floor(jdc) + 0.5 - EPOCH
-    year = floor((cdc - floor((cdc + 366) / 1461)) / 365) + 1
+    return from_jdn(floor(jdc + 0.5))
 
-    yday = jdc - to_jd(year, 1, 1)
 
-    month = floor(yday / 30) + 1
-    day = yday - (month - 1) * 30 + 1
-    return int(year), int(month), int(day)
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Coptic dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    np = require_numpy()
+    years, months, days = (np.asarray(x, dtype=np.int64) for x in (years, months, days))
+    return days + (months - 1) * 30 + (years - 1) * 365 + years // 4 + EPOCH_JDN - 1
+
+
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Coptic dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def from_jdn_array(jdns):
+    '''Return Coptic dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    jdns = np.asarray(jdns, dtype=np.int64)
+    cdc = jdns - EPOCH_JDN
+    year = (cdc - (cdc + 366) // 1461) // 365 + 1
+    yday = jdns - to_jdn_array(year, 1, 1)
+    month = yday // 30 + 1
+    return year, month, yday - (month - 1) * 30 + 1
+
+
+def from_jd_array(jds):
+    '''Return Coptic dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64) + 0.5).astype(np.int64))
+
+
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Coptic dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
+
+
+def to_gregorian_array(years, months, days):
+    '''Convert arrays of Coptic dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days))
 
 
 def to_gregorian(year, month, day):
-    return gregorian.from_jd(to_jd(year, month, day))
+    return gregorian.from_jdn(to_jdn(year, month, day))
 
 
 def from_gregorian(year, month, day):
-    return from_jd(gregorian.to_jd(year, month, day))
+    return from_jdn(gregorian.to_jdn(year, month, day))
 
 
 def month_length(year, month):
@@ -90,3 +147,17 @@ def format(year, month, day):
     """Convert a Coptic date into a string with the format DD MONTH YYYY."""
     # pylint: disable=redefined-builtin
     return "{0:d} {1:} {2:d}".format(day, MONTHS[month - 1], year)
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Coptic dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(start_jd, end_jd, from_jd, month_length, lambda year: range(1, 14))
+
+
+class CopticDate(CalendarDate):
+    '''A date in the Coptic calendar'''
+
+    __slots__ = ()
+    calendar = 'coptic'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+
+# Julian day during which the March equinox, reckoned from the Tehran meridian,
+# occurred in each Gregorian year from FIRST_YEAR to LAST_YEAR.
+# Generated with convertdate.persian._equinox_jd_meeus, e.g.:
+#     [_equinox_jd_meeus(y) for y in range(FIRST_YEAR, LAST_YEAR + 1)]
+
+FIRST_YEAR = -1000
+
+LAST_YEAR = 3000
+
+# fmt: off
+EQUINOX_JD = (
+    1355897, 1356262, 1356627, 1356992, 1357358, 1357723, 1358088, 1358453,
+    1358818, 1359184, 1359549, 1359914, 1360279, 1360645, 1361010, 1361375,
+    1361740, 1362106, 1362471, 1362836, 1363201, 1363567, 1363932, 1364297,
+    1364662, 1365028, 1365393, 1365758, 1366123, 1366489, 1366854, 1367219,
+    1367584, 1367950, 1368315, 1368680, 1369045, 1369411, 1369776, 1370141,
+    1370506, 1370871, 1371237, 1371602, 1371967, 1372332, 1372698, 1373063,
+    1373428, 1373793, 1374159, 1374524, 1374889, 1375254, 1375620, 1375985,
+    1376350, 1376715, 1377081, 1377446, 1377811, 1378176, 1378542, 1378907,
+    1379272, 1379637, 1380003, 1380368, 1380733, 1381098, 1381464, 1381829,
+    1382194, 1382559, 1382924, 1383290, 1383655, 1384020, 1384385, 1384751,
+    1385116, 1385481, 1385846, 1386212, 1386577, 1386942, 1387307, 1387673,
+    1388038, 1388403, 1388768, 1389134, 1389499, 1389864, 1390229, 1390595,
+    1390960, 1391325, 1391690, 1392056, 1392421, 1392786, 1393151, 1393517,
+    1393882, 1394247, 1394612, 1394977, 1395343, 1395708, 1396073, 1396438,
+    1396804, 1397169, 1397534, 1397899, 1398265, 1398630, 1398995, 1399360,
+    1399726, 1400091, 1400456, 1400821, 1401187, 1401552, 1401917, 1402282,
+    1402648, 1403013, 1403378, 1403743, 1404109, 1404474, 1404839, 1405204,
+    1405570, 1405935, 1406300, 1406665, 1407030, 1407396, 1407761, 1408126,
+    1408491, 1408857, 1409222, 1409587, 1409952, 1410318, 1410683, 1411048,
+    1411413, 1411779, 1412144, 1412509, 1412874, 1413240, 1413605, 1413970,
+    1414335, 1414701, 1415066, 1415431, 1415796, 1416162, 1416527, 1416892,
+    1417257, 1417623, 1417988, 1418353, 1418718, 1419083, 1419449, 1419814,
+    1420179, 1420544, 1420910, 1421275, 1421640, 1422005, 1422371, 1422736,
+    1423101, 1423466, 1423832, 1424197, 1424562, 1424927, 1425293, 1425658,
+    1426023, 1426388, 1426754, 1427119, 1427484, 1427849, 1428215, 1428580,
+    1428945, 1429310, 1429675, 1430041, 1430406, 1430771, 1431136, 1431502,
+    1431867, 1432232, 1432597, 1432963, 1433328, 1433693, 1434058, 1434424,
+    1434789, 1435154, 1435519, 1435885, 1436250, 1436615, 1436980, 1437346,
+    1437711, 1438076, 1438441, 1438807, 1439172, 1439537, 1439902, 1440268,
+    1440633, 1440998, 1441363, 1441728, 1442094, 1442459, 1442824, 1443189,
+    1443555, 1443920, 1444285, 1444650, 1445016, 1445381, 1445746, 1446111,
+    1446477, 1446842, 1447207, 1447572, 1447938, 1448303, 1448668, 1449033,
+    1449399, 1449764, 1450129, 1450494, 1450860, 1451225, 1451590, 1451955,
+    1452321, 1452686, 1453051, 1453416, 1453781, 1454147, 1454512, 1454877,
+    1455242, 1455608, 1455973, 1456338, 1456703, 1457069, 1457434, 1457799,
+    1458164, 1458530, 1458895, 1459260, 1459625, 1459991, 1460356, 1460721,
+    1461086, 1461452, 1461817, 1462182, 1462547, 1462913, 1463278, 1463643,
+    1464008, 1464374, 1464739, 1465104, 1465469, 1465834, 1466200, 1466565,
+    1466930, 1467295, 1467661, 1468026, 1468391, 1468756, 1469122, 1469487,
+    1469852, 1470217, 1470583, 1470948, 1471313, 1471678, 1472044, 1472409,
+    1472774, 1473139, 1473505, 1473870, 1474235, 1474600, 1474966, 1475331,
+    1475696, 1476061, 1476426, 1476792, 1477157, 1477522, 1477887, 1478253,
+    1478618, 1478983, 1479348, 1479714, 1480079, 1480444, 1480809, 1481175,
+    1481540, 1481905, 1482270, 1482636, 1483001, 1483366, 1483731, 1484097,
+    1484462, 1484827, 1485192, 1485558, 1485923, 1486288, 1486653, 1487019,
+    1487384, 1487749, 1488114, 1488479, 1488845, 1489210, 1489575, 1489940,
+    1490306, 1490671, 1491036, 1491401, 1491767, 1492132, 1492497, 1492862,
+    1493228, 1493593, 1493958, 1494323, 1494689, 1495054, 1495419, 1495784,
+    1496150, 1496515, 1496880, 1497245, 1497611, 1497976, 1498341, 1498706,
+    1499072, 1499437, 1499802, 1500167, 1500532, 1500898, 1501263, 1501628,
+    1501993, 1502359, 1502724, 1503089, 1503454, 1503820, 1504185, 1504550,
+    1504915, 1505281, 1505646, 1506011, 1506376, 1506742, 1507107, 1507472,
+    1507837, 1508203, 1508568, 1508933, 1509298, 1509664, 1510029, 1510394,
+    1510759, 1511125, 1511490, 1511855, 1512220, 1512585, 1512951, 1513316,
+    1513681, 1514046, 1514412, 1514777, 1515142, 1515507, 1515873, 1516238,
+    1516603, 1516968, 1517334, 1517699, 1518064, 1518429, 1518795, 1519160,
+    1519525, 1519890, 1520256, 1520621, 1520986, 1521351, 1521717, 1522082,
+    1522447, 1522812, 1523177, 1523543, 1523908, 1524273, 1524638, 1525004,
+    1525369, 1525734, 1526099, 1526465, 1526830, 1527195, 1527560, 1527926,
+    1528291, 1528656, 1529021, 1529387, 1529752, 1530117, 1530482, 1530848,
+    1531213, 1531578, 1531943, 1532309, 1532674, 1533039, 1533404, 1533770,
+    1534135, 1534500, 1534865, 1535231, 1535596, 1535961, 1536326, 1536691,
+    1537057, 1537422, 1537787, 1538152, 1538518, 1538883, 1539248, 1539613,
+    1539979, 1540344, 1540709, 1541074, 1541440, 1541805, 1542170, 1542535,
+    1542901, 1543266, 1543631, 1543996, 1544362, 1544727, 1545092, 1545457,
+    1545823, 1546188, 1546553, 1546918, 1547284, 1547649, 1548014, 1548379,
+    1548744, 1549110, 1549475, 1549840, 1550205, 1550571, 1550936, 1551301,
+    1551666, 1552032, 1552397, 1552762, 1553127, 1553493, 1553858, 1554223,
+    1554588, 1554954, 1555319, 1555684, 1556049, 1556415, 1556780, 1557145,
+    1557510, 1557876, 1558241, 1558606, 1558971, 1559336, 1559702, 1560067,
+    1560432, 1560797, 1561163, 1561528, 1561893, 1562258, 1562624, 1562989,
+    1563354, 1563719, 1564085, 1564450, 1564815, 1565180, 1565546, 1565911,
+    1566276, 1566641, 1567007, 1567372, 1567737, 1568102, 1568468, 1568833,
+    1569198, 1569563, 1569929, 1570294, 1570659, 1571024, 1571389, 1571755,
+    1572120, 1572485, 1572850, 1573216, 1573581, 1573946, 1574311, 1574677,
+    1575042, 1575407, 1575772, 1576138, 1576503, 1576868, 1577233, 1577599,
+    1577964, 1578329, 1578694, 1579060, 1579425, 1579790, 1580155, 1580521,
+    1580886, 1581251, 1581616, 1581982, 1582347, 1582712, 1583077, 1583442,
+    1583808, 1584173, 1584538, 1584903, 1585269, 1585634, 1585999, 1586364,
+    1586730, 1587095, 1587460, 1587825, 1588191, 1588556, 1588921, 1589286,
+    1589652, 1590017, 1590382, 1590747, 1591113, 1591478, 1591843, 1592208,
+    1592574, 1592939, 1593304, 1593669, 1594035, 1594400, 1594765, 1595130,
+    1595495, 1595861, 1596226, 1596591, 1596956, 1597322, 1597687, 1598052,
+    1598417, 1598783, 1599148, 1599513, 1599878, 1600244, 1600609, 1600974,
+    1601339, 1601705, 1602070, 1602435, 1602800, 1603166, 1603531, 1603896,
+    1604261, 1604627, 1604992, 1605357, 1605722, 1606087, 1606453, 1606818,
+    1607183, 1607548, 1607914, 1608279, 1608644, 1609009, 1609375, 1609740,
+    1610105, 1610470, 1610836, 1611201, 1611566, 1611931, 1612297, 1612662,
+    1613027, 1613392, 1613758, 1614123, 1614488, 1614853, 1615219, 1615584,
+    1615949, 1616314, 1616680, 1617045, 1617410, 1617775, 1618140, 1618506,
+    1618871, 1619236, 1619601, 1619967, 1620332, 1620697, 1621062, 1621428,
+    1621793, 1622158, 1622523, 1622889, 1623254, 1623619, 1623984, 1624350,
+    1624715, 1625080, 1625445, 1625811, 1626176, 1626541, 1626906, 1627272,
+    1627637, 1628002, 1628367, 1628733, 1629098, 1629463, 1629828, 1630193,
+    1630559, 1630924, 1631289, 1631654, 1632020, 1632385, 1632750, 1633115,
+    1633481, 1633846, 1634211, 1634576, 1634942, 1635307, 1635672, 1636037,
+    1636403, 1636768, 1637133, 1637498, 1637864, 1638229, 1638594, 1638959,
+    1639325, 1639690, 1640055, 1640420, 1640786, 1641151, 1641516, 1641881,
+    1642246, 1642612, 1642977, 1643342, 1643707, 1644073, 1644438, 1644803,
+    1645168, 1645534, 1645899, 1646264, 1646629, 1646995, 1647360, 1647725,
+    1648090, 1648456, 1648821, 1649186, 1649551, 1649917, 1650282, 1650647,
+    1651012, 1651378, 1651743, 1652108, 1652473, 1652838, 1653204, 1653569,
+    1653934, 1654299, 1654665, 1655030, 1655395, 1655760, 1656126, 1656491,
+    1656856, 1657221, 1657587, 1657952, 1658317, 1658682, 1659048, 1659413,
+    1659778, 1660143, 1660509, 1660874, 1661239, 1661604, 1661970, 1662335,
+    1662700, 1663065, 1663431, 1663796, 1664161, 1664526, 1664892, 1665257,
+    1665622, 1665987, 1666352, 1666718, 1667083, 1667448, 1667813, 1668179,
+    1668544, 1668909, 1669274, 1669640, 1670005, 1670370, 1670735, 1671101,
+    1671466, 1671831, 1672196, 1672562, 1672927, 1673292, 1673657, 1674023,
+    1674388, 1674753, 1675118, 1675484, 1675849, 1676214, 1676579, 1676945,
+    1677310, 1677675, 1678040, 1678405, 1678771, 1679136, 1679501, 1679866,
+    1680232, 1680597, 1680962, 1681327, 1681693, 1682058, 1682423, 1682788,
+    1683154, 1683519, 1683884, 1684249, 1684615, 1684980, 1685345, 1685710,
+    1686076, 1686441, 1686806, 1687171, 1687537, 1687902, 1688267, 1688632,
+    1688997, 1689363, 1689728, 1690093, 1690458, 1690824, 1691189, 1691554,
+    1691919, 1692285, 1692650, 1693015, 1693380, 1693746, 1694111, 1694476,
+    1694841, 1695207, 1695572, 1695937, 1696302, 1696668, 1697033, 1697398,
+    1697763, 1698129, 1698494, 1698859, 1699224, 1699590, 1699955, 1700320,
+    1700685, 1701050, 1701416, 1701781, 1702146, 1702511, 1702877, 1703242,
+    1703607, 1703972, 1704338, 1704703, 1705068, 1705433, 1705799, 1706164,
+    1706529, 1706894, 1707260, 1707625, 1707990, 1708355, 1708721, 1709086,
+    1709451, 1709816, 1710182, 1710547, 1710912, 1711277, 1711643, 1712008,
+    1712373, 1712738, 1713103, 1713469, 1713834, 1714199, 1714564, 1714930,
+    1715295, 1715660, 1716025, 1716391, 1716756, 1717121, 1717486, 1717852,
+    1718217, 1718582, 1718947, 1719313, 1719678, 1720043, 1720408, 1720774,
+    1721139, 1721504, 1721869, 1722235, 1722600, 1722965, 1723330, 1723696,
+    1724061, 1724426, 1724791, 1725156, 1725522, 1725887, 1726252, 1726617,
+    1726983, 1727348, 1727713, 1728078, 1728444, 1728809, 1729174, 1729539,
+    1729905, 1730270, 1730635, 1731000, 1731366, 1731731, 1732096, 1732461,
+    1732827, 1733192, 1733557, 1733922, 1734288, 1734653, 1735018, 1735383,
+    1735748, 1736114, 1736479, 1736844, 1737209, 1737575, 1737940, 1738305,
+    1738670, 1739036, 1739401, 1739766, 1740131, 1740497, 1740862, 1741227,
+    1741592, 1741958, 1742323, 1742688, 1743053, 1743419, 1743784, 1744149,
+    1744514, 1744880, 1745245, 1745610, 1745975, 1746341, 1746706, 1747071,
+    1747436, 1747801, 1748167, 1748532, 1748897, 1749262, 1749628, 1749993,
+    1750358, 1750723, 1751089, 1751454, 1751819, 1752184, 1752550, 1752915,
+    1753280, 1753645, 1754011, 1754376, 1754741, 1755106, 1755472, 1755837,
+    1756202, 1756567, 1756933, 1757298, 1757663, 1758028, 1758394, 1758759,
+    1759124, 1759489, 1759854, 1760220, 1760585, 1760950, 1761315, 1761681,
+    1762046, 1762411, 1762776, 1763142, 1763507, 1763872, 1764237, 1764603,
+    1764968, 1765333, 1765698, 1766064, 1766429, 1766794, 1767159, 1767525,
+    1767890, 1768255, 1768620, 1768986, 1769351, 1769716, 1770081, 1770447,
+    1770812, 1771177, 1771542, 1771907, 1772273, 1772638, 1773003, 1773368,
+    1773734, 1774099, 1774464, 1774829, 1775195, 1775560, 1775925, 1776290,
+    1776656, 1777021, 1777386, 1777751, 1778117, 1778482, 1778847, 1779212,
+    1779578, 1779943, 1780308, 1780673, 1781039, 1781404, 1781769, 1782134,
+    1782500, 1782865, 1783230, 1783595, 1783960, 1784326, 1784691, 1785056,
+    1785421, 1785787, 1786152, 1786517, 1786882, 1787248, 1787613, 1787978,
+    1788343, 1788709, 1789074, 1789439, 1789804, 1790170, 1790535, 1790900,
+    1791265, 1791631, 1791996, 1792361, 1792726, 1793092, 1793457, 1793822,
+    1794187, 1794553, 1794918, 1795283, 1795648, 1796013, 1796379, 1796744,
+    1797109, 1797474, 1797840, 1798205, 1798570, 1798935, 1799301, 1799666,
+    1800031, 1800396, 1800762, 1801127, 1801492, 1801857, 1802223, 1802588,
+    1802953, 1803318, 1803684, 1804049, 1804414, 1804779, 1805145, 1805510,
+    1805875, 1806240, 1806606, 1806971, 1807336, 1807701, 1808066, 1808432,
+    1808797, 1809162, 1809527, 1809893, 1810258, 1810623, 1810988, 1811354,
+    1811719, 1812084, 1812449, 1812815, 1813180, 1813545, 1813910, 1814276,
+    1814641, 1815006, 1815371, 1815737, 1816102, 1816467, 1816832, 1817198,
+    1817563, 1817928, 1818293, 1818658, 1819024, 1819389, 1819754, 1820119,
+    1820485, 1820850, 1821215, 1821580, 1821946, 1822311, 1822676, 1823041,
+    1823407, 1823772, 1824137, 1824502, 1824868, 1825233, 1825598, 1825963,
+    1826329, 1826694, 1827059, 1827424, 1827790, 1828155, 1828520, 1828885,
+    1829251, 1829616, 1829981, 1830346, 1830711, 1831077, 1831442, 1831807,
+    1832172, 1832538, 1832903, 1833268, 1833633, 1833999, 1834364, 1834729,
+    1835094, 1835460, 1835825, 1836190, 1836555, 1836921, 1837286, 1837651,
+    1838016, 1838382, 1838747, 1839112, 1839477, 1839843, 1840208, 1840573,
+    1840938, 1841304, 1841669, 1842034, 1842399, 1842764, 1843130, 1843495,
+    1843860, 1844225, 1844591, 1844956, 1845321, 1845686, 1846052, 1846417,
+    1846782, 1847147, 1847513, 1847878, 1848243, 1848608, 1848974, 1849339,
+    1849704, 1850069, 1850435, 1850800, 1851165, 1851530, 1851896, 1852261,
+    1852626, 1852991, 1853357, 1853722, 1854087, 1854452, 1854817, 1855183,
+    1855548, 1855913, 1856278, 1856644, 1857009, 1857374, 1857739, 1858105,
+    1858470, 1858835, 1859200, 1859566, 1859931, 1860296, 1860661, 1861027,
+    1861392, 1861757, 1862122, 1862488, 1862853, 1863218, 1863583, 1863949,
+    1864314, 1864679, 1865044, 1865410, 1865775, 1866140, 1866505, 1866870,
+    1867236, 1867601, 1867966, 1868331, 1868697, 1869062, 1869427, 1869792,
+    1870158, 1870523, 1870888, 1871253, 1871619, 1871984, 1872349, 1872714,
+    1873080, 1873445, 1873810, 1874175, 1874541, 1874906, 1875271, 1875636,
+    1876002, 1876367, 1876732, 1877097, 1877463, 1877828, 1878193, 1878558,
+    1878923, 1879289, 1879654, 1880019, 1880384, 1880750, 1881115, 1881480,
+    1881845, 1882211, 1882576, 1882941, 1883306, 1883672, 1884037, 1884402,
+    1884767, 1885133, 1885498, 1885863, 1886228, 1886594, 1886959, 1887324,
+    1887689, 1888055, 1888420, 1888785, 1889150, 1889516, 1889881, 1890246,
+    1890611, 1890976, 1891342, 1891707, 1892072, 1892437, 1892803, 1893168,
+    1893533, 1893898, 1894264, 1894629, 1894994, 1895359, 1895725, 1896090,
+    1896455, 1896820, 1897186, 1897551, 1897916, 1898281, 1898647, 1899012,
+    1899377, 1899742, 1900108, 1900473, 1900838, 1901203, 1901569, 1901934,
+    1902299, 1902664, 1903029, 1903395, 1903760, 1904125, 1904490, 1904856,
+    1905221, 1905586, 1905951, 1906317, 1906682, 1907047, 1907412, 1907778,
+    1908143, 1908508, 1908873, 1909239, 1909604, 1909969, 1910334, 1910700,
+    1911065, 1911430, 1911795, 1912161, 1912526, 1912891, 1913256, 1913621,
+    1913987, 1914352, 1914717, 1915082, 1915448, 1915813, 1916178, 1916543,
+    1916909, 1917274, 1917639, 1918004, 1918370, 1918735, 1919100, 1919465,
+    1919831, 1920196, 1920561, 1920926, 1921292, 1921657, 1922022, 1922387,
+    1922753, 1923118, 1923483, 1923848, 1924214, 1924579, 1924944, 1925309,
+    1925674, 1926040, 1926405, 1926770, 1927135, 1927501, 1927866, 1928231,
+    1928596, 1928962, 1929327, 1929692, 1930057, 1930423, 1930788, 1931153,
+    1931518, 1931884, 1932249, 1932614, 1932979, 1933345, 1933710, 1934075,
+    1934440, 1934806, 1935171, 1935536, 1935901, 1936267, 1936632, 1936997,
+    1937362, 1937727, 1938093, 1938458, 1938823, 1939188, 1939554, 1939919,
+    1940284, 1940649, 1941015, 1941380, 1941745, 1942110, 1942476, 1942841,
+    1943206, 1943571, 1943937, 1944302, 1944667, 1945032, 1945398, 1945763,
+    1946128, 1946493, 1946859, 1947224, 1947589, 1947954, 1948320, 1948685,
+    1949050, 1949415, 1949780, 1950146, 1950511, 1950876, 1951241, 1951607,
+    1951972, 1952337, 1952702, 1953068, 1953433, 1953798, 1954163, 1954529,
+    1954894, 1955259, 1955624, 1955990, 1956355, 1956720, 1957085, 1957451,
+    1957816, 1958181, 1958546, 1958912, 1959277, 1959642, 1960007, 1960373,
+    1960738, 1961103, 1961468, 1961833, 1962199, 1962564, 1962929, 1963294,
+    1963660, 1964025, 1964390, 1964755, 1965121, 1965486, 1965851, 1966216,
+    1966582, 1966947, 1967312, 1967677, 1968043, 1968408, 1968773, 1969138,
+    1969504, 1969869, 1970234, 1970599, 1970965, 1971330, 1971695, 1972060,
+    1972426, 1972791, 1973156, 1973521, 1973886, 1974252, 1974617, 1974982,
+    1975347, 1975713, 1976078, 1976443, 1976808, 1977174, 1977539, 1977904,
+    1978269, 1978635, 1979000, 1979365, 1979730, 1980096, 1980461, 1980826,
+    1981191, 1981557, 1981922, 1982287, 1982652, 1983018, 1983383, 1983748,
+    1984113, 1984479, 1984844, 1985209, 1985574, 1985939, 1986305, 1986670,
+    1987035, 1987400, 1987766, 1988131, 1988496, 1988861, 1989227, 1989592,
+    1989957, 1990322, 1990688, 1991053, 1991418, 1991783, 1992149, 1992514,
+    1992879, 1993244, 1993610, 1993975, 1994340, 1994705, 1995071, 1995436,
+    1995801, 1996166, 1996532, 1996897, 1997262, 1997627, 1997992, 1998358,
+    1998723, 1999088, 1999453, 1999819, 2000184, 2000549, 2000914, 2001280,
+    2001645, 2002010, 2002375, 2002741, 2003106, 2003471, 2003836, 2004202,
+    2004567, 2004932, 2005297, 2005663, 2006028, 2006393, 2006758, 2007124,
+    2007489, 2007854, 2008219, 2008584, 2008950, 2009315, 2009680, 2010045,
+    2010411, 2010776, 2011141, 2011506, 2011872, 2012237, 2012602, 2012967,
+    2013333, 2013698, 2014063, 2014428, 2014794, 2015159, 2015524, 2015889,
+    2016255, 2016620, 2016985, 2017350, 2017716, 2018081, 2018446, 2018811,
+    2019177, 2019542, 2019907, 2020272, 2020637, 2021003, 2021368, 2021733,
+    2022098, 2022464, 2022829, 2023194, 2023559, 2023925, 2024290, 2024655,
+    2025020, 2025386, 2025751, 2026116, 2026481, 2026847, 2027212, 2027577,
+    2027942, 2028308, 2028673, 2029038, 2029403, 2029769, 2030134, 2030499,
+    2030864, 2031230, 2031595, 2031960, 2032325, 2032690, 2033056, 2033421,
+    2033786, 2034151, 2034517, 2034882, 2035247, 2035612, 2035978, 2036343,
+    2036708, 2037073, 2037439, 2037804, 2038169, 2038534, 2038900, 2039265,
+    2039630, 2039995, 2040361, 2040726, 2041091, 2041456, 2041822, 2042187,
+    2042552, 2042917, 2043283, 2043648, 2044013, 2044378, 2044743, 2045109,
+    2045474, 2045839, 2046204, 2046570, 2046935, 2047300, 2047665, 2048031,
+    2048396, 2048761, 2049126, 2049492, 2049857, 2050222, 2050587, 2050953,
+    2051318, 2051683, 2052048, 2052414, 2052779, 2053144, 2053509, 2053875,
+    2054240, 2054605, 2054970, 2055336, 2055701, 2056066, 2056431, 2056796,
+    2057162, 2057527, 2057892, 2058257, 2058623, 2058988, 2059353, 2059718,
+    2060084, 2060449, 2060814, 2061179, 2061545, 2061910, 2062275, 2062640,
+    2063006, 2063371, 2063736, 2064101, 2064467, 2064832, 2065197, 2065562,
+    2065928, 2066293, 2066658, 2067023, 2067389, 2067754, 2068119, 2068484,
+    2068849, 2069215, 2069580, 2069945, 2070310, 2070676, 2071041, 2071406,
+    2071771, 2072137, 2072502, 2072867, 2073232, 2073598, 2073963, 2074328,
+    2074693, 2075059, 2075424, 2075789, 2076154, 2076520, 2076885, 2077250,
+    2077615, 2077981, 2078346, 2078711, 2079076, 2079442, 2079807, 2080172,
+    2080537, 2080902, 2081268, 2081633, 2081998, 2082363, 2082729, 2083094,
+    2083459, 2083824, 2084190, 2084555, 2084920, 2085285, 2085651, 2086016,
+    2086381, 2086746, 2087112, 2087477, 2087842, 2088207, 2088573, 2088938,
+    2089303, 2089668, 2090034, 2090399, 2090764, 2091129, 2091495, 2091860,
+    2092225, 2092590, 2092955, 2093321, 2093686, 2094051, 2094416, 2094782,
+    2095147, 2095512, 2095877, 2096243, 2096608, 2096973, 2097338, 2097704,
+    2098069, 2098434, 2098799, 2099165, 2099530, 2099895, 2100260, 2100626,
+    2100991, 2101356, 2101721, 2102087, 2102452, 2102817, 2103182, 2103547,
+    2103913, 2104278, 2104643, 2105008, 2105374, 2105739, 2106104, 2106469,
+    2106835, 2107200, 2107565, 2107930, 2108296, 2108661, 2109026, 2109391,
+    2109757, 2110122, 2110487, 2110852, 2111218, 2111583, 2111948, 2112313,
+    2112679, 2113044, 2113409, 2113774, 2114140, 2114505, 2114870, 2115235,
+    2115600, 2115966, 2116331, 2116696, 2117061, 2117427, 2117792, 2118157,
+    2118522, 2118888, 2119253, 2119618, 2119983, 2120349, 2120714, 2121079,
+    2121444, 2121810, 2122175, 2122540, 2122905, 2123271, 2123636, 2124001,
+    2124366, 2124732, 2125097, 2125462, 2125827, 2126193, 2126558, 2126923,
+    2127288, 2127653, 2128019, 2128384, 2128749, 2129114, 2129480, 2129845,
+    2130210, 2130575, 2130941, 2131306, 2131671, 2132036, 2132402, 2132767,
+    2133132, 2133497, 2133863, 2134228, 2134593, 2134958, 2135324, 2135689,
+    2136054, 2136419, 2136785, 2137150, 2137515, 2137880, 2138246, 2138611,
+    2138976, 2139341, 2139706, 2140072, 2140437, 2140802, 2141167, 2141533,
+    2141898, 2142263, 2142628, 2142994, 2143359, 2143724, 2144089, 2144455,
+    2144820, 2145185, 2145550, 2145916, 2146281, 2146646, 2147011, 2147377,
+    2147742, 2148107, 2148472, 2148838, 2149203, 2149568, 2149933, 2150299,
+    2150664, 2151029, 2151394, 2151759, 2152125, 2152490, 2152855, 2153220,
+    2153586, 2153951, 2154316, 2154681, 2155047, 2155412, 2155777, 2156142,
+    2156508, 2156873, 2157238, 2157603, 2157969, 2158334, 2158699, 2159064,
+    2159430, 2159795, 2160160, 2160525, 2160891, 2161256, 2161621, 2161986,
+    2162352, 2162717, 2163082, 2163447, 2163812, 2164178, 2164543, 2164908,
+    2165273, 2165639, 2166004, 2166369, 2166734, 2167100, 2167465, 2167830,
+    2168195, 2168561, 2168926, 2169291, 2169656, 2170022, 2170387, 2170752,
+    2171117, 2171483, 2171848, 2172213, 2172578, 2172944, 2173309, 2173674,
+    2174039, 2174405, 2174770, 2175135, 2175500, 2175865, 2176231, 2176596,
+    2176961, 2177326, 2177692, 2178057, 2178422, 2178787, 2179153, 2179518,
+    2179883, 2180248, 2180614, 2180979, 2181344, 2181709, 2182075, 2182440,
+    2182805, 2183170, 2183536, 2183901, 2184266, 2184631, 2184997, 2185362,
+    2185727, 2186092, 2186458, 2186823, 2187188, 2187553, 2187918, 2188284,
+    2188649, 2189014, 2189379, 2189745, 2190110, 2190475, 2190840, 2191206,
+    2191571, 2191936, 2192301, 2192667, 2193032, 2193397, 2193762, 2194128,
+    2194493, 2194858, 2195223, 2195589, 2195954, 2196319, 2196684, 2197050,
+    2197415, 2197780, 2198145, 2198510, 2198876, 2199241, 2199606, 2199971,
+    2200337, 2200702, 2201067, 2201432, 2201798, 2202163, 2202528, 2202893,
+    2203259, 2203624, 2203989, 2204354, 2204720, 2205085, 2205450, 2205815,
+    2206181, 2206546, 2206911, 2207276, 2207642, 2208007, 2208372, 2208737,
+    2209103, 2209468, 2209833, 2210198, 2210563, 2210929, 2211294, 2211659,
+    2212024, 2212390, 2212755, 2213120, 2213485, 2213851, 2214216, 2214581,
+    2214946, 2215312, 2215677, 2216042, 2216407, 2216773, 2217138, 2217503,
+    2217868, 2218234, 2218599, 2218964, 2219329, 2219695, 2220060, 2220425,
+    2220790, 2221156, 2221521, 2221886, 2222251, 2222617, 2222982, 2223347,
+    2223712, 2224077, 2224443, 2224808, 2225173, 2225538, 2225904, 2226269,
+    2226634, 2226999, 2227365, 2227730, 2228095, 2228460, 2228826, 2229191,
+    2229556, 2229921, 2230287, 2230652, 2231017, 2231382, 2231748, 2232113,
+    2232478, 2232843, 2233209, 2233574, 2233939, 2234304, 2234670, 2235035,
+    2235400, 2235765, 2236130, 2236496, 2236861, 2237226, 2237591, 2237957,
+    2238322, 2238687, 2239052, 2239418, 2239783, 2240148, 2240513, 2240879,
+    2241244, 2241609, 2241974, 2242340, 2242705, 2243070, 2243435, 2243801,
+    2244166, 2244531, 2244896, 2245262, 2245627, 2245992, 2246357, 2246722,
+    2247088, 2247453, 2247818, 2248183, 2248549, 2248914, 2249279, 2249644,
+    2250010, 2250375, 2250740, 2251105, 2251471, 2251836, 2252201, 2252566,
+    2252932, 2253297, 2253662, 2254027, 2254393, 2254758, 2255123, 2255488,
+    2255854, 2256219, 2256584, 2256949, 2257315, 2257680, 2258045, 2258410,
+    2258775, 2259141, 2259506, 2259871, 2260236, 2260602, 2260967, 2261332,
+    2261697, 2262063, 2262428, 2262793, 2263158, 2263524, 2263889, 2264254,
+    2264619, 2264985, 2265350, 2265715, 2266080, 2266446, 2266811, 2267176,
+    2267541, 2267907, 2268272, 2268637, 2269002, 2269368, 2269733, 2270098,
+    2270463, 2270828, 2271194, 2271559, 2271924, 2272289, 2272655, 2273020,
+    2273385, 2273750, 2274116, 2274481, 2274846, 2275211, 2275577, 2275942,
+    2276307, 2276672, 2277038, 2277403, 2277768, 2278133, 2278499, 2278864,
+    2279229, 2279594, 2279960, 2280325, 2280690, 2281055, 2281421, 2281786,
+    2282151, 2282516, 2282881, 2283247, 2283612, 2283977, 2284342, 2284708,
+    2285073, 2285438, 2285803, 2286169, 2286534, 2286899, 2287264, 2287630,
+    2287995, 2288360, 2288725, 2289091, 2289456, 2289821, 2290186, 2290552,
+    2290917, 2291282, 2291647, 2292013, 2292378, 2292743, 2293108, 2293474,
+    2293839, 2294204, 2294569, 2294934, 2295300, 2295665, 2296030, 2296395,
+    2296761, 2297126, 2297491, 2297856, 2298222, 2298587, 2298952, 2299317,
+    2299683, 2300048, 2300413, 2300778, 2301144, 2301509, 2301874, 2302239,
+    2302605, 2302970, 2303335, 2303700, 2304066, 2304431, 2304796, 2305161,
+    2305527, 2305892, 2306257, 2306622, 2306987, 2307353, 2307718, 2308083,
+    2308448, 2308814, 2309179, 2309544, 2309909, 2310275, 2310640, 2311005,
+    2311370, 2311736, 2312101, 2312466, 2312831, 2313197, 2313562, 2313927,
+    2314292, 2314658, 2315023, 2315388, 2315753, 2316119, 2316484, 2316849,
+    2317214, 2317580, 2317945, 2318310, 2318675, 2319040, 2319406, 2319771,
+    2320136, 2320501, 2320867, 2321232, 2321597, 2321962, 2322328, 2322693,
+    2323058, 2323423, 2323789, 2324154, 2324519, 2324884, 2325250, 2325615,
+    2325980, 2326345, 2326711, 2327076, 2327441, 2327806, 2328172, 2328537,
+    2328902, 2329267, 2329633, 2329998, 2330363, 2330728, 2331093, 2331459,
+    2331824, 2332189, 2332554, 2332920, 2333285, 2333650, 2334015, 2334381,
+    2334746, 2335111, 2335476, 2335842, 2336207, 2336572, 2336937, 2337303,
+    2337668, 2338033, 2338398, 2338764, 2339129, 2339494, 2339859, 2340225,
+    2340590, 2340955, 2341320, 2341686, 2342051, 2342416, 2342781, 2343146,
+    2343512, 2343877, 2344242, 2344607, 2344973, 2345338, 2345703, 2346068,
+    2346434, 2346799, 2347164, 2347529, 2347895, 2348260, 2348625, 2348990,
+    2349356, 2349721, 2350086, 2350451, 2350817, 2351182, 2351547, 2351912,
+    2352278, 2352643, 2353008, 2353373, 2353738, 2354104, 2354469, 2354834,
+    2355199, 2355565, 2355930, 2356295, 2356660, 2357026, 2357391, 2357756,
+    2358121, 2358487, 2358852, 2359217, 2359582, 2359948, 2360313, 2360678,
+    2361043, 2361409, 2361774, 2362139, 2362504, 2362870, 2363235, 2363600,
+    2363965, 2364331, 2364696, 2365061, 2365426, 2365791, 2366157, 2366522,
+    2366887, 2367252, 2367618, 2367983, 2368348, 2368713, 2369079, 2369444,
+    2369809, 2370174, 2370540, 2370905, 2371270, 2371635, 2372001, 2372366,
+    2372731, 2373096, 2373462, 2373827, 2374192, 2374557, 2374923, 2375288,
+    2375653, 2376018, 2376384, 2376749, 2377114, 2377479, 2377845, 2378210,
+    2378575, 2378940, 2379305, 2379671, 2380036, 2380401, 2380766, 2381132,
+    2381497, 2381862, 2382227, 2382593, 2382958, 2383323, 2383688, 2384054,
+    2384419, 2384784, 2385149, 2385515, 2385880, 2386245, 2386610, 2386976,
+    2387341, 2387706, 2388071, 2388437, 2388802, 2389167, 2389532, 2389897,
+    2390263, 2390628, 2390993, 2391358, 2391724, 2392089, 2392454, 2392819,
+    2393185, 2393550, 2393915, 2394280, 2394646, 2395011, 2395376, 2395741,
+    2396107, 2396472, 2396837, 2397202, 2397568, 2397933, 2398298, 2398663,
+    2399029, 2399394, 2399759, 2400124, 2400490, 2400855, 2401220, 2401585,
+    2401951, 2402316, 2402681, 2403046, 2403411, 2403777, 2404142, 2404507,
+    2404872, 2405238, 2405603, 2405968, 2406334, 2406699, 2407064, 2407429,
+    2407795, 2408160, 2408525, 2408890, 2409255, 2409621, 2409986, 2410351,
+    2410717, 2411082, 2411447, 2411812, 2412178, 2412543, 2412908, 2413273,
+    2413638, 2414004, 2414369, 2414734, 2415099, 2415464, 2415830, 2416195,
+    2416560, 2416925, 2417291, 2417656, 2418021, 2418386, 2418752, 2419117,
+    2419482, 2419847, 2420213, 2420578, 2420943, 2421308, 2421674, 2422039,
+    2422404, 2422769, 2423135, 2423500, 2423865, 2424230, 2424596, 2424961,
+    2425326, 2425691, 2426056, 2426422, 2426787, 2427152, 2427517, 2427883,
+    2428248, 2428613, 2428978, 2429344, 2429709, 2430074, 2430439, 2430805,
+    2431170, 2431535, 2431900, 2432266, 2432631, 2432996, 2433361, 2433727,
+    2434092, 2434457, 2434822, 2435188, 2435553, 2435918, 2436283, 2436649,
+    2437014, 2437379, 2437744, 2438109, 2438475, 2438840, 2439205, 2439570,
+    2439936, 2440301, 2440666, 2441031, 2441397, 2441762, 2442127, 2442492,
+    2442858, 2443223, 2443588, 2443953, 2444319, 2444684, 2445049, 2445414,
+    2445780, 2446145, 2446510, 2446875, 2447241, 2447606, 2447971, 2448336,
+    2448702, 2449067, 2449432, 2449797, 2450162, 2450528, 2450893, 2451258,
+    2451623, 2451989, 2452354, 2452719, 2453084, 2453450, 2453815, 2454180,
+    2454545, 2454911, 2455276, 2455641, 2456006, 2456372, 2456737, 2457102,
+    2457467, 2457833, 2458198, 2458563, 2458928, 2459294, 2459659, 2460024,
+    2460389, 2460755, 2461120, 2461485, 2461850, 2462215, 2462581, 2462946,
+    2463311, 2463676, 2464042, 2464407, 2464772, 2465137, 2465503, 2465868,
+    2466233, 2466598, 2466964, 2467329, 2467694, 2468059, 2468425, 2468790,
+    2469155, 2469520, 2469886, 2470251, 2470616, 2470981, 2471347, 2471712,
+    2472077, 2472442, 2472808, 2473173, 2473538, 2473903, 2474268, 2474634,
+    2474999, 2475364, 2475729, 2476095, 2476460, 2476825, 2477190, 2477556,
+    2477921, 2478286, 2478651, 2479017, 2479382, 2479747, 2480112, 2480478,
+    2480843, 2481208, 2481573, 2481939, 2482304, 2482669, 2483034, 2483400,
+    2483765, 2484130, 2484495, 2484861, 2485226, 2485591, 2485956, 2486321,
+    2486687, 2487052, 2487417, 2487782, 2488148, 2488513, 2488878, 2489243,
+    2489609, 2489974, 2490339, 2490704, 2491070, 2491435, 2491800, 2492165,
+    2492531, 2492896, 2493261, 2493626, 2493992, 2494357, 2494722, 2495087,
+    2495453, 2495818, 2496183, 2496548, 2496913, 2497279, 2497644, 2498009,
+    2498374, 2498740, 2499105, 2499470, 2499835, 2500201, 2500566, 2500931,
+    2501296, 2501662, 2502027, 2502392, 2502757, 2503123, 2503488, 2503853,
+    2504218, 2504584, 2504949, 2505314, 2505679, 2506045, 2506410, 2506775,
+    2507140, 2507506, 2507871, 2508236, 2508601, 2508967, 2509332, 2509697,
+    2510062, 2510427, 2510793, 2511158, 2511523, 2511888, 2512254, 2512619,
+    2512984, 2513349, 2513715, 2514080, 2514445, 2514810, 2515176, 2515541,
+    2515906, 2516271, 2516637, 2517002, 2517367, 2517732, 2518098, 2518463,
+    2518828, 2519193, 2519559, 2519924, 2520289, 2520654, 2521020, 2521385,
+    2521750, 2522115, 2522480, 2522846, 2523211, 2523576, 2523941, 2524307,
+    2524672, 2525037, 2525402, 2525768, 2526133, 2526498, 2526863, 2527229,
+    2527594, 2527959, 2528324, 2528690, 2529055, 2529420, 2529785, 2530151,
+    2530516, 2530881, 2531246, 2531612, 2531977, 2532342, 2532707, 2533072,
+    2533438, 2533803, 2534168, 2534533, 2534899, 2535264, 2535629, 2535994,
+    2536360, 2536725, 2537090, 2537455, 2537821, 2538186, 2538551, 2538916,
+    2539282, 2539647, 2540012, 2540377, 2540743, 2541108, 2541473, 2541838,
+    2542204, 2542569, 2542934, 2543299, 2543665, 2544030, 2544395, 2544760,
+    2545125, 2545491, 2545856, 2546221, 2546586, 2546952, 2547317, 2547682,
+    2548047, 2548413, 2548778, 2549143, 2549508, 2549874, 2550239, 2550604,
+    2550969, 2551335, 2551700, 2552065, 2552430, 2552796, 2553161, 2553526,
+    2553891, 2554257, 2554622, 2554987, 2555352, 2555718, 2556083, 2556448,
+    2556813, 2557178, 2557544, 2557909, 2558274, 2558639, 2559005, 2559370,
+    2559735, 2560100, 2560466, 2560831, 2561196, 2561561, 2561927, 2562292,
+    2562657, 2563022, 2563388, 2563753, 2564118, 2564483, 2564849, 2565214,
+    2565579, 2565944, 2566310, 2566675, 2567040, 2567405, 2567771, 2568136,
+    2568501, 2568866, 2569231, 2569597, 2569962, 2570327, 2570692, 2571058,
+    2571423, 2571788, 2572153, 2572519, 2572884, 2573249, 2573614, 2573980,
+    2574345, 2574710, 2575075, 2575441, 2575806, 2576171, 2576536, 2576902,
+    2577267, 2577632, 2577997, 2578363, 2578728, 2579093, 2579458, 2579824,
+    2580189, 2580554, 2580919, 2581284, 2581650, 2582015, 2582380, 2582745,
+    2583111, 2583476, 2583841, 2584206, 2584572, 2584937, 2585302, 2585667,
+    2586033, 2586398, 2586763, 2587128, 2587494, 2587859, 2588224, 2588589,
+    2588955, 2589320, 2589685, 2590050, 2590416, 2590781, 2591146, 2591511,
+    2591877, 2592242, 2592607, 2592972, 2593337, 2593703, 2594068, 2594433,
+    2594798, 2595164, 2595529, 2595894, 2596259, 2596625, 2596990, 2597355,
+    2597720, 2598086, 2598451, 2598816, 2599181, 2599547, 2599912, 2600277,
+    2600642, 2601008, 2601373, 2601738, 2602103, 2602469, 2602834, 2603199,
+    2603564, 2603930, 2604295, 2604660, 2605025, 2605390, 2605756, 2606121,
+    2606486, 2606851, 2607217, 2607582, 2607947, 2608312, 2608678, 2609043,
+    2609408, 2609773, 2610139, 2610504, 2610869, 2611234, 2611600, 2611965,
+    2612330, 2612695, 2613061, 2613426, 2613791, 2614156, 2614522, 2614887,
+    2615252, 2615617, 2615983, 2616348, 2616713, 2617078, 2617443, 2617809,
+    2618174, 2618539, 2618904, 2619270, 2619635, 2620000, 2620365, 2620731,
+    2621096, 2621461, 2621826, 2622192, 2622557, 2622922, 2623287, 2623653,
+    2624018, 2624383, 2624748, 2625114, 2625479, 2625844, 2626209, 2626575,
+    2626940, 2627305, 2627670, 2628036, 2628401, 2628766, 2629131, 2629496,
+    2629862, 2630227, 2630592, 2630957, 2631323, 2631688, 2632053, 2632418,
+    2632784, 2633149, 2633514, 2633879, 2634245, 2634610, 2634975, 2635340,
+    2635706, 2636071, 2636436, 2636801, 2637167, 2637532, 2637897, 2638262,
+    2638628, 2638993, 2639358, 2639723, 2640089, 2640454, 2640819, 2641184,
+    2641549, 2641915, 2642280, 2642645, 2643010, 2643376, 2643741, 2644106,
+    2644471, 2644837, 2645202, 2645567, 2645932, 2646298, 2646663, 2647028,
+    2647393, 2647759, 2648124, 2648489, 2648854, 2649220, 2649585, 2649950,
+    2650315, 2650681, 2651046, 2651411, 2651776, 2652142, 2652507, 2652872,
+    2653237, 2653602, 2653968, 2654333, 2654698, 2655063, 2655429, 2655794,
+    2656159, 2656524, 2656890, 2657255, 2657620, 2657985, 2658351, 2658716,
+    2659081, 2659446, 2659812, 2660177, 2660542, 2660907, 2661273, 2661638,
+    2662003, 2662368, 2662734, 2663099, 2663464, 2663829, 2664195, 2664560,
+    2664925, 2665290, 2665655, 2666021, 2666386, 2666751, 2667116, 2667482,
+    2667847, 2668212, 2668577, 2668943, 2669308, 2669673, 2670038, 2670404,
+    2670769, 2671134, 2671499, 2671865, 2672230, 2672595, 2672960, 2673326,
+    2673691, 2674056, 2674421, 2674787, 2675152, 2675517, 2675882, 2676248,
+    2676613, 2676978, 2677343, 2677708, 2678074, 2678439, 2678804, 2679169,
+    2679535, 2679900, 2680265, 2680630, 2680996, 2681361, 2681726, 2682091,
+    2682457, 2682822, 2683187, 2683552, 2683918, 2684283, 2684648, 2685013,
+    2685379, 2685744, 2686109, 2686474, 2686840, 2687205, 2687570, 2687935,
+    2688301, 2688666, 2689031, 2689396, 2689761, 2690127, 2690492, 2690857,
+    2691222, 2691588, 2691953, 2692318, 2692683, 2693049, 2693414, 2693779,
+    2694144, 2694510, 2694875, 2695240, 2695605, 2695971, 2696336, 2696701,
+    2697066, 2697432, 2697797, 2698162, 2698527, 2698893, 2699258, 2699623,
+    2699988, 2700353, 2700719, 2701084, 2701449, 2701814, 2702180, 2702545,
+    2702910, 2703275, 2703641, 2704006, 2704371, 2704736, 2705102, 2705467,
+    2705832, 2706197, 2706563, 2706928, 2707293, 2707658, 2708024, 2708389,
+    2708754, 2709119, 2709485, 2709850, 2710215, 2710580, 2710946, 2711311,
+    2711676, 2712041, 2712407, 2712772, 2713137, 2713502, 2713867, 2714233,
+    2714598, 2714963, 2715328, 2715694, 2716059, 2716424, 2716789, 2717155,
+    2717520, 2717885, 2718250, 2718616, 2718981, 2719346, 2719711, 2720077,
+    2720442, 2720807, 2721172, 2721538, 2721903, 2722268, 2722633, 2722999,
+    2723364, 2723729, 2724094, 2724460, 2724825, 2725190, 2725555, 2725920,
+    2726286, 2726651, 2727016, 2727381, 2727747, 2728112, 2728477, 2728842,
+    2729208, 2729573, 2729938, 2730303, 2730669, 2731034, 2731399, 2731764,
+    2732130, 2732495, 2732860, 2733225, 2733591, 2733956, 2734321, 2734686,
+    2735052, 2735417, 2735782, 2736147, 2736512, 2736878, 2737243, 2737608,
+    2737973, 2738339, 2738704, 2739069, 2739434, 2739800, 2740165, 2740530,
+    2740895, 2741261, 2741626, 2741991, 2742356, 2742722, 2743087, 2743452,
+    2743817, 2744183, 2744548, 2744913, 2745278, 2745644, 2746009, 2746374,
+    2746739, 2747105, 2747470, 2747835, 2748200, 2748565, 2748931, 2749296,
+    2749661, 2750026, 2750392, 2750757, 2751122, 2751487, 2751853, 2752218,
+    2752583, 2752948, 2753314, 2753679, 2754044, 2754409, 2754775, 2755140,
+    2755505, 2755870, 2756236, 2756601, 2756966, 2757331, 2757697, 2758062,
+    2758427, 2758792, 2759158, 2759523, 2759888, 2760253, 2760618, 2760984,
+    2761349, 2761714, 2762079, 2762445, 2762810, 2763175, 2763540, 2763906,
+    2764271, 2764636, 2765001, 2765367, 2765732, 2766097, 2766462, 2766828,
+    2767193, 2767558, 2767923, 2768289, 2768654, 2769019, 2769384, 2769750,
+    2770115, 2770480, 2770845, 2771211, 2771576, 2771941, 2772306, 2772671,
+    2773037, 2773402, 2773767, 2774132, 2774498, 2774863, 2775228, 2775593,
+    2775959, 2776324, 2776689, 2777054, 2777420, 2777785, 2778150, 2778515,
+    2778881, 2779246, 2779611, 2779976, 2780342, 2780707, 2781072, 2781437,
+    2781803, 2782168, 2782533, 2782898, 2783264, 2783629, 2783994, 2784359,
+    2784724, 2785090, 2785455, 2785820, 2786185, 2786551, 2786916, 2787281,
+    2787646, 2788012, 2788377, 2788742, 2789107, 2789473, 2789838, 2790203,
+    2790568, 2790934, 2791299, 2791664, 2792029, 2792395, 2792760, 2793125,
+    2793490, 2793856, 2794221, 2794586, 2794951, 2795317, 2795682, 2796047,
+    2796412, 2796777, 2797143, 2797508, 2797873, 2798238, 2798604, 2798969,
+    2799334, 2799699, 2800065, 2800430, 2800795, 2801160, 2801526, 2801891,
+    2802256, 2802621, 2802987, 2803352, 2803717, 2804082, 2804448, 2804813,
+    2805178, 2805543, 2805909, 2806274, 2806639, 2807004, 2807370, 2807735,
+    2808100, 2808465, 2808830, 2809196, 2809561, 2809926, 2810291, 2810657,
+    2811022, 2811387, 2811752, 2812118, 2812483, 2812848, 2813213, 2813579,
+    2813944, 2814309, 2814674, 2815040, 2815405, 2815770, 2816135, 2816501,
+    2816866,
+)
+# fmt: on
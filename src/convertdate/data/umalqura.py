@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+
+# Julian day number of the first day of each month of the Umm al-Qura calendar,
+# from 1 Muharram FIRST_YEAR to 1 Muharram LAST_YEAR + 1.
+# Converted from the table of month starts in hijridate, by Mohammed Alshehri,
+# https://github.com/dralshehri/hijridate, released under the MIT license.
+
+FIRST_YEAR = 1343
+
+LAST_YEAR = 1500
+
+# fmt: off
+MONTH_STARTS = (
+    2423999, 2424029, 2424058, 2424088, 2424118, 2424147, 2424177, 2424207, 2424237, 2424265,
+    2424295, 2424325, 2424355, 2424384, 2424413, 2424443, 2424472, 2424502, 2424531, 2424561,
+    2424590, 2424620, 2424649, 2424679, 2424708, 2424738, 2424767, 2424797, 2424826, 2424857,
+    2424886, 2424916, 2424944, 2424974, 2425004, 2425033, 2425063, 2425092, 2425121, 2425151,
+    2425181, 2425210, 2425240, 2425270, 2425299, 2425328, 2425358, 2425388, 2425417, 2425446,
+    2425475, 2425505, 2425535, 2425564, 2425594, 2425624, 2425653, 2425683, 2425713, 2425742,
+    2425771, 2425801, 2425830, 2425860, 2425889, 2425919, 2425948, 2425978, 2426008, 2426037,
+    2426066, 2426097, 2426125, 2426155, 2426184, 2426214, 2426243, 2426273, 2426302, 2426332,
+    2426362, 2426392, 2426420, 2426451, 2426481, 2426510, 2426540, 2426569, 2426599, 2426628,
+    2426657, 2426687, 2426716, 2426746, 2426776, 2426805, 2426835, 2426865, 2426894, 2426924,
+    2426953, 2426983, 2427012, 2427041, 2427070, 2427100, 2427130, 2427159, 2427189, 2427219,
+    2427248, 2427278, 2427307, 2427337, 2427366, 2427396, 2427425, 2427455, 2427484, 2427514,
+    2427543, 2427573, 2427602, 2427632, 2427662, 2427691, 2427721, 2427750, 2427780, 2427810,
+    2427839, 2427868, 2427898, 2427927, 2427957, 2427986, 2428016, 2428045, 2428075, 2428105,
+    2428134, 2428164, 2428193, 2428223, 2428252, 2428282, 2428311, 2428341, 2428370, 2428400,
+    2428429, 2428459, 2428488, 2428518, 2428548, 2428577, 2428607, 2428636, 2428665, 2428695,
+    2428724, 2428754, 2428783, 2428813, 2428843, 2428872, 2428901, 2428931, 2428960, 2428990,
+    2429019, 2429049, 2429078, 2429108, 2429137, 2429167, 2429196, 2429226, 2429255, 2429285,
+    2429315, 2429345, 2429375, 2429404, 2429434, 2429463, 2429492, 2429522, 2429551, 2429580,
+    2429610, 2429640, 2429669, 2429699, 2429729, 2429759, 2429788, 2429818, 2429847, 2429876,
+    2429906, 2429935, 2429964, 2429994, 2430023, 2430053, 2430082, 2430112, 2430141, 2430171,
+    2430200, 2430230, 2430259, 2430289, 2430318, 2430348, 2430378, 2430408, 2430437, 2430467,
+    2430496, 2430526, 2430555, 2430585, 2430614, 2430644, 2430673, 2430703, 2430732, 2430762,
+    2430791, 2430821, 2430850, 2430880, 2430909, 2430939, 2430968, 2430998, 2431027, 2431057,
+    2431086, 2431116, 2431145, 2431175, 2431204, 2431234, 2431263, 2431293, 2431322, 2431352,
+    2431381, 2431411, 2431441, 2431471, 2431500, 2431530, 2431559, 2431589, 2431618, 2431648,
+    2431676, 2431706, 2431736, 2431766, 2431795, 2431825, 2431854, 2431884, 2431913, 2431943,
+    2431972, 2432002, 2432031, 2432061, 2432090, 2432120, 2432150, 2432180, 2432209, 2432239,
+    2432268, 2432298, 2432327, 2432357, 2432386, 2432416, 2432445, 2432475, 2432504, 2432534,
+    2432563, 2432593, 2432622, 2432652, 2432681, 2432711, 2432740, 2432770, 2432799, 2432829,
+    2432858, 2432888, 2432917, 2432947, 2432976, 2433006, 2433035, 2433065, 2433094, 2433124,
+    2433153, 2433183, 2433213, 2433243, 2433272, 2433302, 2433331, 2433361, 2433390, 2433420,
+    2433450, 2433479, 2433509, 2433539, 2433568, 2433598, 2433627, 2433657, 2433686, 2433716,
+    2433745, 2433775, 2433804, 2433834, 2433863, 2433893, 2433922, 2433952, 2433981, 2434011,
+    2434040, 2434069, 2434099, 2434128, 2434158, 2434187, 2434217, 2434247, 2434277, 2434306,
+    2434336, 2434365, 2434395, 2434424, 2434454, 2434483, 2434512, 2434542, 2434571, 2434601,
+    2434631, 2434660, 2434690, 2434719, 2434749, 2434778, 2434808, 2434837, 2434867, 2434896,
+    2434926, 2434955, 2434985, 2435015, 2435044, 2435074, 2435103, 2435133, 2435162, 2435192,
+    2435222, 2435251, 2435280, 2435310, 2435340, 2435370, 2435399, 2435429, 2435458, 2435488,
+    2435517, 2435547, 2435576, 2435605, 2435635, 2435665, 2435694, 2435723, 2435753, 2435782,
+    2435811, 2435841, 2435871, 2435901, 2435930, 2435960, 2435989, 2436019, 2436048, 2436078,
+    2436107, 2436136, 2436166, 2436195, 2436225, 2436254, 2436284, 2436314, 2436343, 2436373,
+    2436403, 2436433, 2436462, 2436492, 2436521, 2436551, 2436580, 2436610, 2436639, 2436669,
+    2436698, 2436728, 2436757, 2436786, 2436816, 2436845, 2436875, 2436904, 2436934, 2436963,
+    2436993, 2437022, 2437052, 2437081, 2437111, 2437141, 2437170, 2437200, 2437229, 2437259,
+    2437288, 2437318, 2437347, 2437377, 2437406, 2437436, 2437465, 2437495, 2437524, 2437554,
+    2437584, 2437613, 2437643, 2437672, 2437701, 2437731, 2437760, 2437790, 2437819, 2437849,
+    2437878, 2437908, 2437938, 2437967, 2437997, 2438027, 2438056, 2438085, 2438115, 2438144,
+    2438174, 2438203, 2438233, 2438262, 2438292, 2438322, 2438351, 2438381, 2438410, 2438440,
+    2438469, 2438499, 2438528, 2438558, 2438587, 2438617, 2438646, 2438676, 2438705, 2438735,
+    2438764, 2438794, 2438823, 2438853, 2438882, 2438912, 2438941, 2438971, 2439001, 2439030,
+    2439059, 2439089, 2439118, 2439148, 2439178, 2439208, 2439237, 2439267, 2439297, 2439326,
+    2439355, 2439385, 2439414, 2439444, 2439473, 2439503, 2439532, 2439562, 2439592, 2439621,
+    2439650, 2439680, 2439709, 2439739, 2439768, 2439798, 2439827, 2439857, 2439886, 2439916,
+    2439946, 2439975, 2440005, 2440035, 2440064, 2440094, 2440123, 2440153, 2440182, 2440212,
+    2440241, 2440271, 2440300, 2440330, 2440359, 2440389, 2440418, 2440448, 2440477, 2440507,
+    2440536, 2440566, 2440595, 2440625, 2440655, 2440685, 2440714, 2440744, 2440773, 2440803,
+    2440832, 2440862, 2440892, 2440921, 2440951, 2440980, 2441009, 2441039, 2441068, 2441098,
+    2441127, 2441157, 2441186, 2441216, 2441245, 2441275, 2441304, 2441334, 2441364, 2441393,
+    2441422, 2441452, 2441481, 2441511, 2441540, 2441570, 2441599, 2441629, 2441658, 2441688,
+    2441718, 2441748, 2441777, 2441807, 2441836, 2441865, 2441894, 2441924, 2441953, 2441983,
+    2442012, 2442042, 2442072, 2442102, 2442131, 2442161, 2442190, 2442220, 2442249, 2442279,
+    2442308, 2442337, 2442367, 2442397, 2442426, 2442456, 2442485, 2442515, 2442545, 2442574,
+    2442604, 2442633, 2442662, 2442692, 2442721, 2442751, 2442780, 2442810, 2442839, 2442869,
+    2442899, 2442929, 2442958, 2442988, 2443017, 2443046, 2443076, 2443105, 2443135, 2443164,
+    2443194, 2443223, 2443253, 2443283, 2443312, 2443342, 2443371, 2443401, 2443430, 2443460,
+    2443489, 2443519, 2443548, 2443578, 2443607, 2443637, 2443666, 2443696, 2443726, 2443755,
+    2443785, 2443814, 2443844, 2443873, 2443903, 2443932, 2443962, 2443991, 2444021, 2444050,
+    2444080, 2444109, 2444139, 2444169, 2444198, 2444228, 2444258, 2444287, 2444317, 2444346,
+    2444375, 2444405, 2444434, 2444464, 2444493, 2444523, 2444553, 2444582, 2444612, 2444641,
+    2444671, 2444700, 2444730, 2444759, 2444788, 2444818, 2444847, 2444877, 2444906, 2444936,
+    2444966, 2444996, 2445025, 2445055, 2445084, 2445114, 2445143, 2445172, 2445202, 2445231,
+    2445261, 2445290, 2445320, 2445350, 2445380, 2445409, 2445439, 2445468, 2445498, 2445527,
+    2445556, 2445586, 2445615, 2445644, 2445674, 2445704, 2445733, 2445763, 2445793, 2445823,
+    2445852, 2445882, 2445911, 2445940, 2445970, 2445999, 2446028, 2446058, 2446088, 2446117,
+    2446147, 2446177, 2446206, 2446236, 2446265, 2446295, 2446324, 2446354, 2446383, 2446413,
+    2446442, 2446472, 2446501, 2446531, 2446560, 2446590, 2446620, 2446649, 2446679, 2446708,
+    2446738, 2446767, 2446797, 2446826, 2446856, 2446885, 2446915, 2446944, 2446974, 2447003,
+    2447033, 2447063, 2447092, 2447122, 2447151, 2447181, 2447210, 2447240, 2447269, 2447298,
+    2447328, 2447357, 2447387, 2447417, 2447446, 2447476, 2447506, 2447535, 2447565, 2447594,
+    2447624, 2447653, 2447682, 2447712, 2447741, 2447771, 2447800, 2447830, 2447860, 2447890,
+    2447919, 2447949, 2447978, 2448008, 2448037, 2448066, 2448096, 2448125, 2448155, 2448184,
+    2448214, 2448244, 2448273, 2448303, 2448333, 2448362, 2448392, 2448421, 2448450, 2448480,
+    2448509, 2448538, 2448568, 2448598, 2448627, 2448657, 2448687, 2448717, 2448746, 2448776,
+    2448805, 2448834, 2448864, 2448893, 2448922, 2448952, 2448982, 2449011, 2449041, 2449071,
+    2449100, 2449130, 2449160, 2449189, 2449218, 2449248, 2449277, 2449306, 2449336, 2449365,
+    2449395, 2449425, 2449455, 2449484, 2449514, 2449543, 2449573, 2449602, 2449632, 2449661,
+    2449690, 2449720, 2449749, 2449779, 2449809, 2449838, 2449868, 2449898, 2449927, 2449957,
+    2449986, 2450016, 2450045, 2450075, 2450104, 2450133, 2450163, 2450192, 2450222, 2450252,
+    2450281, 2450311, 2450340, 2450370, 2450400, 2450429, 2450459, 2450488, 2450518, 2450547,
+    2450576, 2450606, 2450635, 2450665, 2450694, 2450724, 2450754, 2450784, 2450813, 2450843,
+    2450872, 2450902, 2450931, 2450960, 2450990, 2451019, 2451049, 2451078, 2451108, 2451138,
+    2451167, 2451197, 2451227, 2451256, 2451286, 2451315, 2451345, 2451374, 2451403, 2451433,
+    2451462, 2451492, 2451522, 2451552, 2451582, 2451611, 2451641, 2451670, 2451699, 2451729,
+    2451758, 2451787, 2451816, 2451846, 2451876, 2451906, 2451936, 2451965, 2451995, 2452025,
+    2452054, 2452083, 2452113, 2452142, 2452171, 2452200, 2452230, 2452260, 2452290, 2452319,
+    2452349, 2452379, 2452408, 2452438, 2452467, 2452497, 2452526, 2452555, 2452585, 2452614,
+    2452644, 2452673, 2452703, 2452733, 2452762, 2452792, 2452822, 2452851, 2452881, 2452910,
+    2452939, 2452969, 2452998, 2453028, 2453057, 2453087, 2453116, 2453146, 2453176, 2453205,
+    2453235, 2453264, 2453294, 2453324, 2453353, 2453383, 2453412, 2453441, 2453471, 2453500,
+    2453530, 2453559, 2453589, 2453619, 2453648, 2453678, 2453708, 2453737, 2453767, 2453796,
+    2453825, 2453855, 2453884, 2453914, 2453943, 2453973, 2454003, 2454032, 2454062, 2454092,
+    2454121, 2454151, 2454180, 2454209, 2454239, 2454268, 2454297, 2454327, 2454357, 2454387,
+    2454416, 2454446, 2454476, 2454505, 2454535, 2454564, 2454593, 2454623, 2454652, 2454681,
+    2454711, 2454741, 2454770, 2454800, 2454830, 2454859, 2454889, 2454919, 2454948, 2454977,
+    2455007, 2455036, 2455066, 2455095, 2455125, 2455154, 2455184, 2455213, 2455243, 2455273,
+    2455302, 2455332, 2455361, 2455391, 2455420, 2455450, 2455479, 2455508, 2455538, 2455567,
+    2455597, 2455627, 2455657, 2455686, 2455716, 2455745, 2455775, 2455804, 2455834, 2455863,
+    2455892, 2455922, 2455951, 2455981, 2456011, 2456040, 2456070, 2456100, 2456129, 2456159,
+    2456188, 2456218, 2456247, 2456276, 2456306, 2456335, 2456365, 2456394, 2456424, 2456454,
+    2456483, 2456513, 2456543, 2456572, 2456601, 2456631, 2456660, 2456690, 2456719, 2456749,
+    2456778, 2456808, 2456837, 2456867, 2456897, 2456926, 2456956, 2456985, 2457015, 2457044,
+    2457074, 2457103, 2457133, 2457162, 2457192, 2457221, 2457251, 2457280, 2457310, 2457340,
+    2457369, 2457399, 2457429, 2457458, 2457487, 2457517, 2457546, 2457576, 2457605, 2457634,
+    2457664, 2457694, 2457723, 2457753, 2457783, 2457813, 2457842, 2457871, 2457901, 2457930,
+    2457959, 2457989, 2458018, 2458048, 2458077, 2458107, 2458137, 2458167, 2458196, 2458226,
+    2458255, 2458285, 2458314, 2458343, 2458373, 2458402, 2458432, 2458461, 2458491, 2458521,
+    2458551, 2458580, 2458610, 2458639, 2458669, 2458698, 2458727, 2458757, 2458786, 2458816,
+    2458845, 2458875, 2458905, 2458934, 2458964, 2458994, 2459023, 2459053, 2459082, 2459111,
+    2459141, 2459170, 2459200, 2459229, 2459259, 2459288, 2459318, 2459348, 2459377, 2459407,
+    2459436, 2459466, 2459495, 2459525, 2459554, 2459584, 2459613, 2459643, 2459672, 2459702,
+    2459731, 2459761, 2459791, 2459820, 2459850, 2459879, 2459909, 2459939, 2459968, 2459997,
+    2460027, 2460056, 2460086, 2460115, 2460145, 2460174, 2460204, 2460234, 2460264, 2460293,
+    2460323, 2460352, 2460381, 2460411, 2460440, 2460469, 2460499, 2460528, 2460558, 2460588,
+    2460618, 2460647, 2460677, 2460707, 2460736, 2460765, 2460795, 2460824, 2460853, 2460883,
+    2460912, 2460942, 2460972, 2461002, 2461031, 2461061, 2461090, 2461120, 2461149, 2461179,
+    2461208, 2461237, 2461267, 2461296, 2461326, 2461356, 2461385, 2461415, 2461445, 2461474,
+    2461504, 2461533, 2461563, 2461592, 2461621, 2461651, 2461680, 2461710, 2461739, 2461769,
+    2461799, 2461828, 2461858, 2461888, 2461917, 2461947, 2461976, 2462006, 2462035, 2462064,
+    2462094, 2462123, 2462153, 2462182, 2462212, 2462242, 2462271, 2462301, 2462331, 2462360,
+    2462390, 2462419, 2462448, 2462478, 2462507, 2462537, 2462566, 2462596, 2462625, 2462655,
+    2462685, 2462715, 2462744, 2462774, 2462803, 2462832, 2462862, 2462891, 2462921, 2462950,
+    2462980, 2463009, 2463039, 2463069, 2463099, 2463128, 2463157, 2463187, 2463216, 2463246,
+    2463275, 2463305, 2463334, 2463363, 2463393, 2463423, 2463453, 2463482, 2463512, 2463541,
+    2463571, 2463600, 2463630, 2463659, 2463689, 2463718, 2463747, 2463777, 2463807, 2463836,
+    2463866, 2463895, 2463925, 2463955, 2463984, 2464014, 2464043, 2464073, 2464102, 2464131,
+    2464161, 2464190, 2464220, 2464249, 2464279, 2464309, 2464339, 2464368, 2464398, 2464427,
+    2464457, 2464486, 2464515, 2464545, 2464574, 2464603, 2464633, 2464663, 2464692, 2464722,
+    2464752, 2464782, 2464811, 2464841, 2464870, 2464899, 2464929, 2464958, 2464987, 2465017,
+    2465047, 2465076, 2465106, 2465136, 2465166, 2465195, 2465225, 2465254, 2465283, 2465313,
+    2465342, 2465371, 2465401, 2465431, 2465460, 2465490, 2465520, 2465549, 2465579, 2465608,
+    2465638, 2465667, 2465697, 2465726, 2465755, 2465785, 2465815, 2465844, 2465874, 2465903,
+    2465933, 2465963, 2465992, 2466022, 2466051, 2466081, 2466110, 2466140, 2466169, 2466199,
+    2466228, 2466258, 2466287, 2466317, 2466346, 2466376, 2466405, 2466435, 2466465, 2466494,
+    2466524, 2466553, 2466583, 2466612, 2466641, 2466671, 2466700, 2466730, 2466760, 2466789,
+    2466819, 2466849, 2466878, 2466908, 2466937, 2466967, 2466996, 2467025, 2467055, 2467084,
+    2467114, 2467143, 2467173, 2467203, 2467233, 2467262, 2467292, 2467321, 2467351, 2467380,
+    2467409, 2467439, 2467468, 2467497, 2467527, 2467557, 2467587, 2467617, 2467646, 2467676,
+    2467705, 2467735, 2467764, 2467793, 2467823, 2467852, 2467882, 2467911, 2467941, 2467971,
+    2468000, 2468030, 2468060, 2468089, 2468119, 2468148, 2468177, 2468207, 2468236, 2468266,
+    2468295, 2468325, 2468354, 2468384, 2468414, 2468443, 2468473, 2468502, 2468532, 2468561,
+    2468591, 2468620, 2468650, 2468679, 2468708, 2468738, 2468768, 2468797, 2468827, 2468857,
+    2468886, 2468916, 2468946, 2468975, 2469004, 2469034, 2469063, 2469092, 2469122, 2469152,
+    2469181, 2469211, 2469240, 2469270, 2469300, 2469330, 2469359, 2469388, 2469418, 2469447,
+    2469476, 2469506, 2469535, 2469565, 2469595, 2469624, 2469654, 2469684, 2469713, 2469743,
+    2469772, 2469802, 2469831, 2469861, 2469890, 2469919, 2469949, 2469978, 2470008, 2470038,
+    2470067, 2470097, 2470126, 2470156, 2470186, 2470215, 2470245, 2470274, 2470303, 2470333,
+    2470362, 2470392, 2470421, 2470451, 2470481, 2470510, 2470540, 2470570, 2470599, 2470629,
+    2470658, 2470687, 2470717, 2470746, 2470776, 2470805, 2470835, 2470864, 2470894, 2470924,
+    2470954, 2470983, 2471013, 2471042, 2471071, 2471101, 2471130, 2471159, 2471189, 2471218,
+    2471248, 2471278, 2471308, 2471337, 2471367, 2471397, 2471426, 2471455, 2471485, 2471514,
+    2471543, 2471573, 2471602, 2471632, 2471662, 2471691, 2471721, 2471751, 2471781, 2471810,
+    2471839, 2471869, 2471898, 2471927, 2471957, 2471986, 2472016, 2472046, 2472075, 2472105,
+    2472135, 2472164, 2472194, 2472223, 2472253, 2472282, 2472311, 2472341, 2472370, 2472400,
+    2472429, 2472459, 2472489, 2472518, 2472548, 2472577, 2472607, 2472637, 2472666, 2472695,
+    2472725, 2472754, 2472784, 2472813, 2472843, 2472872, 2472902, 2472931, 2472961, 2472991,
+    2473020, 2473050, 2473080, 2473109, 2473139, 2473168, 2473197, 2473227, 2473256, 2473286,
+    2473315, 2473345, 2473375, 2473404, 2473434, 2473464, 2473493, 2473523, 2473552, 2473581,
+    2473611, 2473640, 2473669, 2473699, 2473729, 2473758, 2473788, 2473818, 2473848, 2473877,
+    2473907, 2473936, 2473965, 2473995, 2474024, 2474053, 2474083, 2474113, 2474142, 2474172,
+    2474202, 2474231, 2474261, 2474291, 2474320, 2474349, 2474379, 2474408, 2474437, 2474467,
+    2474497, 2474526, 2474556, 2474585, 2474615, 2474645, 2474675, 2474704, 2474733, 2474763,
+    2474792, 2474822, 2474851, 2474881, 2474910, 2474940, 2474969, 2474999, 2475029, 2475058,
+    2475088, 2475117, 2475147, 2475176, 2475206, 2475235, 2475264, 2475294, 2475323, 2475353,
+    2475383, 2475412, 2475442, 2475472, 2475501, 2475531, 2475560, 2475590, 2475619, 2475648,
+    2475678, 2475707, 2475737, 2475766, 2475796, 2475826, 2475856, 2475885, 2475915, 2475944,
+    2475974, 2476003, 2476032, 2476062, 2476091, 2476121, 2476150, 2476180, 2476210, 2476239,
+    2476269, 2476299, 2476328, 2476358, 2476387, 2476416, 2476446, 2476475, 2476505, 2476534,
+    2476564, 2476593, 2476623, 2476653, 2476682, 2476712, 2476741, 2476771, 2476801, 2476830,
+    2476859, 2476889, 2476918, 2476948, 2476977, 2477007, 2477036, 2477066, 2477096, 2477125,
+    2477155, 2477185, 2477214, 2477243, 2477273, 2477302, 2477332, 2477361, 2477390, 2477420,
+    2477450, 2477479, 2477509, 2477539, 2477569, 2477598, 2477627, 2477657, 2477686, 2477715,
+    2477745, 2477774, 2477804, 2477833, 2477863, 2477893, 2477923, 2477952, 2477982, 2478011,
+    2478041, 2478070, 2478099, 2478129, 2478158, 2478188, 2478217, 2478247, 2478277, 2478307,
+    2478336, 2478366, 2478395, 2478425, 2478454, 2478483, 2478513, 2478542, 2478572, 2478601,
+    2478631, 2478661, 2478690, 2478720, 2478750, 2478779, 2478808, 2478838, 2478867, 2478897,
+    2478926, 2478956, 2478985, 2479015, 2479044, 2479074, 2479104, 2479133, 2479163, 2479192,
+    2479222, 2479251, 2479281, 2479310, 2479340, 2479369, 2479399, 2479428, 2479458, 2479487,
+    2479517, 2479546, 2479576, 2479606, 2479635, 2479665, 2479695, 2479724, 2479753, 2479783,
+    2479812, 2479841, 2479871, 2479900, 2479930, 2479960, 2479990,
+)
+# fmt: on
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+"""
+Immutable date objects for the calendar modules.
+
+Each calendar module defines a subclass of :class:`CalendarDate`, e.g. :class:`convertdate.hebrew.HebrewDate`.
+A date keeps its julian day number once it has been calculated, and compares,
+hashes and subtracts by it, so sorting or deduplicating dates doesn't repeat the conversion.
+
+.. code-block:: python
+
+   from datetime import timedelta
+   from convertdate.hebrew import HebrewDate
+
+   d = HebrewDate(5784, 7, 1)
+   d.to('gregorian')
+   # GregorianDate(2023, 9, 16)
+   d + timedelta(days=10)
+   # HebrewDate(5784, 7, 11)
+   d.to('persian', method=33) - d
+   # datetime.timedelta(0)
+
+Dates are compared by day, so dates in different calendars are equal when they fall on the same day.
+Dates are not checked when they're created, only when their day number is calculated.
+"""
+import importlib
+from datetime import timedelta
+from functools import total_ordering
+from typing import ClassVar
+
+# Date classes by calendar module name
+_REGISTRY = {}
+
+
+@total_ordering
+class CalendarDate:
+    '''Base class for a (year, month, day) date in one of the calendar modules.'''
+
+    __slots__ = ('year', 'month', 'day', '_jdn')
+
+    year: int
+    month: int
+    day: int
+    _jdn: int
+
+    # Name of the calendar module
+    calendar = None
+
+    # Set by each calendar's subclass to the module's to_jdn and from_jdn, as staticmethods
+    _to_jdn: ClassVar[staticmethod]
+    _from_jdn: ClassVar[staticmethod]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.calendar:
+            if not hasattr(cls, '_to_jdn') or not hasattr(cls, '_from_jdn'):
+                raise TypeError("{} must define _to_jdn and _from_jdn".format(cls.__name__))
+            _REGISTRY[cls.calendar] = cls
+
+    def __init__(self, year, month, day):
+        object.__setattr__(self, 'year', year)
+        object.__setattr__(self, 'month', month)
+        object.__setattr__(self, 'day', day)
+        object.__setattr__(self, '_jdn', None)
+
+    def _options(self):
+        '''Keyword arguments passed to the calendar's conversion functions'''
+        return {}
+
+    @classmethod
+    def from_jdn(cls, jdn, **options):
+        '''Create a date from a julian day number.'''
+        date = cls(*cls._from_jdn(jdn, **options), **options)
+        object.__setattr__(date, '_jdn', jdn)
+        return date
+
+    @classmethod
+    def from_jd(cls, jd, **options):
+        '''Create a date from a Julian day.'''
+        return cls(*importlib.import_module(cls.__module__).from_jd(jd, **options), **options)
+
+    @property
+    def jdn(self):
+        '''Julian day number of this date'''
+        if self._jdn is None:
+            object.__setattr__(self, '_jdn', self._to_jdn(self.year, self.month, self.day, **self._options()))
+
+        return self._jdn
+
+    @property
+    def jd(self):
+        '''Julian day of this date'''
+        return self.jdn - 0.5
+
+    def to(self, calendar, **options):
+        '''
+        Convert to another calendar.
+
+        Arguments:
+            calendar (str): name of a calendar module, e.g. ``'hebrew'``
+            options: options for the other calendar, e.g. ``method``
+        '''
+        return _date_class(calendar).from_jdn(self.jdn, **options)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __reduce__(self):
+        return (_rebuild, (type(self), (self.year, self.month, self.day), self._options()))
+
+    def __iter__(self):
+        return iter((self.year, self.month, self.day))
+
+    def __repr__(self):
+        args = [repr(x) for x in self] + ['{}={!r}'.format(k, v) for k, v in self._options().items() if v is not None]
+        return '{}({})'.format(type(self).__name__, ', '.join(args))
+
+    def __eq__(self, other):
+        if not isinstance(other, CalendarDate):
+            return NotImplemented
+        return self.jdn == other.jdn
+
+    def __lt__(self, other):
+        if not isinstance(other, CalendarDate):
+            return NotImplemented
+        return self.jdn < other.jdn
+
+    def __hash__(self):
+        return hash(self.jdn)
+
+    def __add__(self, other):
+        if not isinstance(other, timedelta):
+            return NotImplemented
+        return self.from_jdn(self.jdn + other.days, **self._options())
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, timedelta):
+            return self.from_jdn(self.jdn - other.days, **self._options())
+        if isinstance(other, CalendarDate):
+            return timedelta(days=self.jdn - other.jdn)
+        return NotImplemented
+
+
+class MethodDate(CalendarDate):
+    '''Base class for dates in calendars that accept a ``method`` option.'''
+
+    __slots__ = ('method',)
+
+    method: object
+
+    def __init__(self, year, month, day, method=None):
+        super().__init__(year, month, day)
+        object.__setattr__(self, 'method', method)
+
+    def _options(self):
+        return {'method': self.method}
+
+
+def _rebuild(cls, args, options):
+    return cls(*args, **options)
+
+
+def _date_class(calendar):
+    if calendar not in _REGISTRY:
+        try:
+            importlib.import_module('.' + calendar, __package__)
+        except ImportError as err:
+            raise ValueError("Unknown calendar: {}".format(calendar)) from err
+
+    try:
+        return _REGISTRY[calendar]
+    except KeyError as err:
+        raise ValueError("{} has no date class".format(calendar)) from err
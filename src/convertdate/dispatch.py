@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+"""
+Convert dates directly between any two calendars.
+
+.. code-block:: python
+
+   from convertdate import convert, convert_many
+
+   convert((5784, 7, 1), src='hebrew', dst='persian')
+   # (1402, 6, 25)
+
+   list(convert_many([(1, 1, 1), (2, 1, 1)], src='french_republican', dst='gregorian', method='romme'))
+   # [(1792, 9, 22), (1793, 9, 22)]
+
+Calendars are named after their modules. Use ``'jd'`` to convert from or to a Julian day count.
+Dates are tuples, except for the ``dublin`` and ``jd`` day counts, which are numbers.
+
+Keyword options (such as ``method``) are passed to each side of the conversion that accepts
+them. To pass an option to only one side, use ``src_opts`` or ``dst_opts``.
+
+Each (src, dst, options) combination is resolved once into a conversion plan, which is cached.
+"""
+import importlib
+import inspect
+from functools import lru_cache, partial
+
+JD = 'jd'
+
+CALENDARS = (
+    'armenian',
+    'bahai',
+    'coptic',
+    'dublin',
+    'french_republican',
+    'gregorian',
+    'hebrew',
+    'indian_civil',
+    'islamic',
+    'iso',
+    'julian',
+    'mayan',
+    'ordinal',
+    'persian',
+    'positivist',
+    'umalqura',
+)
+
+# Calendars whose dates are a single number rather than a tuple
+DAY_COUNTS = (JD, 'dublin')
+
+
+def _bind(func, opts):
+    '''Bind the options that func accepts, returning the bound function and the names used.'''
+    params = inspect.signature(func).parameters
+    kwargs = {k: v for k, v in opts if k in params}
+    if kwargs:
+        return partial(func, **kwargs), set(kwargs)
+
+    return func, set()
+
+
+def _function(calendar, name):
+    if calendar not in CALENDARS:
+        raise ValueError("Unknown calendar: {}. Try: {}".format(calendar, ', '.join((JD,) + CALENDARS)))
+
+    return getattr(importlib.import_module('.' + calendar, __package__), name)
+
+
+@lru_cache(maxsize=256)
+def _plan(src, dst, opts, src_opts, dst_opts):
+    used = set()
+
+    if src == JD:
+        to_jd = None
+    else:
+        to_jd, names = _bind(_function(src, 'to_jd'), opts + src_opts)
+        used |= names
+
+    if dst == JD:
+        from_jd = None
+    else:
+        from_jd, names = _bind(_function(dst, 'from_jd'), opts + dst_opts)
+        used |= names
+
+    unused = set(k for k, _ in opts + src_opts + dst_opts) - used
+    if unused:
+        raise TypeError("Options not accepted by {} or {}: {}".format(src, dst, ', '.join(sorted(unused))))
+
+    if to_jd is None:
+        return from_jd or (lambda date: date)
+
+    if src not in DAY_COUNTS:
+        to_jd = partial(_unpack, to_jd)
+
+    if from_jd is None:
+        return to_jd
+
+    return lambda date: from_jd(to_jd(date))
+
+
+def _unpack(func, date):
+    return func(*date)
+
+
+def plan(src, dst, src_opts=None, dst_opts=None, **opts):
+    """
+    Return a function that converts one date from ``src`` to ``dst``.
+    Plans are cached, use ``plan.cache_info()`` for statistics.
+    """
+    return _plan(
+        src,
+        dst,
+        tuple(sorted(opts.items())),
+        tuple(sorted((src_opts or {}).items())),
+        tuple(sorted((dst_opts or {}).items())),
+    )
+
+
+plan.cache_info = _plan.cache_info
+plan.cache_clear = _plan.cache_clear
+
+
+def convert(date, src, dst, src_opts=None, dst_opts=None, **opts):
+    """
+    Convert a date from the ``src`` calendar to the ``dst`` calendar.
+
+    Arguments:
+        date (tuple or float): date in the source calendar
+        src (str): name of the source calendar, or ``'jd'``
+        dst (str): name of the destination calendar, or ``'jd'``
+        src_opts (dict): options for the source calendar only
+        dst_opts (dict): options for the destination calendar only
+        opts: options for any calendar that accepts them
+    """
+    return plan(src, dst, src_opts, dst_opts, **opts)(date)
+
+
+def convert_many(dates, src, dst, src_opts=None, dst_opts=None, **opts):
+    """
+    Convert an iterable of dates from the ``src`` calendar to the ``dst`` calendar.
+    Returns an iterator. Arguments are the same as :meth:`convert`.
+    """
+    return map(plan(src, dst, src_opts, dst_opts, **opts), dates)
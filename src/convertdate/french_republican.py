@@ -40,19 +40,20 @@ argument in `french_republican` conversion functions.
 All the conversion methods correctly assign the leap years implemented
 while calendar was in use (3, 7, 11).
 """
+from functools import lru_cache
 from math import trunc
 
-from pymeeus.Sun import Sun
-
-from . import gregorian
+from . import astro, gregorian, utils
 from .data.french_republican_days import french_republican_days
+from .dates import MethodDate
 
 # julian day (1792, 9, 22)
 EPOCH = 2375839.5
+EPOCH_JDN = int(EPOCH + 0.5)
 
-YEAR_EPOCH = 1791.0
+YEAR_EPOCH = 1791
 
-DAYS_IN_YEAR = 365.0
+DAYS_IN_YEAR = 365
 
 MOIS = MONTHS = [
     "Vendémiaire",
@@ -70,8 +71,11 @@ MOIS = MONTHS = [
     "Sansculottides",
 ]
 
-LEAP_CYCLE_DAYS = 1461.0  # 365 * 4 + 1
-LEAP_CYCLE_YEARS = 4.0
+LEAP_CYCLE_DAYS = 1461  # 365 * 4 + 1
+LEAP_CYCLE_YEARS = 4
+
+# Maximum number of years kept by the year_start cache
+YEAR_CACHE_SIZE = 4096
 
 
 def leap(year, method=None):
@@ -104,9 +108,8 @@ def leap(year, method=None):
         return year % 4 == 0 and year % 128 != 0
 
     if method == 'equinox':
-        # Is equinox on 366th day after (year, 1, 1)
-        startjd = to_jd(year, 1, 1, method='equinox')
-        if premier_da_la_annee(startjd + 367) - startjd == 366.0:
+        # Is the next equinox on the 366th day after (year, 1, 1)
+        if year_start(year + 1) - year_start(year) == 366:
             return True
     else:
         raise ValueError("Unknown leap year method. Try: continuous, romme, madler or equinox")
@@ -117,9 +120,9 @@ def leap(year, method=None):
 def _previous_fall_equinox(jd):
     '''Return the julian day count of the previous fall equinox.'''
     y, _, _ = gregorian.from_jd(jd)
-    eqx = Sun.get_equinox_solstice(y, "autumn").jde()
+    eqx = astro.equinox_solstice(y, "autumn")
     if eqx > jd:
-        eqx = Sun.get_equinox_solstice(y - 1, "autumn").jde()
+        eqx = astro.equinox_solstice(y - 1, "autumn")
 
     return eqx
 
@@ -127,9 +130,9 @@ def _previous_fall_equinox(jd):
 def _next_fall_equinox(jd):
     '''Return the julian day count of the previous fall equinox.'''
     y, _, _ = gregorian.from_jd(jd)
-    eqx = Sun.get_equinox_solstice(y, "autumn").jde()
+    eqx = astro.equinox_solstice(y, "autumn")
     if eqx < jd:
-        eqx = Sun.get_equinox_solstice(y + 1, "autumn").jde()
+        eqx = astro.equinox_solstice(y + 1, "autumn")
 
     return eqx
 
@@ -151,8 +154,20 @@ def premier_da_la_annee(jd):
     return previous
 
 
-def to_jd(year, month, day, method=None):
-    '''Obtain Julian day from a given French Revolutionary calendar date.'''
+@lru_cache(maxsize=YEAR_CACHE_SIZE)
+def year_start(an):
+    """
+    Returns the julian day number of the first day of the given FR year, using the equinox method.
+
+    Results are kept in a bounded LRU cache. Use ``year_start.cache_info()`` to
+    inspect it and ``year_start.cache_clear()`` to empty it.
+    """
+    equinoxe = _next_fall_equinox(gregorian.to_jd(an + YEAR_EPOCH, 1, 1))
+    return trunc(equinoxe - 0.5) + 1
+
+
+def to_jdn(year, month, day, method=None):
+    '''Obtain julian day number from a given French Revolutionary calendar date.'''
     method = method or 'equinox'
 
     if day < 1 or day > 30:
@@ -165,16 +180,21 @@ def to_jd(year, month, day, method=None):
         raise ValueError("Invalid day for this month in this calendar")
 
     if method == 'equinox':
-        return _to_jd_equinox(year, month, day)
+        return _to_jdn_equinox(year, month, day)
+
+    return _to_jdn_schematic(year, month, day, method)
 
-    return _to_jd_schematic(year, month, day, method)
+
+def to_jd(year, month, day, method=None):
+    '''Obtain Julian day from a given French Revolutionary calendar date.'''
+    return to_jdn(year, month, day, method) - 0.5
 
 
-def _to_jd_schematic(year, month, day, method):
-    '''Calculate JD using various leap-year calculation methods'''
-    y0, y1, y2, y3, y4, y5 = 0, 0, 0, 0, 0, 0
+def _to_jdn_schematic(year, month, day, method):
+    '''Calculate julian day number using various leap-year calculation methods'''
+    y1, y2, y3, y4, y5 = 0, 0, 0, 0, 0
 
-    intercal_cycle_yrs, over_cycle_yrs, leap_suppression_yrs = None, None, None
+    intercal_cycle_yrs, leap_suppression_yrs = None, None
 
     # Use the every-four-years method below year 16 (madler) or below 15 (romme)
     if (method in (100, 'romme') and year < 15) or (method in (128, 'madler') and year < 17):
@@ -185,21 +205,19 @@ def _to_jd_schematic(year, month, day, method):
         y5 = -365
 
     elif method in (100, 'romme'):
-        year = year - 13
-        y5 = DAYS_IN_YEAR * 12 + 3
+        # Years 4, 8 and 12 would be leap under this rule, which makes as many leap days as 3, 7 and 11,
+        # so the cycles are counted from year 1
+        year = year - 1
 
-        leap_suppression_yrs = 100.0
+        leap_suppression_yrs = 100
         leap_suppression_days = 36524  # leap_cycle_days * 25 - 1
 
-        intercal_cycle_yrs = 400.0
+        intercal_cycle_yrs = 400
         intercal_cycle_days = 146097  # leap_suppression_days * 4 + 1
 
-        over_cycle_yrs = 4000.0
-        over_cycle_days = 1460969  # intercal_cycle_days * 10 - 1
-
     elif method in (128, 'madler'):
-        year = year - 17
-        y5 = DAYS_IN_YEAR * 16 + 4
+        # As with Romme's rule, 4, 8, 12 and 16 make as many leap days as 3, 7, 11 and 15
+        year = year - 1
 
         leap_suppression_days = 46751  # 32 * leap_cycle_days - 1
         leap_suppression_yrs = 128
@@ -207,10 +225,6 @@ def _to_jd_schematic(year, month, day, method):
     else:
         raise ValueError("Unknown leap year method. Try: continuous, romme, madler or equinox")
 
-    if over_cycle_yrs:
-        y0 = trunc(year / over_cycle_yrs) * over_cycle_days
-        year = year % over_cycle_yrs
-
     # count intercalary cycles in days (400 years long or None)
     if intercal_cycle_yrs:
         y1 = trunc(year / intercal_cycle_yrs) * intercal_cycle_days
@@ -227,47 +241,54 @@ def _to_jd_schematic(year, month, day, method):
     # Adjust 'year' by one to account for lack of year 0
     y4 = year * DAYS_IN_YEAR
 
-    yj = y0 + y1 + y2 + y3 + y4 + y5
+    yj = y1 + y2 + y3 + y4 + y5
 
     mj = (month - 1) * 30
 
-    return EPOCH + yj + mj + day - 1
+    return EPOCH_JDN + yj + mj + day - 1
 
 
-def _to_jd_equinox(an, mois, jour):
-    '''Return jd of this FR date, counting from the previous equinox.'''
+def _to_jdn_equinox(an, mois, jour):
+    '''Return julian day number of this FR date, counting from the previous equinox.'''
     day_of_adr = (30 * (mois - 1)) + (jour - 1)
-    equinoxe = _next_fall_equinox(gregorian.to_jd(an + YEAR_EPOCH, 1, 1))
-    return trunc(equinoxe - 0.5) + 0.5 + day_of_adr
+    return year_start(an) + day_of_adr
 
 
-def from_jd(jd, method=None):
+def from_jdn(jdn, method=None):
     """Calculate date in the French Revolutionary
-    calendar from Julian day.  The five or six
+    calendar from julian day number.  The five or six
     "sansculottides" are considered a thirteenth
     month in the results of this function."""
     method = method or 'equinox'
 
     if method == 'equinox':
-        return _from_jd_equinox(jd)
+        return _from_jdn_equinox(jdn)
+
+    return _from_jdn_schematic(jdn, method)
+
 
-    return _from_jd_schematic(jd, method)
+def from_jd(jd, method=None):
+    """Calculate date in the French Revolutionary
+    calendar from Julian day.  The five or six
+    "sansculottides" are considered a thirteenth
+    month in the results of this function."""
+    return from_jdn(trunc(jd) + 1, method)
 
 
-def _from_jd_schematic(jd, method):
-    '''Convert from JD using various leap-year calculation methods'''
-    if jd < EPOCH:
+def _from_jdn_schematic(jdn, method):
+    '''Convert from julian day number using various leap-year calculation methods'''
+    if jdn < EPOCH_JDN:
         raise ValueError("Can't convert days before the French Revolution")
 
     # days since Epoch
-    J = trunc(jd) + 0.5 - EPOCH
+    J = jdn - EPOCH_JDN
 
-    y0, y1, y2, y3, y4, y5 = 0, 0, 0, 0, 0, 0
-    intercal_cycle_days = leap_suppression_days = over_cycle_days = None
+    y1, y2, y3, y4, y5 = 0, 0, 0, 0, 0
+    intercal_cycle_days = leap_suppression_days = None
 
-    # Use the every-four-years method below year 17
-    if (J <= DAYS_IN_YEAR * 12 + 3 and method in (100, 'romme')) or (
-        J <= DAYS_IN_YEAR * 17 + 4 and method in (128, 'madler')
+    # Use the every-four-years method before year 15 (romme) or year 17 (madler)
+    if (J < DAYS_IN_YEAR * 14 + 3 and method in (100, 'romme')) or (
+        J < DAYS_IN_YEAR * 16 + 4 and method in (128, 'madler')
     ):
         method = 4
 
@@ -280,30 +301,20 @@ def _from_jd_schematic(jd, method):
 
     elif method in (100, 'romme'):
         # Year 15 is not a leap year
-        # Year 16 is leap, then multiples of 4, not multiples of 100, yes multiples of 400
-        y5 = 12
-        J = J - DAYS_IN_YEAR * 12 - 3
-
-        leap_suppression_yrs = 100.0
+        # Year 16 is leap, then multiples of 4, not multiples of 100, yes multiples of 400.
+        # Counting the cycles from year 1 gives the same days, since 4, 8 and 12 replace 3, 7 and 11
+        leap_suppression_yrs = 100
         leap_suppression_days = 36524  # LEAP_CYCLE_DAYS * 25 - 1
 
-        intercal_cycle_yrs = 400.0
+        intercal_cycle_yrs = 400
         intercal_cycle_days = 146097  # leap_suppression_days * 4 + 1
 
-        over_cycle_yrs = 4000.0
-        over_cycle_days = 1460969  # intercal_cycle_days * 10 - 1
-
-        y0 = trunc(J / over_cycle_days) * over_cycle_yrs
-        J = J % over_cycle_days
-
-        y1 = trunc(J / intercal_cycle_days) * intercal_cycle_yrs
+        y1 = J // intercal_cycle_days * intercal_cycle_yrs
         J = J % intercal_cycle_days
 
     elif method in (128, 'madler'):
-        # Year 15 is a leap year, then year 20 and multiples of 4, not multiples of 128
-        y5 = 16
-        J = J - DAYS_IN_YEAR * 16 - 4
-
+        # Year 15 is a leap year, then year 20 and multiples of 4, not multiples of 128.
+        # Counting the cycles from year 1 gives the same days, since 4, 8, 12 and 16 replace 3, 7, 11 and 15
         leap_suppression_yrs = 128
         leap_suppression_days = 46751  # 32 * leap_cycle_days - 1
 
@@ -311,10 +322,15 @@ def _from_jd_schematic(jd, method):
         raise ValueError("Unknown leap year method. Try: continuous, romme, madler or equinox")
 
     if leap_suppression_days:
-        y2 = trunc(J / leap_suppression_days) * leap_suppression_yrs
-        J = J % leap_suppression_days
+        centuries = J // leap_suppression_days
+        if intercal_cycle_days and centuries == 4:
+            # the last day of a 400-year cycle is the leap day in the last year of its fourth century
+            centuries = 3
 
-    y3 = trunc(J / LEAP_CYCLE_DAYS) * LEAP_CYCLE_YEARS
+        y2 = centuries * leap_suppression_yrs
+        J = J - centuries * leap_suppression_days
+
+    y3 = J // LEAP_CYCLE_DAYS * LEAP_CYCLE_YEARS
 
     if J % LEAP_CYCLE_DAYS == LEAP_CYCLE_DAYS - 1:
         J = 1460
@@ -324,32 +340,45 @@ def _from_jd_schematic(jd, method):
     # 0 <= J <= 1460
     # J needs to be 365 here on leap days ONLY
 
-    y4 = trunc(J / DAYS_IN_YEAR)
+    y4 = J // DAYS_IN_YEAR
 
     if J == DAYS_IN_YEAR * 4:
         y4 = y4 - 1
-        J = 365.0
+        J = 365
     else:
         J = J % DAYS_IN_YEAR
 
-    year = y0 + y1 + y2 + y3 + y4 + y5
+    year = y1 + y2 + y3 + y4 + y5
 
-    month = trunc(J / 30.0)
+    month = J // 30
     J = J - month * 30
 
-    return trunc(year) + 1, month + 1, trunc(J) + 1
+    return year + 1, month + 1, J + 1
 
 
-def _from_jd_equinox(jd):
+def _from_jdn_equinox(jdn):
     '''Calculate the FR day using the equinox as day 1'''
-    jd = trunc(jd) + 0.5
-    equinoxe = premier_da_la_annee(jd)
+    an = gregorian.from_jdn(jdn)[0] - YEAR_EPOCH
+    equinoxe = year_start(an)
+
+    if jdn < equinoxe:
+        an = an - 1
+        equinoxe = year_start(an)
+
+    mois, jour = divmod(jdn - equinoxe, 30)
+
+    return (an, mois + 1, jour + 1)
+
 
-    an = int(gregorian.from_jd(equinoxe)[0] - YEAR_EPOCH)
-    mois = trunc((jd - equinoxe) / 30.0) + 1
-    jour = int((jd - equinoxe) % 30) + 1
+def month_length(year, month, method=None):
+    '''Number of days in a month. The sansculottides are counted as a thirteenth month.'''
+    if not 0 < month <= 13:
+        raise ValueError("Invalid month for this calendar")
+
+    if month == 13:
+        return 5 + leap(year, method=method)
 
-    return (an, mois, jour)
+    return 30
 
 
 def decade(jour):
@@ -360,15 +389,88 @@ def day_name(month, day):
     return french_republican_days[month][day - 1]
 
 
+def to_jdn_array(years, months, days, method=None):
+    '''
+    Convert arrays of French Republican dates to an int64 array of julian day numbers.
+    Inputs are broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal French Republican date.
+    '''
+    return utils.to_jdn_array(
+        years,
+        months,
+        days,
+        lambda year, month, day: to_jdn(year, month, day, method=method),
+        lambda year, month: month_length(year, month, method=method),
+        lambda year: range(1, 14),
+    )
+
+
+def to_jd_array(years, months, days, method=None):
+    '''
+    Convert arrays of French Republican dates to an array of Julian day counts.
+    Inputs are broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days, method) - 0.5
+
+
+def from_jdn_array(jdns, method=None):
+    '''Return French Republican dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    return utils.from_jdn_array(
+        jdns,
+        lambda jdn: from_jdn(jdn, method=method),
+        lambda year, month, day: to_jdn(year, month, day, method=method),
+        lambda year, month: month_length(year, month, method=method),
+        lambda year: range(1, 14),
+    )
+
+
+def from_jd_array(jds, method=None):
+    '''Return French Republican dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = utils.require_numpy()
+    return from_jdn_array(np.trunc(np.asarray(jds, dtype=np.float64)).astype(np.int64) + 1, method)
+
+
 def from_gregorian(year, month, day, method=None):
-    return from_jd(gregorian.to_jd(year, month, day), method=method)
+    return from_jdn(gregorian.to_jdn(year, month, day), method=method)
 
 
 def to_gregorian(an, mois, jour, method=None):
-    return gregorian.from_jd(to_jd(an, mois, jour, method=method))
+    return gregorian.from_jdn(to_jdn(an, mois, jour, method=method))
+
+
+def from_gregorian_array(years, months, days, method=None):
+    '''Convert arrays of Gregorian dates to French Republican dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days), method)
+
+
+def to_gregorian_array(years, months, days, method=None):
+    '''Convert arrays of French Republican dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days, method))
 
 
 def format(an, mois, jour):
     """Convert a FR date into a string with the format DD MONTH YYYY."""
     # pylint: disable=redefined-builtin
     return "{0} {1} {2}".format(jour, MOIS[mois - 1], an)
+
+
+def iter_days(start_jd, end_jd, method=None):
+    '''Generate French Republican dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(
+        start_jd,
+        end_jd,
+        lambda jd: from_jd(jd, method=method),
+        lambda year, month: month_length(year, month, method=method),
+        lambda year: range(1, 14),
+    )
+
+
+class FrenchRepublicanDate(MethodDate):
+    '''A date in the French Republican calendar'''
+
+    __slots__ = ()
+    calendar = 'french_republican'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -18,9 +18,12 @@ from calendar import isleap, monthrange
 from datetime import date
 from math import floor
 
-from .utils import jwday, monthcalendarhelper
+from . import utils
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 EPOCH = 1721425.5
+EPOCH_JDN = int(EPOCH + 0.5)
 
 INTERCALATION_CYCLE_YEARS = 400
 INTERCALATION_CYCLE_DAYS = 146097
@@ -36,6 +39,9 @@ YEAR_DAYS = 365
 HAVE_30_DAYS = (4, 6, 9, 11)
 HAVE_31_DAYS = (1, 3, 5, 7, 8, 10, 12)
 
+# Days in each month of a common year, indexed by month number
+MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 
 def legal_date(year, month, day):
     '''Check if this is a legal date in the Gregorian calendar'''
@@ -67,8 +73,8 @@ def to_jd2(year, month, day):
     return c + day + e + f - 1524.5
 
 
-def to_jd(year, month, day):
-    '''Convert gregorian date to julian day count.'''
+def to_jdn(year, month, day):
+    '''Convert gregorian date to julian day number.'''
     legal_date(year, month, day)
 
     if month <= 2:
@@ -78,38 +84,38 @@ def to_jd(year, month, day):
     else:
         leap_adj = -2
 
+    y = year - 1
+
     return (
-        EPOCH
+        EPOCH_JDN
         - 1
-        + (YEAR_DAYS * (year - 1))
-        + floor((year - 1) / LEAP_CYCLE_YEARS)
-        + (-floor((year - 1) / LEAP_SUPPRESSION_YEARS))
-        + floor((year - 1) / INTERCALATION_CYCLE_YEARS)
-        + floor((((367 * month) - 362) / 12) + leap_adj + day)
+        + (YEAR_DAYS * y)
+        + y // LEAP_CYCLE_YEARS
+        - y // LEAP_SUPPRESSION_YEARS
+        + y // INTERCALATION_CYCLE_YEARS
+        + ((367 * month) - 362) // 12
+        + leap_adj
+        + day
     )
 
 
-def from_jd(jd):
-    '''Return Gregorian date in a (Y, M, D) tuple'''
-    wjd = floor(jd - 0.5) + 0.5
-    depoch = wjd - EPOCH
-
-    quadricent = floor(depoch / INTERCALATION_CYCLE_DAYS)
-    dqc = depoch % INTERCALATION_CYCLE_DAYS
-
-    cent = floor(dqc / LEAP_SUPPRESSION_DAYS)
-    dcent = dqc % LEAP_SUPPRESSION_DAYS
+def to_jd(year, month, day):
+    '''Convert gregorian date to julian day count.'''
+    return to_jdn(year, month, day) - 0.5
 
-    quad = floor(dcent / LEAP_CYCLE_DAYS)
-    dquad = dcent % LEAP_CYCLE_DAYS
 
-    yindex = floor(dquad / YEAR_DAYS)
+def from_jdn(jdn):
+    '''Return Gregorian date in a (Y, M, D) tuple from a julian day number'''
+    quadricent, dqc = divmod(jdn - EPOCH_JDN, INTERCALATION_CYCLE_DAYS)
+    cent, dcent = divmod(dqc, LEAP_SUPPRESSION_DAYS)
+    quad, dquad = divmod(dcent, LEAP_CYCLE_DAYS)
+    yindex = dquad // YEAR_DAYS
     year = quadricent * INTERCALATION_CYCLE_YEARS + cent * LEAP_SUPPRESSION_YEARS + quad * LEAP_CYCLE_YEARS + yindex
 
     if not (cent == 4 or yindex == 4):
         year += 1
 
-    yearday = wjd - to_jd(year, 1, 1)
+    yearday = jdn - to_jdn(year, 1, 1)
 
     leap = isleap(year)
 
@@ -120,12 +126,109 @@ def from_jd(jd):
     else:
         leap_adj = 2
 
-    month = floor((((yearday + leap_adj) * 12) + 373) / 367)
-    day = int(wjd - to_jd(year, month, 1)) + 1
+    month = (((yearday + leap_adj) * 12) + 373) // 367
+    day = jdn - to_jdn(year, month, 1) + 1
 
     return (year, month, day)
 
 
+def from_jd(jd):
+    '''Return Gregorian date in a (Y, M, D) tuple'''
+    return from_jdn(floor(jd + 0.5))
+
+
+def _leap_array(years):
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def _jdn_array(years, months, days):
+    '''Integer day number (Julian day + 0.5) of arrays of Gregorian dates, using floor division only.'''
+    np = require_numpy()
+    y = years - 1
+    leap_adj = np.where(months <= 2, 0, np.where(_leap_array(years), -1, -2))
+
+    return (
+        EPOCH_JDN
+        - 1
+        + (YEAR_DAYS * y)
+        + y // LEAP_CYCLE_YEARS
+        - y // LEAP_SUPPRESSION_YEARS
+        + y // INTERCALATION_CYCLE_YEARS
+        + ((367 * months) - 362) // 12
+        + leap_adj
+        + days
+    )
+
+
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Gregorian dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Gregorian date.
+    '''
+    np = require_numpy()
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+
+    daysinmonth = np.asarray(MONTH_DAYS)[np.clip(months, 0, 12)] + ((months == 2) & _leap_array(years))
+    illegal = (months < 1) | (months > 12) | (days < 1) | (days > daysinmonth)
+    if illegal.any():
+        i = np.argmax(illegal)
+        raise ValueError("Month {} doesn't have a day {}".format(months.flat[i], days.flat[i]))
+
+    return _jdn_array(years, months, days)
+
+
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Gregorian dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Gregorian date.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def _year_start_array(jdn):
+    '''Gregorian years of an array of julian day numbers, and the julian day numbers of their first days'''
+    np = require_numpy()
+    depoch = jdn - EPOCH_JDN
+
+    quadricent, dqc = np.divmod(depoch, INTERCALATION_CYCLE_DAYS)
+    cent, dcent = np.divmod(dqc, LEAP_SUPPRESSION_DAYS)
+    quad, dquad = np.divmod(dcent, LEAP_CYCLE_DAYS)
+    yindex = dquad // YEAR_DAYS
+
+    year = quadricent * INTERCALATION_CYCLE_YEARS + cent * LEAP_SUPPRESSION_YEARS + quad * LEAP_CYCLE_YEARS + yindex
+    year += (cent != 4) & (yindex != 4)
+
+    return year, _jdn_array(year, 1, 1)
+
+
+def from_jdn_array(jdns):
+    '''Return Gregorian dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    jdn = np.asarray(jdns, dtype=np.int64)
+    year, start = _year_start_array(jdn)
+
+    yearday = jdn - start
+    leap = _leap_array(year)
+    leap_adj = np.where(yearday < 58 + leap, 0, np.where(leap, 1, 2))
+
+    month = (((yearday + leap_adj) * 12) + 373) // 367
+    day = jdn - _jdn_array(year, month, 1) + 1
+
+    return year, month, day
+
+
+def from_jd_array(jds):
+    '''Return Gregorian dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64) + 0.5).astype(np.int64))
+
+
 def month_length(year, month):
     '''Calculate the length of a month in the Gregorian calendar'''
     return monthrange(year, month)[1]
@@ -153,3 +256,17 @@ def format(year, month, day, format_string="%-d %B %y"):
         epoch = ' BCE'
     d = date(year, month, day)
     return d.strftime(format_string) + epoch
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Gregorian dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(start_jd, end_jd, from_jd, month_length, lambda year: range(1, 13))
+
+
+class GregorianDate(CalendarDate):
+    '''A date in the Gregorian calendar'''
+
+    __slots__ = ()
+    calendar = 'gregorian'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -5,14 +5,21 @@
 # http://opensource.org/licenses/MIT
 # Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
 import warnings
+from bisect import bisect_right
+from functools import lru_cache
 from math import floor
 
-from . import gregorian
-from .utils import jwday, monthcalendarhelper
+from . import gregorian, utils
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 EPOCH = 347995.5
+EPOCH_JDN = int(EPOCH + 0.5)
 HEBREW_YEAR_OFFSET = 3760
 
+# Maximum number of years kept by the year_structure cache
+YEAR_CACHE_SIZE = 4096
+
 # Hebrew months
 NISAN = 1
 IYYAR = 2
@@ -28,6 +35,10 @@ SHEVAT = 11
 ADAR = 12
 VEADAR = 13
 
+# Months in the order they occur, starting from Tishri
+MONTH_ORDER = (TISHRI, HESHVAN, KISLEV, TEVETH, SHEVAT, ADAR, NISAN, IYYAR, SIVAN, TAMMUZ, AV, ELUL)
+MONTH_ORDER_LEAP = (TISHRI, HESHVAN, KISLEV, TEVETH, SHEVAT, ADAR, VEADAR, NISAN, IYYAR, SIVAN, TAMMUZ, AV, ELUL)
+
 MONTHS = [
     'Nisan',
     'Iyyar',
@@ -104,35 +115,62 @@ def delay_2(year):
     return 0
 
 
+@lru_cache(maxsize=YEAR_CACHE_SIZE)
+def year_structure(year):
+    '''
+    Calculate the layout of a Hebrew year.
+
+    Returns:
+        tuple - (julian day number of 1 Tishri, number of days in the year,
+        lengths of months 1-13, offsets of months 1-13 from 1 Tishri,
+        offsets of the months in the order they occur, starting with Tishri)
+
+    Results are kept in a bounded LRU cache. Use ``year_structure.cache_info()`` to
+    inspect it and ``year_structure.cache_clear()`` to empty it.
+    '''
+    delay = delay_1(year) + delay_2(year)
+    days = delay_1(year + 1) + delay_2(year + 1) - delay
+    is_leap = leap(year)
+
+    lengths = []
+    for month in range(NISAN, VEADAR + 1):
+        if (
+            month in (IYYAR, TAMMUZ, ELUL, TEVETH, VEADAR)
+            or (month == ADAR and not is_leap)
+            or (month == HESHVAN and days % 10 != 5)
+            or (month == KISLEV and days % 10 == 3)
+        ):
+            lengths.append(29)
+        else:
+            lengths.append(30)
+
+    # Count from Tishri to the end of the year, then from Nisan to Elul.
+    # In a common year, Veadar shares its offset with Nisan.
+    offsets = [0] * VEADAR
+    total = 0
+    for month in list(range(TISHRI, VEADAR + 1)) + list(range(NISAN, TISHRI)):
+        offsets[month - 1] = total
+        if month != VEADAR or is_leap:
+            total += lengths[month - 1]
+
+    order = MONTH_ORDER_LEAP if is_leap else MONTH_ORDER
+    starts = tuple(offsets[month - 1] for month in order)
+
+    return EPOCH_JDN + delay + 2, days, tuple(lengths), tuple(offsets), starts
+
+
 def year_days(year):
     '''How many days are in a Hebrew year ?'''
-    return to_jd(year + 1, 7, 1) - to_jd(year, 7, 1)
-
+    return year_structure(year)[1]
 
 
 def month_length(year, month):
     '''How many days are in a given month of a given year'''
-    if month > VEADAR:
+    if not 0 < month <= VEADAR:
         raise ValueError("Incorrect month index")
 
-    # First of all, dispose of fixed-length 29 day months
-    if month in (IYYAR, TAMMUZ, ELUL, TEVETH, VEADAR):
-        return 29
+    return year_structure(year)[2][month - 1]
 
-    # If it's not a leap year, Adar has 29 days
-    if month == ADAR and not leap(year):
-        return 29
-
-    # If it's Heshvan, days depend on length of year
-    if month == HESHVAN and (year_days(year) % 10) != 5:
-        return 29
-
-    # Similarly, Kislev varies with the length of year
-    if month == KISLEV and (year_days(year) % 10) == 3:
-        return 29
-
-    # Nope, it's a 30 day month
-    return 30
 
 def month_days(year, month):
     # retain for backwards compatibility, but warn that this is deprecated
@@ -141,44 +179,70 @@ def month_days(year, month):
     return month_length(year, month)
 
 
+def to_jdn(year, month, day):
+    new_year, _, _, offsets, _ = year_structure(year)
+    return new_year + offsets[month - 1] + day - 1
+
+
 def to_jd(year, month, day):
-    months = year_months(year)
-    jd = EPOCH + delay_1(year) + delay_2(year) + day + 1
+    return to_jdn(year, month, day) - 0.5
 
-    if month < TISHRI:
-        for m in range(TISHRI, months + 1):
-            jd += month_days(year, m)
 
-        for m in range(NISAN, month):
-            jd += month_days(year, m)
-    else:
-        for m in range(TISHRI, month):
-            jd += month_days(year, m)
+def from_jdn(jdn):
+    # Count the months elapsed up to the last molad on or before this day,
+    # and the year in which that month falls. Postponements of the new year
+    # (delay_1, delay_2) can place the day at the end of the previous year.
+    days = jdn - EPOCH_JDN - 2
+    months = ((25920 * (days + 1)) - 12085) // 765433
+    year = ((19 * months) + 252) // 235
+    new_year, _, _, offsets, starts = year_structure(year)
+    if jdn < new_year:
+        year -= 1
+        new_year, _, _, offsets, starts = year_structure(year)
+
+    yearday = jdn - new_year
+    i = bisect_right(starts, yearday) - 1
+    month = (MONTH_ORDER_LEAP if len(starts) == VEADAR else MONTH_ORDER)[i]
 
-    return int(jd) + 0.5
+    return (year, month, yearday - offsets[month - 1] + 1)
 
 
 def from_jd(jd):
-    jd = floor(jd) + 0.5
-    count = floor(((jd - EPOCH) * 98496.0) / 35975351.0)
-    year = count - 1
-    i = count
-    while jd >= to_jd(i, TISHRI, 1):
-        i += 1
-        year += 1
-
-    if jd < to_jd(year, NISAN, 1):
-        first = 7
-    else:
-        first = 1
+    return from_jdn(floor(jd) + 1)
+
+
+def _month_order(year):
+    return MONTH_ORDER_LEAP if leap(year) else MONTH_ORDER
+
+
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Hebrew dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Hebrew date.
+    '''
+    return utils.to_jdn_array(years, months, days, to_jdn, month_length, _month_order)
 
-    month = i = first
-    while jd > to_jd(year, i, month_days(year, i)):
-        i += 1
-        month += 1
 
-    day = int(jd - to_jd(year, month, 1)) + 1
-    return (year, month, day)
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Hebrew dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def from_jdn_array(jdns):
+    '''Return Hebrew dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    return utils.from_jdn_array(jdns, from_jdn, to_jdn, month_length, _month_order)
+
+
+def from_jd_array(jds):
+    '''Return Hebrew dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64)).astype(np.int64) + 1)
 
 
 def to_civil(year, month, day):
@@ -208,17 +272,44 @@ def to_jd_gregorianyear(gregorianyear, hebrew_month, hebrew_day):
     return gregorian.to_jd(gd[0], gd[1], gd[2])
 
 
+def occurrences(month, day, start_jd, end_jd):
+    '''
+    Julian days of every occurrence of a Hebrew month and day from ``start_jd`` up to (not including) ``end_jd``.
+    Years without the day (e.g. Veadar in common years) are skipped.
+    '''
+    jds = []
+    for year in range(from_jd(start_jd)[0], from_jd(end_jd)[0] + 1):
+        if month > year_months(year) or day > month_length(year, month):
+            continue
+
+        jd = to_jd(year, month, day)
+        if start_jd <= jd < end_jd:
+            jds.append(jd)
+
+    return jds
+
+
 def from_gregorian(year, month, day):
-    return from_jd(gregorian.to_jd(year, month, day))
+    return from_jdn(gregorian.to_jdn(year, month, day))
 
 
 def to_gregorian(year, month, day):
-    return gregorian.from_jd(to_jd(year, month, day))
+    return gregorian.from_jdn(to_jdn(year, month, day))
+
+
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Hebrew dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
+
+
+def to_gregorian_array(years, months, days):
+    '''Convert arrays of Hebrew dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days))
 
 
 def monthcalendar(year, month):
     start_weekday = jwday(to_jd(year, month, 1))
-    monthlen = month_days(year, month)
+    monthlen = month_length(year, month)
     return monthcalendarhelper(start_weekday, monthlen)
 
 
@@ -231,3 +322,17 @@ def format(year, month, day, lang=None):
     else:
         month_name = MONTHS[month - 1]
     return "{0} {1} {2}".format(day, month_name, year)
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Hebrew dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(start_jd, end_jd, from_jd, month_length, _month_order)
+
+
+class HebrewDate(CalendarDate):
+    '''A date in the Hebrew calendar'''
+
+    __slots__ = ()
+    calendar = 'hebrew'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
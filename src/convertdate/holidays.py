@@ -13,10 +13,12 @@ without the ``eve`` option, the (secular) day is returned. This is the default.
 """
 import calendar
 import time
-from math import trunc
+from bisect import bisect_left, bisect_right
+from functools import partial, wraps
+from math import floor, trunc
 
 from . import gregorian, hebrew, islamic, julian
-from .utils import jwday, nth_day_of_month
+from .utils import jwday, nth_day_of_month, require_numpy
 
 # weekdays
 MON = 0
@@ -144,6 +146,64 @@ def _easter_julian(year, mode="dionysian"):
     return year, esmj, esdj
 
 
+def _easter_jdn_array(years, church=None):
+    '''Julian day numbers of Easter for an array of Gregorian years'''
+    np = require_numpy()
+    church = church or "western"
+    year = np.asarray(years, dtype=np.int64)
+
+    if church == "western":
+        # Same arithmetic as _easter_western, which truncates float division
+        c = np.trunc(year / 100)
+        n = year - 19 * np.trunc(year / 19)
+        k = np.trunc((c - 17) / 25)
+
+        i = c - np.trunc(c / 4) - np.trunc((c - k) / 3) + (19 * n) + 15
+        i = i - 30 * np.trunc(i / 30)
+        i = i - np.trunc(i / 28) * (1 - np.trunc(i / 28) * np.trunc(29 / (i + 1)) * np.trunc((21 - n) / 11))
+
+        j = year + np.trunc(year / 4) + i + 2 - c + np.trunc(c / 4)
+        j = j - 7 * np.trunc(j / 7)
+
+        L = i - j
+        month = 3 + np.trunc((L + 40) / 44)
+        day = L + 28 - 31 * np.trunc(month / 4)
+
+        return gregorian.to_jdn_array(year, month.astype(np.int64), day.astype(np.int64))
+
+    if church not in ("orthodox", "eastern"):
+        raise ValueError("Unknown value for 'church'")
+
+    # Same arithmetic as _easter_julian
+    meton = year % 19
+    d = (19 * meton + 15) % 30
+    if church == "eastern":
+        d = d + (meton == 0)
+    e = (2 * (year % 4) + 4 * (year % 7) - d + 6) % 7
+    dmj = 113 + d + e + 1
+
+    return julian.to_jdn_array(year, dmj // 31, (dmj % 31) + 1)
+
+
+def easter_array(years, church=None):
+    """
+    Vectorized :meth:`easter`. Requires numpy.
+
+    Arguments:
+        years (array): Gregorian years
+        church (str): ``'western'`` (default), ``'orthodox'`` or ``'eastern'``
+
+    Returns:
+        tuple - (years, months, days) arrays of Gregorian dates
+    """
+    return gregorian.from_jdn_array(_easter_jdn_array(years, church))
+
+
+def easter_jd_array(years, church=None):
+    '''Julian days of Easter for an array of Gregorian years. Requires numpy.'''
+    return _easter_jdn_array(years, church) - 0.5
+
+
 def may_day(year):
     return (year, MAY, 1)
 
@@ -163,9 +223,17 @@ def fathers_day(year):
     return nth_day_of_month(3, SUN, JUN, year)
 
 
-def juneteenth(year):
-    '''19th of June'''
-    return year, JUN, 19
+def juneteenth(year, observed=None):
+    '''19th of June, possibly observed on the previous or following weekday'''
+    day = 19
+    if observed:
+        weekday = calendar.weekday(year, JUN, 19)
+        if weekday == SAT:
+            day = 18
+        if weekday == SUN:
+            day = 20
+
+    return year, JUN, day
 
 
 def flag_day(year):
@@ -384,6 +452,73 @@ def tisha_bav(year, eve=None):
     return gregorian.from_jd(jd)
 
 
+# Jewish holidays by name, with their month and day in the Hebrew calendar.
+# In leap years, Purim is in Veadar.
+JEWISH_HOLIDAYS = (
+    ('tu_beshvat', hebrew.SHEVAT, 15),
+    ('purim', hebrew.ADAR, 14),
+    ('passover', hebrew.NISAN, 15),
+    ('lag_baomer', hebrew.IYYAR, 18),
+    ('shavuot', hebrew.SIVAN, 6),
+    ('tisha_bav', hebrew.AV, 9),
+    ('rosh_hashanah', hebrew.TISHRI, 1),
+    ('yom_kippur', hebrew.TISHRI, 10),
+    ('sukkot', hebrew.TISHRI, 15),
+    ('shemini_azeret', hebrew.TISHRI, 22),
+    ('hanukkah', hebrew.KISLEV, 25),
+)
+
+
+def jewish_holidays(year, eve=None):
+    """
+    Calculate all the Jewish holidays in a Gregorian year. The two Hebrew years that
+    overlap the Gregorian year are laid out once and shared by all the holidays.
+
+    Arguments:
+        year (int): Gregorian year
+        eve (boolean): If ``True``, return the day of the sunset that begins each holiday.
+
+    Returns:
+        dict - Gregorian (year, month, day) of each holiday, keyed by the name of its function in this module
+    """
+    first = gregorian.to_jdn(year, JAN, 1)
+    last = gregorian.to_jdn(year, DEC, 31)
+    hyear = year + hebrew.HEBREW_YEAR_OFFSET
+    structures = hebrew.year_structure(hyear), hebrew.year_structure(hyear + 1)
+    leap = hebrew.leap(hyear)
+
+    result = {}
+    for name, month, day in JEWISH_HOLIDAYS:
+        if month == hebrew.ADAR and leap:
+            month = hebrew.VEADAR
+
+        for new_year, _, _, offsets, _ in structures:
+            jdn = new_year + offsets[month - 1] + day - 1
+            if first <= jdn <= last:
+                break
+        else:
+            raise ValueError("Could not determine gregorian year")
+
+        if name == 'tisha_bav' and jdn % 7 == SAT:
+            jdn = jdn + 1
+        if eve:
+            jdn = jdn - 1
+
+        result[name] = gregorian.from_jdn(jdn)
+
+    return result
+
+
+def jewish_holidays_range(start, end, eve=None):
+    """
+    Calculate the Jewish holidays in the Gregorian years from ``start`` to ``end`` (inclusive).
+
+    Returns:
+        dict - the results of :meth:`jewish_holidays`, keyed by year
+    """
+    return {year: jewish_holidays(year, eve) for year in range(start, end + 1)}
+
+
 # Mexican holidays
 
 
@@ -431,7 +566,7 @@ def ramadan(year, eve=None):
     """The first day of Ramadan, the month of fasting in the Islamic calendar."""
     jd = islamic.to_jd_gregorianyear(year, 9, 1)
     if eve:
-        jd = jd = 1
+        jd = jd - 1
     return gregorian.from_jd(jd)
 
 
@@ -440,7 +575,7 @@ def ashura(year, eve=None):
     Islamic calendar."""
     jd = islamic.to_jd_gregorianyear(year, 1, 10)
     if eve:
-        jd = jd = 1
+        jd = jd - 1
     return gregorian.from_jd(jd)
 
 
@@ -449,7 +584,7 @@ def eid_alfitr(year, eve=None):
     day of the month of Shawwāl."""
     jd = islamic.to_jd_gregorianyear(year, 10, 1)
     if eve:
-        jd = jd = 1
+        jd = jd - 1
     return gregorian.from_jd(jd)
 
 
@@ -458,197 +593,483 @@ def eid_aladha(year, eve=None):
     day of the month of Zū al-Ḥijjah."""
     jd = islamic.to_jd_gregorianyear(year, 12, 10)
     if eve:
-        jd = jd = 1
+        jd = jd - 1
     return gregorian.from_jd(jd)
 
 
+# Islamic holidays by name, with their month and day in the Islamic calendar
+ISLAMIC_HOLIDAYS = (
+    ('ashura', 1, 10),
+    ('ramadan', 9, 1),
+    ('eid_alfitr', 10, 1),
+    ('eid_aladha', 12, 10),
+)
+
+
+def iter_islamic_holidays(start, end, eve=None):
+    """
+    Generate every Islamic holiday in the Gregorian years from ``start`` to ``end`` (inclusive), in order.
+    Because the Islamic year is about 11 days shorter than the Gregorian year,
+    a holiday sometimes occurs twice in one Gregorian year.
+
+    Arguments:
+        start (int): first Gregorian year
+        end (int): last Gregorian year
+        eve (boolean): If ``True``, give the day of the sunset that begins each holiday.
+
+    Yields:
+        tuple - Gregorian (year, month, day) and the name of the holiday
+    """
+    start_jd = gregorian.to_jd(start, JAN, 1) + (1 if eve else 0)
+    end_jd = gregorian.to_jd(end + 1, JAN, 1) + (1 if eve else 0)
+    days = sorted(
+        (jd, name) for name, month, day in ISLAMIC_HOLIDAYS for jd in islamic.occurrences(month, day, start_jd, end_jd)
+    )
+    for jd, name in days:
+        yield gregorian.from_jd(jd - 1 if eve else jd), name
+
+
+# Holidays that follow the Islamic or Hebrew calendar, with their calendar module, month and day
+_LUNAR_HOLIDAYS = {name: (islamic, month, day) for name, month, day in ISLAMIC_HOLIDAYS}
+_LUNAR_HOLIDAYS.update((name, (hebrew, month, day)) for name, month, day in JEWISH_HOLIDAYS)
+
+
+def _lunar_holiday_jdns(name, start_year, end_year):
+    '''
+    Julian day numbers of every occurrence of an Islamic or Jewish holiday in the Gregorian years
+    from ``start_year`` to ``end_year`` (inclusive). Islamic holidays can occur twice in one Gregorian year.
+    '''
+    module, month, day = _LUNAR_HOLIDAYS[name]
+    start_jd, end_jd = gregorian.to_jd(start_year, JAN, 1), gregorian.to_jd(end_year + 1, JAN, 1)
+    jds = module.occurrences(month, day, start_jd, end_jd)
+
+    if name == 'purim':
+        # In leap years, Purim is in Veadar
+        jds = [jd for jd in jds if not hebrew.leap(hebrew.from_jd(jd)[0])]
+        jds = sorted(jds + hebrew.occurrences(hebrew.VEADAR, day, start_jd, end_jd))
+
+    jdns = [int(jd + 0.5) for jd in jds]
+    if name == 'tisha_bav':
+        jdns = [jdn + 1 if jdn % 7 == SAT else jdn for jdn in jdns]
+
+    return jdns
+
+
+def _holiday(func):
+    '''A property of :class:`Holidays` that is calculated once for each year.'''
+
+    @wraps(func)
+    def getter(self):
+        try:
+            return self._cache[func.__name__]
+        except KeyError:
+            value = self._cache[func.__name__] = func(self)
+            return value
+
+    return property(getter)
+
+
 class Holidays:
     '''Convenience class for fetching many holidays in a given year.'''
 
     # pylint: disable=missing-function-docstring
 
     def __init__(self, year=None):
+        self._cache = {}
         self.year = year or time.localtime().tm_year
 
+    @property
+    def year(self):
+        return self._year
+
+    @year.setter
+    def year(self, year):
+        self._year = year
+        self._cache.clear()
+
     def set_year(self, year):
         self.year = year
 
     def __repr__(self):
         return 'Holidays({})'.format(self.year)
 
+    @classmethod
+    def names(cls):
+        '''Names of the holidays available as properties.'''
+        return [name for name in dir(cls) if isinstance(getattr(cls, name), property) and name != 'year']
+
+    @classmethod
+    def table(cls, start_year, end_year, names=None):
+        """
+        Calculate holidays for a range of Gregorian years at once, for quick lookups by date.
+        The table holds every day in the range on which a holiday falls, so an Islamic
+        holiday that occurs twice in a Gregorian year is in it twice.
+
+        Arguments:
+            start_year (int): first Gregorian year
+            end_year (int): last Gregorian year (inclusive)
+            names (list): names of holidays to include, defaults to all of them (see :meth:`names`)
+
+        Returns:
+            :class:`HolidayTable`
+        """
+        names = cls.names() if names is None else list(names)
+        unknown = set(names).difference(cls.names())
+        if unknown:
+            raise ValueError("Unknown holidays: {}".format(', '.join(sorted(unknown))))
+
+        first, last = gregorian.to_jdn(start_year, JAN, 1), gregorian.to_jdn(end_year, DEC, 31)
+        lunar = [name for name in names if name in _LUNAR_HOLIDAYS]
+        others = [name for name in names if name not in _LUNAR_HOLIDAYS]
+        found = [(jdn, name) for name in lunar for jdn in _lunar_holiday_jdns(name, start_year, end_year)]
+
+        # An observed holiday can fall in the neighbouring year, e.g. new year's on December 31
+        holidays = cls(start_year)
+        for year in range(start_year - 1, end_year + 2):
+            holidays.set_year(year)
+            found.extend((gregorian.to_jdn(*getattr(holidays, name)), name) for name in others)
+
+        order = {name: i for i, name in enumerate(names)}
+        days = {}
+        for jdn, name in sorted(found, key=lambda x: (x[0], order[x[1]])):
+            if first <= jdn <= last:
+                days.setdefault(jdn, []).append(name)
+
+        return HolidayTable(days)
+
     # the holidays...
-    @property
+    @_holiday
     def christmas(self):
         return christmas(self.year, True)
 
-    @property
+    @_holiday
     def christmas_eve(self):
         return christmas_eve(self.year)
 
-    @property
+    @_holiday
     def thanksgiving(self):
         return thanksgiving(self.year)
 
-    @property
+    @_holiday
     def new_years(self):
         return new_years(self.year, True)
 
-    @property
+    @_holiday
     def new_years_eve(self):
         return new_years_eve(self.year)
 
-    @property
+    @_holiday
     def independence_day(self):
         return independence_day(self.year, observed=True)
 
-    @property
+    @_holiday
     def flag_day(self):
         return flag_day(self.year)
 
-    @property
+    @_holiday
     def election_day(self):
         return election_day(self.year)
 
-    @property
+    @_holiday
     def presidents_day(self):
         return presidents_day(self.year)
 
-    @property
+    @_holiday
     def washingtons_birthday(self):
         return washingtons_birthday(self.year)
 
-    @property
+    @_holiday
     def lincolns_birthday(self):
         return lincolns_birthday(self.year)
 
-    @property
+    @_holiday
     def memorial_day(self):
         return memorial_day(self.year)
 
-    @property
+    @_holiday
     def juneteenth(self):
         return juneteenth(self.year)
 
-    @property
+    @_holiday
     def labor_day(self):
         return labor_day(self.year)
 
-    @property
+    @_holiday
     def indigenous_peoples_day(self):
         return indigenous_peoples_day(self.year)
 
-    @property
+    @_holiday
     def columbus_day(self):
         return indigenous_peoples_day(self.year)
 
-    @property
+    @_holiday
     def veterans_day(self):
         return veterans_day(self.year, True)
 
-    @property
+    @_holiday
     def valentines_day(self):
         return valentines_day(self.year)
 
-    @property
+    @_holiday
     def halloween(self):
         return halloween(self.year)
 
-    @property
+    @_holiday
     def mothers_day(self):
         return mothers_day(self.year)
 
-    @property
+    @_holiday
     def fathers_day(self):
         return fathers_day(self.year)
 
-    @property
+    @_holiday
     def pulaski_day(self):
         return pulaski_day(self.year)
 
-    @property
+    @_holiday
     def easter(self):
         return easter(self.year)
 
-    @property
+    @_holiday
     def martin_luther_king_day(self):
         return martin_luther_king_day(self.year)
 
-    @property
+    @_holiday
     def hanukkah(self):
         return hanukkah(self.year, eve=False)
 
-    @property
+    @_holiday
     def purim(self):
         return purim(self.year, eve=False)
 
-    @property
+    @_holiday
     def rosh_hashanah(self):
         return rosh_hashanah(self.year, eve=False)
 
-    @property
+    @_holiday
     def yom_kippur(self):
         return yom_kippur(self.year, eve=False)
 
-    @property
+    @_holiday
     def passover(self):
         return passover(self.year, eve=False)
 
-    @property
+    @_holiday
     def shavuot(self):
         return shavuot(self.year, eve=False)
 
-    @property
+    @_holiday
     def sukkot(self):
         return sukkot(self.year, eve=False)
 
-    @property
+    @_holiday
     def tu_beshvat(self):
         return tu_beshvat(self.year, eve=False)
 
-    @property
+    @_holiday
     def shemini_azeret(self):
         return shemini_azeret(self.year, eve=False)
 
-    @property
+    @_holiday
     def lag_baomer(self):
         return lag_baomer(self.year, eve=False)
 
-    @property
+    @_holiday
     def tisha_bav(self):
         return tisha_bav(self.year, eve=False)
 
-    @property
+    @_holiday
     def dia_constitucion(self):
         return dia_constitucion(self.year, observed=True)
 
-    @property
+    @_holiday
     def natalicio_benito_juarez(self):
         return natalicio_benito_juarez(self.year, observed=True)
 
-    @property
+    @_holiday
     def dia_independencia(self):
         return dia_independencia(self.year)
 
-    @property
+    @_holiday
     def dia_revolucion(self):
         return dia_revolucion(self.year)
 
-    @property
+    @_holiday
     def ramadan(self):
         return ramadan(self.year)
 
-    @property
+    @_holiday
     def ashura(self):
         return ashura(self.year)
 
-    @property
+    @_holiday
     def eid_alfitr(self):
         return eid_alfitr(self.year)
 
-    @property
+    @_holiday
     def eid_aladha(self):
         return eid_aladha(self.year)
 
 
+class HolidayTable:
+    """
+    Holidays indexed by julian day number, created with :meth:`Holidays.table`.
+
+    Lookups take a Julian day, and only find holidays in the years the table was built for.
+    """
+
+    def __init__(self, days):
+        self._days = {jdn: tuple(names) for jdn, names in days.items()}
+        self._sorted = sorted(self._days)
+
+    def __len__(self):
+        return len(self._days)
+
+    def __contains__(self, jd):
+        return self.is_holiday(jd)
+
+    def is_holiday(self, jd):
+        '''Check if a Julian day is a holiday.'''
+        return floor(jd + 0.5) in self._days
+
+    def holidays_on(self, jd):
+        '''Names of the holidays on a Julian day.'''
+        return self._days.get(floor(jd + 0.5), ())
+
+    def between(self, jd1, jd2):
+        """
+        Find the holidays from ``jd1`` to ``jd2`` (inclusive).
+
+        Returns:
+            list - (Julian day, names) pairs in order
+        """
+        lo = bisect_left(self._sorted, floor(jd1 + 0.5))
+        hi = bisect_right(self._sorted, floor(jd2 + 0.5))
+        return [(jdn - 0.5, self._days[jdn]) for jdn in self._sorted[lo:hi]]
+
+
+# Julian day number of 1970-01-01, day 0 of numpy's datetime64
+DATETIME64_EPOCH_JDN = 2440588
+
+
+def _observed_array(jdn):
+    '''Move days that fall on Saturday to Friday, and Sunday to Monday'''
+    np = require_numpy()
+    weekday = jdn % 7
+    return jdn + np.where(weekday == SAT, -1, np.where(weekday == SUN, 1, 0))
+
+
+def _fixed_array(month, day, years, observed=None):
+    jdn = gregorian.to_jdn_array(years, month, day)
+    return _observed_array(jdn) if observed else jdn
+
+
+def _nth_day_of_month_array(n, weekday, month, years):
+    '''Vectorized :meth:`nth_day_of_month`, for julian day numbers'''
+    if n == 0:
+        if month == DEC:
+            last = gregorian.to_jdn_array(years + 1, JAN, 1) - 1
+        else:
+            last = gregorian.to_jdn_array(years, month + 1, 1) - 1
+        return last - (last % 7 - weekday) % 7
+
+    first = gregorian.to_jdn_array(years, month, 1)
+    return first + (weekday - first % 7) % 7 + 7 * (n - 1)
+
+
+def _thanksgiving_array(years):
+    np = require_numpy()
+    day = _nth_day_of_month_array(0, THU, NOV, years)
+    third = _nth_day_of_month_array(3, THU, NOV, years)
+    fourth = _nth_day_of_month_array(4, THU, NOV, years)
+    return np.where((years == 1940) | (years == 1941), third, np.where(years == 1939, fourth, day))
+
+
+# Holidays properties that can be calculated for many years at once.
+# Each takes an array of Gregorian years and returns an array of julian day numbers.
+_HOLIDAY_ARRAYS = {
+    'christmas': partial(_fixed_array, DEC, 25, observed=True),
+    'christmas_eve': partial(_fixed_array, DEC, 24),
+    'thanksgiving': _thanksgiving_array,
+    'easter': _easter_jdn_array,
+    'new_years': partial(_fixed_array, JAN, 1, observed=True),
+    'new_years_eve': partial(_fixed_array, DEC, 31),
+    'independence_day': partial(_fixed_array, JUL, 4, observed=True),
+    'flag_day': partial(_fixed_array, JUN, 14),
+    'election_day': partial(_nth_day_of_month_array, 1, TUE, NOV),
+    'presidents_day': partial(_nth_day_of_month_array, 3, MON, FEB),
+    'washingtons_birthday': partial(_fixed_array, FEB, 22),
+    'lincolns_birthday': partial(_fixed_array, FEB, 12),
+    'memorial_day': partial(_nth_day_of_month_array, 0, MON, MAY),
+    'juneteenth': partial(_fixed_array, JUN, 19),
+    'labor_day': partial(_nth_day_of_month_array, 1, MON, SEP),
+    'indigenous_peoples_day': partial(_nth_day_of_month_array, 2, MON, OCT),
+    'columbus_day': partial(_nth_day_of_month_array, 2, MON, OCT),
+    'veterans_day': partial(_fixed_array, NOV, 11, observed=True),
+    'valentines_day': partial(_fixed_array, FEB, 14),
+    'halloween': partial(_fixed_array, OCT, 31),
+    'mothers_day': partial(_nth_day_of_month_array, 2, SUN, MAY),
+    'fathers_day': partial(_nth_day_of_month_array, 3, SUN, JUN),
+    'pulaski_day': partial(_nth_day_of_month_array, 1, MON, MAR),
+    'martin_luther_king_day': partial(_nth_day_of_month_array, 3, MON, JAN),
+    'dia_constitucion': partial(_nth_day_of_month_array, 1, MON, FEB),
+    'natalicio_benito_juarez': partial(_nth_day_of_month_array, 3, MON, MAR),
+    'dia_independencia': partial(_fixed_array, SEP, 16),
+    'dia_revolucion': partial(_nth_day_of_month_array, 3, MON, NOV),
+}
+
+
+def holiday_array(start_year, end_year, names):
+    """
+    The days of holidays in a range of Gregorian years as a sorted ``datetime64[D]`` array,
+    for use with ``numpy.busday_offset`` and its relatives. Requires numpy.
+
+    Fixed-date, nth-weekday and Easter holidays are calculated for all the years at once.
+    Islamic and Jewish holidays are found with :meth:`islamic.occurrences` and :meth:`hebrew.occurrences`,
+    so an Islamic holiday that occurs twice in a Gregorian year is included twice.
+
+    Arguments:
+        start_year (int): first Gregorian year
+        end_year (int): last Gregorian year (inclusive)
+        names (list): names of :class:`Holidays` properties to include
+
+    Returns:
+        numpy.ndarray - unique days, in order, that fall between the start and end of the range
+    """
+    np = require_numpy()
+    names = list(names)
+    unknown = set(names).difference(Holidays.names())
+    if unknown:
+        raise ValueError("Unknown holidays: {}".format(', '.join(sorted(unknown))))
+
+    # An observed holiday can fall in the neighbouring year, e.g. new year's on December 31
+    years = np.arange(start_year - 1, end_year + 2, dtype=np.int64)
+    days = [_HOLIDAY_ARRAYS[name](years) for name in names if name in _HOLIDAY_ARRAYS]
+    days.extend(
+        np.array(_lunar_holiday_jdns(name, start_year, end_year), dtype=np.int64)
+        for name in names
+        if name in _LUNAR_HOLIDAYS
+    )
+
+    jdn = np.unique(np.concatenate(days)) if days else np.empty(0, dtype=np.int64)
+    jdn = jdn[(jdn >= gregorian.to_jdn(start_year, JAN, 1)) & (jdn < gregorian.to_jdn(end_year + 1, JAN, 1))]
+    return (jdn - DATETIME64_EPOCH_JDN).astype('datetime64[D]')
+
+
+def busdaycalendar(start_year, end_year, names, weekmask='1111100'):
+    """
+    Create a ``numpy.busdaycalendar`` with the holidays in a range of Gregorian years.
+    Requires numpy.
+
+    Arguments:
+        start_year (int): first Gregorian year
+        end_year (int): last Gregorian year (inclusive)
+        names (list): names of :class:`Holidays` properties to include
+        weekmask (str): business days of the week, starting with Monday, as in ``numpy.busdaycalendar``
+    """
+    np = require_numpy()
+    return np.busdaycalendar(weekmask=weekmask, holidays=holiday_array(start_year, end_year, names))
+
+
 if __name__ == '__main__':
     holiday = Holidays(time.localtime().tm_year)
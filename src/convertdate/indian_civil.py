@@ -12,8 +12,9 @@ leap day every four years.
 from calendar import isleap
 from math import floor
 
-from . import gregorian
-from .utils import jwday, monthcalendarhelper
+from . import gregorian, utils
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 # 0 = Sunday
 WEEKDAYS = (
@@ -47,50 +48,54 @@ HAVE_30_DAYS = (7, 8, 9, 10, 11, 12)
 SAKA_EPOCH = 78
 
 
-def to_jd(year, month, day):
-    '''Obtain Julian day for Indian Civil date'''
+def to_jdn(year, month, day):
+    '''Obtain julian day number for Indian Civil date'''
 
     gyear = year + 78
     leap = isleap(gyear)
     # // Is this a leap year ?
 
     # 22 - leap = 21 if leap, 22 non-leap
-    start = gregorian.to_jd(gyear, 3, 22 - leap)
+    start = gregorian.to_jdn(gyear, 3, 22 - leap)
     if leap:
         caitra = 31
     else:
         caitra = 30
 
     if month == 1:
-        jd = start + (day - 1)
+        jdn = start + (day - 1)
     else:
-        jd = start + caitra
+        jdn = start + caitra
         m = month - 2
         m = min(m, 5)
-        jd += m * 31
+        jdn += m * 31
         if month >= 8:
             m = month - 7
-            jd += m * 30
+            jdn += m * 30
 
-        jd += day - 1
+        jdn += day - 1
 
-    return jd
+    return jdn
 
 
-def from_jd(jd):
-    """Calculate Indian Civil date from Julian day
+def to_jd(year, month, day):
+    '''Obtain Julian day for Indian Civil date'''
+    return to_jdn(year, month, day) - 0.5
+
+
+def from_jdn(jdn):
+    """Calculate Indian Civil date from julian day number
     Offset in years from Saka era to Gregorian epoch"""
     start = 80
     # Day offset between Saka and Gregorian
 
-    jd = floor(jd) + 0.5
-    gyear, _, _ = gregorian.from_jd(jd)  # Gregorian date for Julian day
+    gyear, _, _ = gregorian.from_jdn(jdn)  # Gregorian date for julian day number
     leap = isleap(gyear)  # Is this a leap year?
     # Tentative year in Saka era
     year = gyear - SAKA_EPOCH
-    # JD at start of Gregorian year
-    greg0 = gregorian.to_jd(gyear, 1, 1)
-    yday = jd - greg0  # Day number (0 based) in Gregorian year
+    # julian day number at start of Gregorian year
+    greg0 = gregorian.to_jdn(gyear, 1, 1)
+    yday = jdn - greg0  # Day number (0 based) in Gregorian year
 
     if leap:
         caitra = 31  # Days in Caitra this year.
@@ -109,30 +114,105 @@ def from_jd(jd):
     else:
         mday = yday - caitra
         if mday < 31 * 5:
-            month = floor(mday / 31) + 2
+            month = mday // 31 + 2
             day = (mday % 31) + 1
         else:
             mday -= 31 * 5
-            month = floor(mday / 30) + 7
+            month = mday // 30 + 7
             day = (mday % 30) + 1
 
-    return year, month, int(day)
+    return year, month, day
+
+
+def from_jd(jd):
+    """Calculate Indian Civil date from Julian day"""
+    return from_jdn(floor(jd) + 1)
 
 
 def from_gregorian(year, month, day):
-    return from_jd(gregorian.to_jd(year, month, day))
+    return from_jdn(gregorian.to_jdn(year, month, day))
 
 
 def to_gregorian(year, month, day):
-    return gregorian.from_jd(to_jd(year, month, day))
+    return gregorian.from_jdn(to_jdn(year, month, day))
 
 
 def month_length(year, month):
-    if month in HAVE_31_DAYS or (month == 1 and isleap(year - SAKA_EPOCH)):
+    if month in HAVE_31_DAYS or (month == 1 and isleap(year + SAKA_EPOCH)):
         return 31
     return 30
 
 
+def _isleap_array(gyears):
+    return (gyears % 4 == 0) & ((gyears % 100 != 0) | (gyears % 400 == 0))
+
+
+def month_length_array(years, months):
+    '''Vectorized :meth:`month_length`. Inputs are broadcast against each other. Requires numpy.'''
+    np = require_numpy()
+    years, months = np.broadcast_arrays(np.asarray(years, dtype=np.int64), np.asarray(months, dtype=np.int64))
+    return 30 + (np.isin(months, HAVE_31_DAYS) | ((months == 1) & _isleap_array(years + SAKA_EPOCH)))
+
+
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Indian Civil dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    np = require_numpy()
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+    gyear = years + SAKA_EPOCH
+    leap = _isleap_array(gyear)
+    # The year starts on March 22, or March 21 in leap years, and Caitra has 30 or 31 days
+    start = gregorian.to_jdn_array(gyear, 3, 22 - leap)
+    caitra = 30 + leap
+    offset = caitra + 31 * np.clip(months - 2, 0, 5) + 30 * np.maximum(months - 7, 0)
+    return start + np.where(months == 1, 0, offset) + days - 1
+
+
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Indian Civil dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def from_jdn_array(jdns):
+    '''Return Indian Civil dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    jdn = np.asarray(jdns, dtype=np.int64)
+    gyear, greg0 = gregorian._year_start_array(jdn)  # pylint: disable=protected-access
+    caitra = 30 + _isleap_array(gyear)
+    yday = jdn - greg0
+
+    # Days before March 22 are at the end of the preceding Saka year
+    before = yday < 80
+    year = gyear - SAKA_EPOCH - before
+    yday = yday + np.where(before, caitra + (31 * 5) + (30 * 3) + 10, -80)
+
+    mday = yday - caitra
+    month = np.where(yday < caitra, 1, np.where(mday < 31 * 5, mday // 31 + 2, (mday - 31 * 5) // 30 + 7))
+    day = np.where(yday < caitra, yday + 1, np.where(mday < 31 * 5, mday % 31 + 1, (mday - 31 * 5) % 30 + 1))
+    return year, month, day
+
+
+def from_jd_array(jds):
+    '''Return Indian Civil dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64)).astype(np.int64) + 1)
+
+
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Indian Civil dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
+
+
+def to_gregorian_array(years, months, days):
+    '''Convert arrays of Indian Civil dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days))
+
+
 def monthcalendar(year, month):
     start_weekday = jwday(to_jd(year, month, 1))
     monthlen = month_length(year, month)
@@ -143,3 +223,17 @@ def format(year, month, day):
     """Convert a Indian Civil date into a string with the format DD MONTH YYYY."""
     # pylint: disable=redefined-builtin
     return "{0:d} {1:} {2:d}".format(day, MONTHS[month - 1], year)
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Indian Civil dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(start_jd, end_jd, from_jd, month_length, lambda year: range(1, 13))
+
+
+class IndianCivilDate(CalendarDate):
+    '''A date in the Indian Civil calendar'''
+
+    __slots__ = ()
+    calendar = 'indian_civil'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -4,13 +4,40 @@
 # Licensed under the MIT license:
 # http://opensource.org/licenses/MIT
 # Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
-"""Convert dates between the Hijri calendar and the Gregorian and Julian calendars."""
-from math import ceil, floor
+"""
+Convert dates between the tabular Hijri calendar and the Gregorian and Julian calendars.
 
-from . import gregorian
-from .utils import jwday, monthcalendarhelper
+The tabular calendar has 11 leap years in each cycle of 30 years. Four arrangements of the leap
+years are common, and each can be counted from the civil epoch (Friday, July 16, 622 CE) or the
+astronomical epoch (Thursday, July 15, 622 CE). Following van Gent's names, choose one with the
+``scheme`` keyword argument:
+
+-   ``'Ic'``, ``'Ia'`` (or ``15``): leap years 2, 5, 7, 10, 13, 15, 18, 21, 24, 26 and 29
+-   ``'IIc'``, ``'IIa'`` (or ``16``): leap years 2, 5, 7, 10, 13, 16, 18, 21, 24, 26 and 29. ``'IIc'`` is the default.
+-   ``'IIIc'``, ``'IIIa'`` (or ``'fatimid'``, for ``'IIIa'``): leap years 2, 5, 8, 10, 13, 16, 19, 21, 24, 27 and 29
+-   ``'IVc'``, ``'IVa'`` (or ``'habash'``, for ``'IVc'``): leap years 2, 5, 8, 11, 13, 16, 19, 21, 24, 27 and 30
+
+Each scheme is a table of the days before each year of the cycle, so all of them convert equally fast.
+
+.. code-block:: python
+
+   from convertdate import islamic
+
+   islamic.from_gregorian(2024, 7, 7)
+   # (1445, 12, 30)
+
+   islamic.from_gregorian(2024, 7, 7, scheme='IIa')
+   # (1446, 1, 1)
+"""
+from bisect import bisect_right
+from math import floor
+
+from . import gregorian, utils
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 EPOCH = 1948439.5
+EPOCH_JDN = int(EPOCH + 0.5)
 WEEKDAYS = ("al-'ahad", "al-'ithnayn", "ath-thalatha'", "al-'arb`a'", "al-khamis", "al-jum`a", "as-sabt")
 MONTHS = [
     "al-Muḥarram",
@@ -29,57 +56,198 @@ MONTHS = [
 HAS_29_DAYS = (2, 4, 6, 8, 10)
 HAS_30_DAYS = (1, 3, 5, 7, 9, 11)
 
+CYCLE_YEARS = 30
+CYCLE_DAYS = 10631
+
+# Leap years in the 30-year cycle
+LEAP_YEARS = {
+    'I': (2, 5, 7, 10, 13, 15, 18, 21, 24, 26, 29),
+    'II': (2, 5, 7, 10, 13, 16, 18, 21, 24, 26, 29),
+    'III': (2, 5, 8, 10, 13, 16, 19, 21, 24, 27, 29),
+    'IV': (2, 5, 8, 11, 13, 16, 19, 21, 24, 27, 30),
+}
+
+# Julian day numbers of 1 Muharram 1 with the civil and astronomical epochs
+EPOCHS = {'c': EPOCH_JDN, 'a': EPOCH_JDN - 1}
+
+SCHEME_ALIASES = {15: 'Ic', 16: 'IIc', 'fatimid': 'IIIa', 'habash': 'IVc'}
+
+
+def _cycle_days(leap_years):
+    '''Days before each year of the cycle. The last entry is the length of the whole cycle.'''
+    days = [0]
+    for y in range(1, CYCLE_YEARS + 1):
+        days.append(days[-1] + 354 + (y in leap_years))
+
+    return tuple(days)
 
-def leap(year):
+
+# (epoch, days before each year of the cycle) of each scheme
+SCHEMES = {
+    pattern + epoch: (EPOCHS[epoch], _cycle_days(leap_years))
+    for pattern, leap_years in LEAP_YEARS.items()
+    for epoch in EPOCHS
+}
+
+
+def _scheme(scheme):
+    '''Normalize the scheme argument, returning the epoch and cycle table'''
+    try:
+        return SCHEMES[SCHEME_ALIASES.get(scheme, scheme or 'IIc')]
+    except (KeyError, TypeError) as err:
+        names = list(SCHEMES) + [str(alias) for alias in SCHEME_ALIASES]
+        raise ValueError("Unknown scheme. Try: {}".format(', '.join(names))) from err
+
+
+def leap(year, scheme=None):
     '''Is a given year a leap year in the Islamic calendar'''
-    return (((year * 11) + 14) % 30) < 11
+    _, days = _scheme(scheme)
+    cyear = (year - 1) % CYCLE_YEARS
+    return days[cyear + 1] - days[cyear] == 355
+
 
+def leap_array(years, scheme=None):
+    '''Vectorized :meth:`leap`. Requires numpy.'''
+    np = require_numpy()
+    lengths = np.diff(_scheme(scheme)[1])
+    return lengths[(np.asarray(years, dtype=np.int64) - 1) % CYCLE_YEARS] == 355
 
-def to_jd(year, month, day):
+
+def to_jdn(year, month, day, scheme=None):
+    '''Determine julian day number from Islamic date'''
+    epoch, days = _scheme(scheme)
+    cycle, cyear = divmod(year - 1, CYCLE_YEARS)
+    # (59 * months + 1) // 2 == ceil(29.5 * months)
+    return epoch + cycle * CYCLE_DAYS + days[cyear] + ((59 * (month - 1)) + 1) // 2 + day - 1
+
+
+def to_jd(year, month, day, scheme=None):
     '''Determine Julian day count from Islamic date'''
-    return (day + ceil(29.5 * (month - 1)) + (year - 1) * 354 + floor((3 + (11 * year)) / 30) + EPOCH) - 1
+    return to_jdn(year, month, day, scheme) - 0.5
 
 
-def from_jd(jd):
+def from_jdn(jdn, scheme=None):
+    '''Calculate Islamic date from julian day number'''
+    epoch, days = _scheme(scheme)
+    cycle, cday = divmod(jdn - epoch, CYCLE_DAYS)
+    cyear = bisect_right(days, cday) - 1
+    yday = cday - days[cyear]
+    # -(-x // 59) == ceil(x / 59)
+    month = min(12, -((2 * (29 - yday)) // 59) + 1)
+    day = yday - ((59 * (month - 1)) + 1) // 2 + 1
+    return (cycle * CYCLE_YEARS + cyear + 1, month, day)
+
+
+def from_jd(jd, scheme=None):
     '''Calculate Islamic date from Julian day'''
-    jd = floor(jd) + 0.5
-    year = floor(((30 * (jd - EPOCH)) + 10646) / 10631)
-    month = min(12, ceil((jd - (29 + to_jd(year, 1, 1))) / 29.5) + 1)
-    day = int(jd - to_jd(year, month, 1)) + 1
-    return (year, month, day)
+    return from_jdn(floor(jd) + 1, scheme)
 
 
-def to_jd_gregorianyear(gregorianyear, islamic_month, islamic_day):
+def to_jd_gregorianyear(gregorianyear, islamic_month, islamic_day, scheme=None):
     # Gregorian year is either 578 or 623 years greater than Islamic year
     # we'll first try 622 if conversion to gregorian isn't the same
     # year that was passed to this method, then it must be 623.
     jan1 = gregorian.to_jd(gregorianyear, 1, 1)
-    yi, mi, _ = from_jd(jan1)
+    yi, mi, _ = from_jd(jan1, scheme)
 
     if mi > islamic_month:
         yi = yi + 1
 
-    return to_jd(yi, islamic_month, islamic_day)
+    return to_jd(yi, islamic_month, islamic_day, scheme)
+
 
+def occurrences(month, day, start_jd, end_jd, scheme=None):
+    '''
+    Julian days of every occurrence of an Islamic month and day from ``start_jd`` up to (not including) ``end_jd``.
+    A Gregorian year can contain two occurrences, or none. Years in which the month is too short are skipped.
+    '''
+    jds = []
+    for year in range(from_jd(start_jd, scheme)[0], from_jd(end_jd, scheme)[0] + 1):
+        if day > month_length(year, month, scheme):
+            continue
 
-def from_gregorian(year, month, day):
-    return from_jd(gregorian.to_jd(year, month, day))
+        jd = to_jd(year, month, day, scheme)
+        if start_jd <= jd < end_jd:
+            jds.append(jd)
 
+    return jds
 
-def to_gregorian(year, month, day):
-    return gregorian.from_jd(to_jd(year, month, day))
 
+def from_gregorian(year, month, day, scheme=None):
+    return from_jdn(gregorian.to_jdn(year, month, day), scheme)
 
-def month_length(year, month):
-    if month in HAS_30_DAYS or (month == 12 and leap(year)):
+
+def to_gregorian(year, month, day, scheme=None):
+    return gregorian.from_jdn(to_jdn(year, month, day, scheme))
+
+
+def to_jdn_array(years, months, days, scheme=None):
+    '''
+    Convert arrays of Islamic dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    np = require_numpy()
+    epoch, cycle_days = _scheme(scheme)
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+    cycle, cyear = np.divmod(years - 1, CYCLE_YEARS)
+    before = np.asarray(cycle_days, dtype=np.int64)[cyear]
+    return epoch + cycle * CYCLE_DAYS + before + ((59 * (months - 1)) + 1) // 2 + days - 1
+
+
+def to_jd_array(years, months, days, scheme=None):
+    '''
+    Convert arrays of Islamic dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days, scheme) - 0.5
+
+
+def from_jdn_array(jdns, scheme=None):
+    '''Return Islamic dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    epoch, cycle_days = _scheme(scheme)
+    cycle_days = np.asarray(cycle_days, dtype=np.int64)
+    cycle, cday = np.divmod(np.asarray(jdns, dtype=np.int64) - epoch, CYCLE_DAYS)
+    cyear = np.searchsorted(cycle_days, cday, side='right') - 1
+    yday = cday - cycle_days[cyear]
+    month = np.minimum(12, -((2 * (29 - yday)) // 59) + 1)
+    day = yday - ((59 * (month - 1)) + 1) // 2 + 1
+    return cycle * CYCLE_YEARS + cyear + 1, month, day
+
+
+def from_jd_array(jds, scheme=None):
+    '''Return Islamic dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64)).astype(np.int64) + 1, scheme)
+
+
+def from_gregorian_array(years, months, days, scheme=None):
+    '''Convert arrays of Gregorian dates to Islamic dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days), scheme)
+
+
+def to_gregorian_array(years, months, days, scheme=None):
+    '''Convert arrays of Islamic dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days, scheme))
+
+
+def month_length(year, month, scheme=None):
+    if month in HAS_30_DAYS or (month == 12 and leap(year, scheme)):
         return 30
 
     return 29
 
 
-def monthcalendar(year, month):
-    start_weekday = jwday(to_jd(year, month, 1))
-    monthlen = month_length(year, month)
+def month_length_array(years, months, scheme=None):
+    '''Vectorized :meth:`month_length`. Inputs are broadcast against each other. Requires numpy.'''
+    np = require_numpy()
+    years, months = np.broadcast_arrays(np.asarray(years, dtype=np.int64), np.asarray(months, dtype=np.int64))
+    return 29 + (np.isin(months, HAS_30_DAYS) | ((months == 12) & leap_array(years, scheme)))
+
+
+def monthcalendar(year, month, scheme=None):
+    start_weekday = jwday(to_jd(year, month, 1, scheme))
+    monthlen = month_length(year, month, scheme)
     return monthcalendarhelper(start_weekday, monthlen)
 
 
@@ -87,3 +255,31 @@ def format(year, month, day):
     """Convert an Islamic date into a string with the format DD MONTH YYYY."""
     # pylint: disable=redefined-builtin
     return "{0:d} {1:} {2:d}".format(day, MONTHS[month - 1], year)
+
+
+def iter_days(start_jd, end_jd, scheme=None):
+    '''Generate Islamic dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(
+        start_jd,
+        end_jd,
+        lambda jd: from_jd(jd, scheme),
+        lambda year, month: month_length(year, month, scheme),
+        lambda year: range(1, 13),
+    )
+
+
+class IslamicDate(CalendarDate):
+    '''A date in the Islamic calendar'''
+
+    __slots__ = ('scheme',)
+    scheme: object
+    calendar = 'islamic'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
+
+    def __init__(self, year, month, day, scheme=None):
+        super().__init__(year, month, day)
+        object.__setattr__(self, 'scheme', scheme)
+
+    def _options(self):
+        return {'scheme': self.scheme}
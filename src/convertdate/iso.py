@@ -9,7 +9,7 @@ from calendar import isleap
 from datetime import date
 
 from . import gregorian
-from .utils import jwday, n_weeks
+from .utils import jwday
 
 MON = 0
 TUE = 1
@@ -20,9 +20,21 @@ SAT = 5
 SUN = 6
 
 
+def to_jdn(year, week, day):
+    '''Return julian day number of given ISO year, week, and day'''
+    # Week 1 is the week containing 4 January; julian day number 0 is a Monday
+    jan4 = gregorian.to_jdn(year, 1, 4)
+    return jan4 - (jan4 % 7) + (7 * (week - 1)) + day - 1
+
+
 def to_jd(year, week, day):
     '''Return Julian day count of given ISO year, week, and day'''
-    return day + n_weeks(SUN, gregorian.to_jd(year - 1, 12, 28), week)
+    return to_jdn(year, week, day) - 0.5
+
+
+def from_jdn(jdn):
+    '''Return tuple of ISO (year, week, day) for julian day number'''
+    return from_gregorian(*gregorian.from_jdn(jdn))
 
 
 def from_jd(jd):
@@ -46,7 +58,7 @@ def from_gregorian(year, month, day):
 
 
 def to_gregorian(year, week, day):
-    return gregorian.from_jd(to_jd(year, week, day))
+    return gregorian.from_jdn(to_jdn(year, week, day))
 
 
 def format(year, week, day):
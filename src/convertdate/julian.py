@@ -22,9 +22,9 @@ convention, use the :meth:`julian.format` function.
 from datetime import date
 from math import floor
 
-from .gregorian import from_jd as gregorian_from_jd
-from .gregorian import to_jd as gregorian_to_jd
-from .utils import jwday, monthcalendarhelper
+from . import gregorian, utils
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
 
 J0000 = 1721424.5  # Julian date of Gregorian epoch: 0000-01-01
 J1970 = 2440587.5  # Julian date at Unix epoch: 1970-01-01
@@ -61,46 +61,117 @@ def legal_date(year, month, day):
     return True
 
 
-def from_jd(jd):
-    '''Calculate Julian calendar date from Julian day'''
-    jd += 0.5
-    a = floor(jd)
-    b = a + 1524
-    c = floor((b - 122.1) / 365.25)
-    d = floor(365.25 * c)
-    e = floor((b - d) / 30.6001)
-    if e < 14:
-        month = floor(e - 1)
-    else:
-        month = floor(e - 13)
-    if month > 2:
-        year = floor(c - 4716)
-    else:
-        year = floor(c - 4715)
-    day = b - d - floor(30.6001 * e)
-    return (year, month, day)
+def to_jdn(year, month, day):
+    '''Convert to julian day number using astronomical years (0 = 1 BC, -1 = 2 BC)'''
+    legal_date(year, month, day)
+
+    # Count from March of 4801 BC, so that the leap day falls at the end of the year
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + (12 * a) - 3
+
+    return day + ((153 * m) + 2) // 5 + (365 * y) + y // 4 - 32083
 
 
 def to_jd(year, month, day):
     '''Convert to Julian day using astronomical years (0 = 1 BC, -1 = 2 BC)'''
-    legal_date(year, month, day)
+    return to_jdn(year, month, day) - 0.5
+
+
+def from_jdn(jdn):
+    '''Calculate Julian calendar date from julian day number'''
+    c = jdn + 32082
+    d = ((4 * c) + 3) // 1461
+    e = c - (1461 * d) // 4
+    m = ((5 * e) + 2) // 153
 
-    # Algorithm as given in Meeus, Astronomical Algorithms, Chapter 7, page 61
-    if month <= 2:
-        year -= 1
-        month += 12
+    day = e - ((153 * m) + 2) // 5 + 1
+    month = m + 3 - (12 * (m // 10))
+    year = d - 4800 + m // 10
 
-    return (floor((365.25 * (year + 4716))) + floor((30.6001 * (month + 1))) + day) - 1524.5
+    return (year, month, day)
+
+
+def from_jd(jd):
+    '''Calculate Julian calendar date from Julian day'''
+    return from_jdn(floor(jd + 0.5))
 
 
 def from_gregorian(year, month, day):
     '''Convert a Gregorian date to a Julian date.'''
-    return from_jd(gregorian_to_jd(year, month, day))
+    return from_jdn(gregorian.to_jdn(year, month, day))
 
 
 def to_gregorian(year, month, day):
     '''Convert a Julian date to a Gregorian date.'''
-    return gregorian_from_jd(to_jd(year, month, day))
+    return gregorian.from_jdn(to_jdn(year, month, day))
+
+
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Julian dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Julian date.
+    '''
+    np = require_numpy()
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+
+    daysinmonth = np.asarray(gregorian.MONTH_DAYS)[np.clip(months, 0, 12)] + ((months == 2) & (years % 4 == 0))
+    illegal = (months < 1) | (months > 12) | (days < 1) | (days > daysinmonth)
+    if illegal.any():
+        i = np.argmax(illegal)
+        raise ValueError("Month {} doesn't have a day {}".format(months.flat[i], days.flat[i]))
+
+    # Count from March of 4801 BC, so that the leap day falls at the end of the year
+    a = (14 - months) // 12
+    y = years + 4800 - a
+    m = months + (12 * a) - 3
+
+    return days + ((153 * m) + 2) // 5 + (365 * y) + y // 4 - 32083
+
+
+def from_jdn_array(jdns):
+    '''Return Julian dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    c = np.asarray(jdns, dtype=np.int64) + 32082
+    d = ((4 * c) + 3) // 1461
+    e = c - (1461 * d) // 4
+    m = ((5 * e) + 2) // 153
+
+    day = e - ((153 * m) + 2) // 5 + 1
+    month = m + 3 - (12 * (m // 10))
+    year = d - 4800 + m // 10
+
+    return year, month, day
+
+
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Julian dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Julian date.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def from_jd_array(jds):
+    '''Return Julian dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64) + 0.5).astype(np.int64))
+
+
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Julian dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
+
+
+def to_gregorian_array(years, months, days):
+    '''Convert arrays of Julian dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days))
 
 
 def monthcalendar(year, month):
@@ -121,3 +192,17 @@ def format(year, month, day, format_string="%-d %B %y"):
         epoch = ' BCE'
     d = date(year, month, day)
     return d.strftime(format_string) + epoch
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Julian dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(start_jd, end_jd, from_jd, month_length, lambda year: range(1, 13))
+
+
+class JulianDate(CalendarDate):
+    '''A date in the Julian calendar'''
+
+    __slots__ = ()
+    calendar = 'julian'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
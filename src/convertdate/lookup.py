@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+"""
+Precomputed lookup tables for converting Julian days to calendar dates.
+
+A table file holds the (year, month, day) of every day in a window of Julian days for
+several calendars. It's memory-mapped read-only when loaded, so worker processes that
+open the same file share one copy in memory. Inside the window a conversion is one index into
+the table; outside it, conversions fall back to the calendar's ``from_jd``.
+
+Build a table for Gregorian years 1800 through 2199 from the command line:
+
+.. code-block:: bash
+
+   python -m convertdate.lookup dates.tbl --start 1800 --end 2200
+
+Then use it:
+
+.. code-block:: python
+
+   from convertdate.lookup import LookupTable
+
+   with LookupTable('dates.tbl') as table:
+       table.from_jd('hebrew', 2451544.5)
+       # (5760, 10, 23)
+
+Each calendar maps a fractional Julian day to a day in the same way as its own ``from_jd``,
+so the table returns the same dates as the calendar module.
+"""
+import argparse
+import importlib
+import mmap
+import struct
+from math import floor, trunc
+
+from . import gregorian
+
+CALENDARS = (
+    'bahai',
+    'coptic',
+    'french_republican',
+    'gregorian',
+    'hebrew',
+    'indian_civil',
+    'islamic',
+    'julian',
+    'persian',
+    'umalqura',
+)
+
+MAGIC = b'CDLT'
+VERSION = 1
+
+# magic, version, number of calendars, first Julian day number, number of days
+HEADER = struct.Struct('<4sHHiI')
+NAME = struct.Struct('<32s')
+# year, month, day
+RECORD = struct.Struct('<hBB')
+
+
+def _round_jdn(jd):
+    return floor(jd + 0.5)
+
+
+def _floor_jdn(jd):
+    return floor(jd) + 1
+
+
+def _trunc_jdn(jd):
+    return trunc(jd) + 1
+
+
+# How each calendar's from_jd picks the julian day number of a Julian day, if not with _round_jdn
+JD_TO_JDN = {
+    'bahai': _trunc_jdn,
+    'french_republican': _trunc_jdn,
+    'hebrew': _floor_jdn,
+    'indian_civil': _floor_jdn,
+    'islamic': _floor_jdn,
+    'persian': _floor_jdn,
+    'umalqura': _floor_jdn,
+}
+
+
+def _module(calendar):
+    return importlib.import_module('.' + calendar, __package__)
+
+
+def _jd_to_jdn(calendar):
+    return JD_TO_JDN.get(calendar, _round_jdn)
+
+
+def build(path, start_jd, end_jd, calendars=None):
+    """
+    Write a lookup table for the Julian days from ``start_jd`` up to (not including) ``end_jd``.
+
+    Arguments:
+        path (str): file to write
+        start_jd (float): first Julian day in the table
+        end_jd (float): Julian day after the end of the table
+        calendars (sequence): names of calendar modules to include, by default ``CALENDARS``
+    """
+    calendars = tuple(calendars or CALENDARS)
+    start = floor(start_jd + 0.5)
+    days = floor(end_jd + 0.5) - start
+
+    if days <= 0:
+        raise ValueError("end_jd must be after start_jd")
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(calendars), start, days))
+        for calendar in calendars:
+            f.write(NAME.pack(calendar.encode('ascii')))
+
+        for calendar in calendars:
+            from_jdn = _module(calendar).from_jdn
+            try:
+                f.write(b''.join(RECORD.pack(*from_jdn(jdn)) for jdn in range(start, start + days)))
+            except struct.error as err:
+                raise ValueError("Dates in {} don't fit in the table format".format(calendar)) from err
+
+
+class LookupTable:
+    '''A memory-mapped lookup table written by :meth:`build`.'''
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, self.start, self.days = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError("{} is not a convertdate lookup table".format(path))
+
+        self.calendars = tuple(
+            NAME.unpack_from(self._mmap, HEADER.size + i * NAME.size)[0].rstrip(b'\0').decode('ascii')
+            for i in range(count)
+        )
+        first = HEADER.size + count * NAME.size
+        self._offsets = {c: first + i * self.days * RECORD.size for i, c in enumerate(self.calendars)}
+
+    def __repr__(self):
+        return 'LookupTable({}, {})'.format(self.start - 0.5, self.start + self.days - 0.5)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._mmap.close()
+
+    def __contains__(self, jd):
+        return 0 <= _round_jdn(jd) - self.start < self.days
+
+    def from_jd(self, calendar, jd):
+        '''Return the date in ``calendar`` for the Julian day ``jd``.'''
+        i = _jd_to_jdn(calendar)(jd) - self.start
+
+        if calendar in self._offsets and 0 <= i < self.days:
+            return RECORD.unpack_from(self._mmap, self._offsets[calendar] + i * RECORD.size)
+
+        return _module(calendar).from_jd(jd)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m convertdate.lookup', description=build.__doc__.split('\n')[1])
+    parser.add_argument('path', help='file to write')
+    parser.add_argument('--start', type=int, default=1800, help='first Gregorian year (default: 1800)')
+    parser.add_argument('--end', type=int, default=2200, help='Gregorian year after the table (default: 2200)')
+    parser.add_argument('--calendars', nargs='+', default=CALENDARS, help='calendars to include')
+    args = parser.parse_args()
+
+    build(args.path, gregorian.to_jd(args.start, 1, 1), gregorian.to_jd(args.end, 1, 1), args.calendars)
+
+
+if __name__ == '__main__':
+    main()
@@ -15,12 +15,13 @@ The calendrical system also includes the
 a modified base-20 counting scheme. Dates in the long count are usually written in the form *7.18.14.8.12*.
 """
 import itertools
-from math import trunc
+from math import floor, trunc
 
 from . import gregorian
-from .utils import amod
+from .utils import amod, require_numpy
 
 EPOCH = 584282.5
+EPOCH_JDN = int(EPOCH + 0.5)
 HAAB = [
     "Pop",
     "Wo'",
@@ -112,36 +113,88 @@ TZOLKIN_TRANSLATIONS = [
 ]
 
 
+def to_jdn(baktun, katun, tun, uinal, kin):
+    '''Determine julian day number from Mayan long count'''
+    return EPOCH_JDN + (baktun * 144000) + (katun * 7200) + (tun * 360) + (uinal * 20) + kin
+
+
 def to_jd(baktun, katun, tun, uinal, kin):
     '''Determine Julian day from Mayan long count'''
-    return EPOCH + (baktun * 144000) + (katun * 7200) + (tun * 360) + (uinal * 20) + kin
+    return to_jdn(baktun, katun, tun, uinal, kin) - 0.5
 
 
-def from_jd(jd):
-    '''Calculate Mayan long count from Julian day'''
-    d = jd - EPOCH
+def from_jdn(jdn):
+    '''Calculate Mayan long count from julian day number'''
+    d = jdn - EPOCH_JDN
     if d < 0:
         raise ValueError("Day out of range")
-    baktun = trunc(d / 144000)
-    d = d % 144000
-    katun = trunc(d / 7200)
-    d = d % 7200
-    tun = trunc(d / 360)
-    d = d % 360
-    uinal = trunc(d / 20)
-    kin = int((d % 20))
+    baktun, d = divmod(d, 144000)
+    katun, d = divmod(d, 7200)
+    tun, d = divmod(d, 360)
+    uinal, kin = divmod(d, 20)
 
     return (baktun, katun, tun, uinal, kin)
 
 
+def from_jd(jd):
+    '''Calculate Mayan long count from Julian day'''
+    return from_jdn(floor(jd + 0.5))
+
+
 def to_gregorian(baktun, katun, tun, uinal, kin):
-    jd = to_jd(baktun, katun, tun, uinal, kin)
-    return gregorian.from_jd(jd)
+    return gregorian.from_jdn(to_jdn(baktun, katun, tun, uinal, kin))
 
 
 def from_gregorian(year, month, day):
-    jd = gregorian.to_jd(year, month, day)
-    return from_jd(jd)
+    return from_jdn(gregorian.to_jdn(year, month, day))
+
+
+def to_jdn_array(baktun, katun, tun, uinal, kin):
+    '''
+    Determine an int64 array of julian day numbers from arrays of Mayan long counts.
+    Inputs are broadcast against each other. Requires numpy.
+    '''
+    np = require_numpy()
+    baktun, katun, tun, uinal, kin = (np.asarray(x, dtype=np.int64) for x in (baktun, katun, tun, uinal, kin))
+    return EPOCH_JDN + (baktun * 144000) + (katun * 7200) + (tun * 360) + (uinal * 20) + kin
+
+
+def to_jd_array(baktun, katun, tun, uinal, kin):
+    '''
+    Determine an array of Julian days from arrays of Mayan long counts.
+    Inputs are broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(baktun, katun, tun, uinal, kin) - 0.5
+
+
+def from_jdn_array(jdns):
+    '''Calculate Mayan long counts from an array of julian day numbers, as a tuple of five arrays'''
+    np = require_numpy()
+    d = np.asarray(jdns, dtype=np.int64) - EPOCH_JDN
+    if (d < 0).any():
+        raise ValueError("Day out of range")
+    baktun, d = np.divmod(d, 144000)
+    katun, d = np.divmod(d, 7200)
+    tun, d = np.divmod(d, 360)
+    uinal, kin = np.divmod(d, 20)
+
+    return (baktun, katun, tun, uinal, kin)
+
+
+def from_jd_array(jds):
+    '''Calculate Mayan long counts from an array of Julian days, as a tuple of five arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64) + 0.5).astype(np.int64))
+
+
+def to_gregorian_array(baktun, katun, tun, uinal, kin):
+    '''Convert arrays of Mayan long counts to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(baktun, katun, tun, uinal, kin))
+
+
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Mayan long counts, as a tuple of five arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
 
 
 def to_haab(jd):
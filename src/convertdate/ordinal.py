@@ -16,9 +16,20 @@ from math import trunc
 from . import gregorian
 
 
+def to_jdn(year, dayofyear):
+    '''Return julian day number of given ordinal date.'''
+    return gregorian.to_jdn(year, 1, 1) + dayofyear - 1
+
+
 def to_jd(year, dayofyear):
     '''Return Julian day count of given ordinal date.'''
-    return gregorian.to_jd(year, 1, 1) + dayofyear - 1
+    return to_jdn(year, dayofyear) - 0.5
+
+
+def from_jdn(jdn):
+    '''Convert a julian day number to an ordinal date.'''
+    year, _, _ = gregorian.from_jdn(jdn)
+    return year, jdn - gregorian.to_jdn(year, 1, 1) + 1
 
 
 def from_jd(jd):
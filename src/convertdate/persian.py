@@ -8,16 +8,40 @@
 The modern Persian calendar, or the Solar Hijri calendar, was adopted in 1911.
 It consists of twelve months of 30 or 31 days. The new year always falls on the
 March equinox.
-"""
-from math import ceil, floor
 
-from pymeeus.Epoch import Epoch
-from pymeeus.Sun import Sun
+By default, `convertdate` finds the new year by calculating the equinox. Two
+arithmetic leap-year rules are also available with the ``method`` keyword argument,
+which avoid astronomical computation entirely:
+
+-   ``method=33`` (or ``'khayyam'``): leap years are the 1st, 5th, 9th, 13th, 17th,
+    22nd, 26th and 30th years of a 33-year cycle. This matches the astronomical
+    calendar in most years between 1178 and 1633.
+-   ``method=2820`` (or ``'birashk'``): Ahmad Birashk's cycle of 2820 years, made up of
+    subcycles of 128, 29, 33 and 37 years.
+
+.. code-block:: python
+
+   from convertdate import persian
+
+   persian.from_gregorian(2025, 3, 21, method='birashk')
+   # (1404, 1, 2)
 
-from . import gregorian
-from .utils import TROPICALYEAR, jwday, monthcalendarhelper
+   persian.from_gregorian(2025, 3, 21, method='khayyam')
+   # (1404, 1, 1)
+
+Use :meth:`persian.divergent_years` to list the years in which an arithmetic
+method starts the year on a different day than the astronomical calendar.
+"""
+from bisect import bisect_right
+from math import floor
+
+from . import astro, gregorian, utils
+from .data import persian_equinoxes
+from .dates import MethodDate
+from .utils import TROPICALYEAR, jwday, monthcalendarhelper, require_numpy
 
 EPOCH = 1948320.5
+EPOCH_JDN = int(EPOCH + 0.5)
 WEEKDAYS = ("Doshanbeh", "Seshhanbeh", "Chaharshanbeh", "Panjshanbeh", "Jomeh", "Shanbeh", "Yekshanbeh")
 
 MONTHS = [
@@ -38,21 +62,67 @@ MONTHS = [
 HAS_31_DAYS = (1, 2, 3, 4, 5, 6)
 HAS_30_DAYS = (7, 8, 9, 10, 11)
 
+# Leap years in the 33-year cycle
+CYCLE_33_LEAP_YEARS = (1, 5, 9, 13, 17, 22, 26, 30)
+CYCLE_33_DAYS = 12053  # 33 * 365 + 8
+
+# Days from the start of a 33-year cycle to the start of each of its years
+CYCLE_33_YEAR_STARTS = tuple(365 * i + len([y for y in CYCLE_33_LEAP_YEARS if y <= i]) for i in range(34))
+
+# The 33-year cycle is aligned to the astronomical calendar for the years in which it is
+# accurate, which places its proleptic year 1 one day before EPOCH.
+CYCLE_33_EPOCH = EPOCH - 1
+CYCLE_33_EPOCH_JDN = EPOCH_JDN - 1
 
-def leap(year):
+BIRASHK_CYCLE_YEARS = 2820
+BIRASHK_CYCLE_DAYS = 1029983
+
+
+def _method(method):
+    '''Normalize the method argument'''
+    method = method or 'astronomical'
+
+    if method in (33, 'khayyam'):
+        return 33
+
+    if method in (2820, 'birashk'):
+        return 2820
+
+    if method == 'astronomical':
+        return method
+
+    raise ValueError("Unknown method. Try: astronomical, khayyam (33) or birashk (2820)")
+
+
+def leap(year, method=None):
     '''Is a given year a leap year in the Persian calendar ?'''
+    method = _method(method)
+
+    if method == 33:
+        return year % 33 in CYCLE_33_LEAP_YEARS
+
+    if method == 2820:
+        return ((((year - 474) % BIRASHK_CYCLE_YEARS) + 474 + 38) * 682) % 2816 < 682
+
     return (to_jd(year + 1, 1, 1) - to_jd(year, 1, 1)) > 365
 
 
 def equinox_jd(gyear):
     """Calculate Julian day during which the March equinox, reckoned from the
-    Tehran meridian, occurred for a given Gregorian year."""
-    mean_jd = Sun.get_equinox_solstice(gyear, target='spring')
-    deltat_jd = mean_jd - Epoch.tt2ut(gyear, 3) / (24 * 60 * 60.)
+    Tehran meridian, occurred for a given Gregorian year.
+    Years between ``persian_equinoxes.FIRST_YEAR`` and ``persian_equinoxes.LAST_YEAR``
+    are read from a precomputed table, others are computed with pymeeus."""
+    if persian_equinoxes.FIRST_YEAR <= gyear <= persian_equinoxes.LAST_YEAR:
+        return persian_equinoxes.EQUINOX_JD[int(gyear) - persian_equinoxes.FIRST_YEAR]
+
+    return _equinox_jd_meeus(gyear)
+
+
+def _equinox_jd_meeus(gyear):
     # Apparent JD in universal time
-    apparent_jd = deltat_jd + (Sun.equation_of_time(deltat_jd)[0] / (24 * 60.))
+    apparent_jd = astro.equinox_solstice(gyear, 'spring', ut=True, apparent=True)
     # Correct for meridian of Tehran + 52.5 degrees
-    return floor(apparent_jd.jde() + (52.5 / 360))
+    return floor(apparent_jd + (52.5 / 360))
 
 
 def last_equinox_jd(jd):
@@ -87,8 +157,49 @@ def jd_to_pyear(jd):
     return round((lasteq - EPOCH) / TROPICALYEAR) + 1, lasteq
 
 
-def to_jd(year, month, day):
-    '''Determine Julian day from Persian date'''
+def _month_offset(month):
+    '''Days between the start of the year and the start of the month'''
+    if month <= 7:
+        return (month - 1) * 31
+
+    return ((month - 1) * 30) + 6
+
+
+def _month_day(yday):
+    '''Month and day for a (1-based) day of the year'''
+    if yday <= 186:
+        month = (yday + 30) // 31
+        day = yday - ((month - 1) * 31)
+    else:
+        month = (yday + 23) // 30
+        day = yday - ((month - 1) * 30) - 6
+
+    return month, day
+
+
+def to_jdn(year, month, day, method=None):
+    '''Determine julian day number from Persian date'''
+    method = _method(method)
+
+    if method == 33:
+        cycles, cyear = divmod(year - 1, 33)
+        return (
+            CYCLE_33_EPOCH_JDN + (cycles * CYCLE_33_DAYS) + CYCLE_33_YEAR_STARTS[cyear] + _month_offset(month) + day - 1
+        )
+
+    if method == 2820:
+        epbase = year - 474
+        epyear = 474 + (epbase % BIRASHK_CYCLE_YEARS)
+        return (
+            EPOCH_JDN
+            - 1
+            + day
+            + _month_offset(month)
+            + ((epyear * 682) - 110) // 2816
+            + (epyear - 1) * 365
+            + (epbase // BIRASHK_CYCLE_YEARS) * BIRASHK_CYCLE_DAYS
+        )
+
     guess = (EPOCH - 1) + (TROPICALYEAR * ((year - 1) - 1))
     y0, equinox = year - 1, 0
 
@@ -96,41 +207,117 @@ def to_jd(year, month, day):
         y0, equinox = jd_to_pyear(guess)
         guess = equinox + TROPICALYEAR + 2
 
-    if month <= 7:
-        m = (month - 1) * 31
-    else:
-        m = ((month - 1) * 30) + 6
+    return int(equinox) + _month_offset(month) + day + 1
+
 
-    return equinox + m + day + 0.5
+def to_jd(year, month, day, method=None):
+    '''Determine Julian day from Persian date'''
+    return to_jdn(year, month, day, method) - 0.5
 
 
-def from_jd(jd):
-    '''Calculate Persian date from Julian day'''
-    jd = floor(jd) + 0.5
-    equinox = last_equinox_jd(jd)
+def from_jdn(jdn, method=None):
+    '''Calculate Persian date from julian day number'''
+    method = _method(method)
+
+    if method == 33:
+        cycles, cday = divmod(jdn - CYCLE_33_EPOCH_JDN, CYCLE_33_DAYS)
+        cyear = bisect_right(CYCLE_33_YEAR_STARTS, cday) - 1
+        year = (cycles * 33) + cyear + 1
+        return (year,) + _month_day(cday - CYCLE_33_YEAR_STARTS[cyear] + 1)
+
+    if method == 2820:
+        cycle, cyear = divmod(jdn - to_jdn(475, 1, 1, method=2820), BIRASHK_CYCLE_DAYS)
+        if cyear == BIRASHK_CYCLE_DAYS - 1:
+            ycycle = BIRASHK_CYCLE_YEARS
+        else:
+            aux1, aux2 = divmod(cyear, 366)
+            ycycle = ((2134 * aux1) + (2816 * aux2) + 2815) // 1028522 + aux1 + 1
+
+        year = ycycle + (BIRASHK_CYCLE_YEARS * cycle) + 474
+        return (year,) + _month_day(jdn - to_jdn(year, 1, 1, method=2820) + 1)
+
+    equinox = int(last_equinox_jd(jdn - 0.5))
     year = round((equinox - EPOCH) / TROPICALYEAR) + 1
-    yday = jd - (equinox + 0.5)
 
-    if yday <= 186:
-        month = ceil(yday / 31)
-        day = yday - ((month - 1) * 31)
-    else:
-        month = ceil((yday - 6) / 30)
-        day = yday - ((month - 1) * 30) - 6
+    return (int(year),) + _month_day(jdn - equinox - 1)
+
+
+def from_jd(jd, method=None):
+    '''Calculate Persian date from Julian day'''
+    return from_jdn(floor(jd) + 1, method)
+
 
-    return int(year), int(month), int(day)
+def to_jdn_array(years, months, days, method=None):
+    '''
+    Convert arrays of Persian dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
 
+    Raises:
+        ValueError: if any of the dates is not a legal Persian date.
+    '''
+    return utils.to_jdn_array(
+        years,
+        months,
+        days,
+        lambda year, month, day: to_jdn(year, month, day, method=method),
+        lambda year, month: month_length(year, month, method=method),
+        lambda year: range(1, 13),
+    )
 
-def from_gregorian(year, month, day):
-    return from_jd(gregorian.to_jd(year, month, day))
 
+def to_jd_array(years, months, days, method=None):
+    '''
+    Convert arrays of Persian dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days, method) - 0.5
 
-def to_gregorian(year, month, day):
-    return gregorian.from_jd(to_jd(year, month, day))
 
+def from_jdn_array(jdns, method=None):
+    '''Return Persian dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    return utils.from_jdn_array(
+        jdns,
+        lambda jdn: from_jdn(jdn, method=method),
+        lambda year, month, day: to_jdn(year, month, day, method=method),
+        lambda year, month: month_length(year, month, method=method),
+        lambda year: range(1, 13),
+    )
 
-def month_length(year, month):
-    if month in HAS_30_DAYS or (month == 12 and leap(year)):
+
+def from_jd_array(jds, method=None):
+    '''Return Persian dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64)).astype(np.int64) + 1, method)
+
+
+def divergent_years(method, start, end):
+    '''
+    List the years between ``start`` and ``end`` (inclusive) in which the given
+    arithmetic method begins the year on a different day than the astronomical calendar.
+    '''
+    return [y for y in range(start, end + 1) if to_jd(y, 1, 1, method=method) != to_jd(y, 1, 1)]
+
+
+def from_gregorian(year, month, day, method=None):
+    return from_jdn(gregorian.to_jdn(year, month, day), method=method)
+
+
+def to_gregorian(year, month, day, method=None):
+    return gregorian.from_jdn(to_jdn(year, month, day, method=method))
+
+
+def from_gregorian_array(years, months, days, method=None):
+    '''Convert arrays of Gregorian dates to Persian dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days), method)
+
+
+def to_gregorian_array(years, months, days, method=None):
+    '''Convert arrays of Persian dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days, method))
+
+
+def month_length(year, month, method=None):
+    if month in HAS_30_DAYS or (month == 12 and leap(year, method=method)):
         return 30
     if month in HAS_31_DAYS:
         return 31
@@ -138,9 +325,9 @@ def month_length(year, month):
     return 29
 
 
-def monthcalendar(year, month):
-    start_weekday = jwday(to_jd(year, month, 1))
-    monthlen = month_length(year, month)
+def monthcalendar(year, month, method=None):
+    start_weekday = jwday(to_jd(year, month, 1, method=method))
+    monthlen = month_length(year, month, method=method)
     return monthcalendarhelper(start_weekday, monthlen)
 
 
@@ -148,3 +335,23 @@ def format(year, month, day):
     """Convert a Persian date into a string with the format DD MONTH YYYY."""
     # pylint: disable=redefined-builtin
     return "{0:d} {1:} {2:d}".format(day, MONTHS[month - 1], year)
+
+
+def iter_days(start_jd, end_jd, method=None):
+    '''Generate Persian dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(
+        start_jd,
+        end_jd,
+        lambda jd: from_jd(jd, method=method),
+        lambda year, month: month_length(year, month, method=method),
+        lambda year: range(1, 13),
+    )
+
+
+class PersianDate(MethodDate):
+    '''A date in the Persian calendar'''
+
+    __slots__ = ()
+    calendar = 'persian'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -13,12 +13,15 @@
 from calendar import isleap
 from math import floor
 
-from . import gregorian
+from . import gregorian, utils
 from .data import positivist as data
+from .dates import CalendarDate
+from .utils import require_numpy
 
 # Positivist calendar has 13 28-day months and one festival day
 
 EPOCH = 2374479.5
+EPOCH_JDN = int(EPOCH + 0.5)
 
 YEAR_EPOCH = 1789
 
@@ -60,42 +63,40 @@ def legal_date(year, month, day):
     return True
 
 
-def to_jd(year, month, day):
-    '''Convert a Positivist date to Julian day count.'''
+def to_jdn(year, month, day):
+    '''Convert a Positivist date to julian day number.'''
     legal_date(year, month, day)
     gyear = year + YEAR_EPOCH - 1
 
     return (
-        gregorian.EPOCH
+        gregorian.EPOCH_JDN
         - 1
         + (365 * (gyear - 1))
-        + floor((gyear - 1) / 4)
-        + (-floor((gyear - 1) / 100))
-        + floor((gyear - 1) / 400)
+        + (gyear - 1) // 4
+        - (gyear - 1) // 100
+        + (gyear - 1) // 400
         + (month - 1) * 28
         + day
     )
 
 
-def from_jd(jd):
-    '''Convert a Julian day count to Positivist date.'''
-    try:
-        assert jd >= EPOCH
-    except AssertionError as err:
-        raise ValueError('Invalid Julian day') from err
+def to_jd(year, month, day):
+    '''Convert a Positivist date to Julian day count.'''
+    return to_jdn(year, month, day) - 0.5
 
-    depoch = floor(jd - 0.5) + 0.5 - gregorian.EPOCH
 
-    quadricent = floor(depoch / gregorian.INTERCALATION_CYCLE_DAYS)
-    dqc = depoch % gregorian.INTERCALATION_CYCLE_DAYS
+def from_jdn(jdn):
+    '''Convert a julian day number to Positivist date.'''
+    if jdn < EPOCH_JDN:
+        raise ValueError('Invalid Julian day')
 
-    cent = floor(dqc / gregorian.LEAP_SUPPRESSION_DAYS)
-    dcent = dqc % gregorian.LEAP_SUPPRESSION_DAYS
+    depoch = jdn - gregorian.EPOCH_JDN
 
-    quad = floor(dcent / gregorian.LEAP_CYCLE_DAYS)
-    dquad = dcent % gregorian.LEAP_CYCLE_DAYS
+    quadricent, dqc = divmod(depoch, gregorian.INTERCALATION_CYCLE_DAYS)
+    cent, dcent = divmod(dqc, gregorian.LEAP_SUPPRESSION_DAYS)
+    quad, dquad = divmod(dcent, gregorian.LEAP_CYCLE_DAYS)
+    yindex, yearday = divmod(dquad, gregorian.YEAR_DAYS)
 
-    yindex = floor(dquad / gregorian.YEAR_DAYS)
     year = (
         quadricent * gregorian.INTERCALATION_CYCLE_YEARS
         + cent * gregorian.LEAP_SUPPRESSION_YEARS
@@ -103,30 +104,98 @@ def from_jd(jd):
         + yindex
     )
 
-    if yindex == 4:
+    if cent == 4 or yindex == 4:
         yearday = 365
         year = year - 1
 
-    else:
-        yearday = (
-            depoch
-            - quadricent * gregorian.INTERCALATION_CYCLE_DAYS
-            - cent * gregorian.LEAP_SUPPRESSION_DAYS
-            - quad * gregorian.LEAP_CYCLE_DAYS
-            - yindex * gregorian.YEAR_DAYS
-        )
+    month = yearday // 28
+
+    return (year - YEAR_EPOCH + 2, month + 1, yearday - (month * 28) + 1)
+
+
+def from_jd(jd):
+    '''Convert a Julian day count to Positivist date.'''
+    return from_jdn(floor(jd + 0.5))
+
+
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Positivist dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+
+    Raises:
+        ValueError: if any of the dates is not a legal Positivist date.
+    '''
+    np = require_numpy()
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+    gyears = years + YEAR_EPOCH - 1
+    new_year = gregorian.to_jdn_array(gyears, 1, 1)
+
+    # The festival days are 1 or 2 days long, depending on the length of the year
+    day_max = np.where(months == 14, gregorian.to_jdn_array(gyears + 1, 1, 1) - new_year - 364, 28)
+    illegal = (years < 1) | (months < 1) | (months > 14) | (days < 1) | (days > day_max)
+    if illegal.any():
+        i = np.argmax(illegal)
+        raise ValueError("Invalid Positivist date: ({}, {}, {})".format(years.flat[i], months.flat[i], days.flat[i]))
+
+    return new_year + (months - 1) * 28 + days - 1
 
-    month = floor(yearday / 28)
 
-    return (year - YEAR_EPOCH + 2, month + 1, int(yearday - (month * 28)) + 1)
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Positivist dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def from_jdn_array(jdns):
+    '''Return Positivist dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    jdns = np.asarray(jdns, dtype=np.int64)
+    if (jdns < EPOCH_JDN).any():
+        raise ValueError('Invalid Julian day')
+
+    gyears, new_year = gregorian._year_start_array(jdns)  # pylint: disable=protected-access
+    yearday = jdns - new_year
+    month = yearday // 28
+
+    return gyears - YEAR_EPOCH + 1, month + 1, yearday - (month * 28) + 1
+
+
+def from_jd_array(jds):
+    '''Return Positivist dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64) + 0.5).astype(np.int64))
+
+
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Positivist dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
+
+
+def to_gregorian_array(years, months, days):
+    '''Convert arrays of Positivist dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days))
 
 
 def from_gregorian(year, month, day):
-    return from_jd(gregorian.to_jd(year, month, day))
+    return from_jdn(gregorian.to_jdn(year, month, day))
 
 
 def to_gregorian(year, month, day):
-    return gregorian.from_jd(to_jd(year, month, day))
+    return gregorian.from_jdn(to_jdn(year, month, day))
+
+
+def month_length(year, month):
+    '''Number of days in a month. The festival days are counted as a fourteenth month.'''
+    if not 0 < month <= 14:
+        raise ValueError("Invalid month for this calendar")
+
+    if month == 14:
+        return 1 + isleap(year + YEAR_EPOCH - 1)
+
+    return 28
 
 
 def dayname(year, month, day):
@@ -162,3 +231,17 @@ def festival(month, day):
     Returns None if inapplicable.
     """
     return data.FESTIVALS.get((month, day))
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Positivist dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    return utils.iter_days(start_jd, end_jd, from_jd, month_length, lambda year: range(1, 15))
+
+
+class PositivistDate(CalendarDate):
+    '''A date in the Positivist calendar'''
+
+    __slots__ = ()
+    calendar = 'positivist'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# This file is part of convertdate.
+# http://github.com/fitnr/convertdate
+# Licensed under the MIT license:
+# http://opensource.org/licenses/MIT
+# Copyright (c) 2016, fitnr <fitnr@fakeisthenewreal>
+"""
+The Umm al-Qura calendar, the official Hijri calendar of Saudi Arabia.
+
+Its months begin on the days given by a published table, which no arithmetic rule reproduces.
+Early in the table, a few months have 28 or 31 days.
+Between 1 Muharram 1343 (August 1, 1924) and the end of 1500 (November 16, 2077), dates are
+read from that table. Outside this range, dates fall back to the tabular calendar in
+:mod:`convertdate.islamic`, so a day may be skipped or repeated at the edges of the table.
+
+.. code-block:: python
+
+   from convertdate import islamic, umalqura
+
+   umalqura.from_gregorian(2024, 7, 7)
+   # (1446, 1, 1)
+
+   islamic.from_gregorian(2024, 7, 7)
+   # (1445, 12, 30)
+"""
+from bisect import bisect_right
+from itertools import chain
+from math import floor
+
+from . import gregorian, islamic, utils
+from .data.umalqura import FIRST_YEAR, LAST_YEAR, MONTH_STARTS
+from .dates import CalendarDate
+from .utils import jwday, monthcalendarhelper, require_numpy
+
+EPOCH = islamic.EPOCH
+EPOCH_JDN = islamic.EPOCH_JDN
+WEEKDAYS = islamic.WEEKDAYS
+MONTHS = islamic.MONTHS
+
+# Julian day numbers of the first and last days in the table
+FIRST_JDN = MONTH_STARTS[0]
+LAST_JDN = MONTH_STARTS[-1] - 1
+
+
+def _month_index(year, month):
+    '''Position of a month in MONTH_STARTS, or None if it's outside the table'''
+    if FIRST_YEAR <= year <= LAST_YEAR and 1 <= month <= 12:
+        return (year - FIRST_YEAR) * 12 + month - 1
+
+    return None
+
+
+def to_jdn(year, month, day):
+    '''Determine julian day number from Umm al-Qura date'''
+    i = _month_index(year, month)
+    if i is None:
+        return islamic.to_jdn(year, month, day)
+
+    return MONTH_STARTS[i] + day - 1
+
+
+def to_jd(year, month, day):
+    '''Determine Julian day count from Umm al-Qura date'''
+    return to_jdn(year, month, day) - 0.5
+
+
+def from_jdn(jdn):
+    '''Calculate Umm al-Qura date from julian day number'''
+    if not FIRST_JDN <= jdn <= LAST_JDN:
+        return islamic.from_jdn(jdn)
+
+    i = bisect_right(MONTH_STARTS, jdn) - 1
+    year, month = divmod(i, 12)
+    return (year + FIRST_YEAR, month + 1, jdn - MONTH_STARTS[i] + 1)
+
+
+def from_jd(jd):
+    '''Calculate Umm al-Qura date from Julian day'''
+    return from_jdn(floor(jd) + 1)
+
+
+def to_jdn_array(years, months, days):
+    '''
+    Convert arrays of Umm al-Qura dates to an int64 array of julian day numbers. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    np = require_numpy()
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+    inside = (FIRST_YEAR <= years) & (years <= LAST_YEAR) & (1 <= months) & (months <= 12)
+    i = np.where(inside, (years - FIRST_YEAR) * 12 + months - 1, 0)
+    starts = np.asarray(MONTH_STARTS, dtype=np.int64)
+    return np.where(inside, starts[i] + days - 1, islamic.to_jdn_array(years, months, days))
+
+
+def to_jd_array(years, months, days):
+    '''
+    Convert arrays of Umm al-Qura dates to an array of Julian day counts. Inputs are
+    broadcast against each other. Requires numpy.
+    '''
+    return to_jdn_array(years, months, days) - 0.5
+
+
+def from_jdn_array(jdns):
+    '''Return Umm al-Qura dates for an array of julian day numbers as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    jdns = np.asarray(jdns, dtype=np.int64)
+    inside = (FIRST_JDN <= jdns) & (jdns <= LAST_JDN)
+    starts = np.asarray(MONTH_STARTS, dtype=np.int64)
+    i = np.where(inside, np.searchsorted(starts, jdns, side='right') - 1, 0)
+    year, month = np.divmod(i, 12)
+    table = (year + FIRST_YEAR, month + 1, jdns - starts[i] + 1)
+    return tuple(np.where(inside, a, b) for a, b in zip(table, islamic.from_jdn_array(jdns)))
+
+
+def from_jd_array(jds):
+    '''Return Umm al-Qura dates for an array of Julian day counts as a tuple of (years, months, days) arrays'''
+    np = require_numpy()
+    return from_jdn_array(np.floor(np.asarray(jds, dtype=np.float64)).astype(np.int64) + 1)
+
+
+def from_gregorian(year, month, day):
+    return from_jdn(gregorian.to_jdn(year, month, day))
+
+
+def to_gregorian(year, month, day):
+    return gregorian.from_jdn(to_jdn(year, month, day))
+
+
+def from_gregorian_array(years, months, days):
+    '''Convert arrays of Gregorian dates to Umm al-Qura dates, as a tuple of (years, months, days) arrays'''
+    return from_jdn_array(gregorian.to_jdn_array(years, months, days))
+
+
+def to_gregorian_array(years, months, days):
+    '''Convert arrays of Umm al-Qura dates to Gregorian dates, as a tuple of (years, months, days) arrays'''
+    return gregorian.from_jdn_array(to_jdn_array(years, months, days))
+
+
+def month_length(year, month):
+    i = _month_index(year, month)
+    if i is None:
+        return islamic.month_length(year, month)
+
+    return MONTH_STARTS[i + 1] - MONTH_STARTS[i]
+
+
+def monthcalendar(year, month):
+    start_weekday = jwday(to_jd(year, month, 1))
+    monthlen = month_length(year, month)
+    return monthcalendarhelper(start_weekday, monthlen)
+
+
+def format(year, month, day):
+    """Convert an Umm al-Qura date into a string with the format DD MONTH YYYY."""
+    # pylint: disable=redefined-builtin
+    return islamic.format(year, month, day)
+
+
+def iter_days(start_jd, end_jd):
+    '''Generate Umm al-Qura dates for the Julian days from ``start_jd`` up to (not including) ``end_jd``'''
+    # Start again at the edges of the table, where the dates can jump
+    edges = [start_jd + (jdn - 1 - floor(start_jd)) for jdn in (FIRST_JDN, LAST_JDN + 1)]
+    edges = [start_jd] + [jd for jd in edges if start_jd < jd < end_jd] + [end_jd]
+    return chain.from_iterable(
+        utils.iter_days(start, end, from_jd, month_length, lambda year: range(1, 13))
+        for start, end in zip(edges, edges[1:])
+    )
+
+
+class UmalquraDate(CalendarDate):
+    '''A date in the Umm al-Qura calendar'''
+
+    __slots__ = ()
+    calendar = 'umalqura'
+    _to_jdn = staticmethod(to_jdn)
+    _from_jdn = staticmethod(from_jdn)
@@ -11,6 +11,17 @@ import math
 TROPICALYEAR = 365.24219878  # Mean solar tropical year
 
 
+def require_numpy():
+    '''Import and return numpy, which is required by the vectorized ``*_array`` functions.'''
+    # pylint: disable=import-outside-toplevel
+    try:
+        import numpy
+    except ImportError as err:
+        raise ImportError("Array functions require numpy. Install it with: pip install convertdate[numpy]") from err
+
+    return numpy
+
+
 def amod(a, b):
     '''Modulus function which returns numerator if modulus is zero'''
     modded = int(a % b)
@@ -82,6 +93,140 @@ def monthcalendarhelper(start_weekday, month_length):
     return [days[i : i + 7] for i in range(0, lpad + month_length, 7)]
 
 
+def iter_days(start_jd, end_jd, from_jd, month_length, months):
+    """
+    Generate (year, month, day) tuples for the Julian days from ``start_jd`` up to (not including) ``end_jd``.
+    ``from_jd`` is called for the first day and at the start of each year, and the
+    other days are counted forward with ``month_length``.
+
+    Arguments:
+        start_jd (float): first Julian day
+        end_jd (float): Julian day after the last one
+        from_jd (function): convert a Julian day to a (year, month, day) tuple
+        month_length (function): number of days in a year and month
+        months (function): the months of a year, in the order they occur
+    """
+    jd = start_jd
+
+    while jd < end_jd:
+        date = year, month, day = from_jd(jd)
+        order = months(year)
+        first = jd
+
+        for month in order[order.index(month) :]:
+            length = month_length(year, month)
+
+            while day <= length:
+                if jd >= end_jd:
+                    return
+
+                yield year, month, day
+                day += 1
+                jd += 1
+
+            day = 1
+
+        if jd == first:
+            # from_jd gave a day that month_length doesn't count, pass it through
+            yield date
+            jd += 1
+
+
+def _month_table(first_year, last_year, to_jdn, month_length, months):
+    '''
+    Lay out the months of the years from ``first_year`` to ``last_year`` (inclusive).
+    ``to_jdn`` is called once for the start of each year, and the other months are
+    counted forward with ``month_length``.
+
+    Returns:
+        tuple - int64 arrays of the year, month, julian day number of the first day
+        and length of each month, in the order they occur
+    '''
+    np = require_numpy()
+    rows = []
+    start = to_jdn(first_year, months(first_year)[0], 1)
+
+    for year in range(first_year, last_year + 1):
+        order = months(year)
+        next_year = to_jdn(year + 1, months(year + 1)[0], 1)
+
+        for month in order[:-1]:
+            length = month_length(year, month)
+            rows.append((year, month, start, length))
+            start += length
+
+        # The last month runs up to the next new year
+        rows.append((year, order[-1], start, next_year - start))
+        start = next_year
+
+    return tuple(np.array(column, dtype=np.int64) for column in zip(*rows))
+
+
+def to_jdn_array(years, months, days, to_jdn, month_length, month_order):
+    """
+    Convert arrays of dates to an int64 array of julian day numbers, for calendars
+    whose years must be laid out one at a time. The months of the years spanned by
+    the input are tabulated once, then every date is looked up in the table.
+
+    Arguments:
+        years, months, days (array_like): the dates, broadcast against each other
+        to_jdn (function): convert a (year, month, day) to a julian day number
+        month_length (function): number of days in a year and month
+        month_order (function): the months of a year, in the order they occur
+
+    Raises:
+        ValueError: if any of the months or days doesn't exist in the calendar.
+    """
+    np = require_numpy()
+    years, months, days = np.broadcast_arrays(*(np.asarray(x, dtype=np.int64) for x in (years, months, days)))
+
+    if years.size == 0:
+        return np.zeros(years.shape, dtype=np.int64)
+
+    first, last = int(years.min()), int(years.max())
+    table_years, table_months, starts, lengths = _month_table(first, last, to_jdn, month_length, month_order)
+
+    # Index the table by year and month number. Months that a year lacks keep a length of 0.
+    width = int(table_months.max()) + 1
+    index = np.full((last - first + 1) * width, -1, dtype=np.int64)
+    index[(table_years - first) * width + table_months] = np.arange(len(starts))
+
+    i = index[(years - first) * width + np.clip(months, 0, width - 1)]
+    length = np.where((i >= 0) & (months >= 0) & (months < width), lengths[i], 0)
+    illegal = (days < 1) | (days > length)
+    if illegal.any():
+        j = np.argmax(illegal)
+        raise ValueError("Month {} of {} doesn't have a day {}".format(months.flat[j], years.flat[j], days.flat[j]))
+
+    return starts[i] + days - 1
+
+
+def from_jdn_array(jdns, from_jdn, to_jdn, month_length, month_order):
+    """
+    Convert an array of julian day numbers to a tuple of (years, months, days) int64 arrays,
+    for calendars whose years must be laid out one at a time. ``from_jdn`` is called for
+    the first and last days, and the months in between are tabulated once.
+
+    Arguments:
+        jdns (array_like): julian day numbers
+        from_jdn (function): convert a julian day number to a (year, month, day) tuple
+        to_jdn (function): convert a (year, month, day) to a julian day number
+        month_length (function): number of days in a year and month
+        month_order (function): the months of a year, in the order they occur
+    """
+    np = require_numpy()
+    jdns = np.asarray(jdns, dtype=np.int64)
+
+    if jdns.size == 0:
+        return tuple(np.zeros(jdns.shape, dtype=np.int64) for _ in range(3))
+
+    first, last = from_jdn(int(jdns.min()))[0], from_jdn(int(jdns.max()))[0]
+    years, months, starts, _ = _month_table(first, last, to_jdn, month_length, month_order)
+    i = np.searchsorted(starts, jdns, side='right') - 1
+
+    return years[i], months[i], jdns - starts[i] + 1
+
+
 def nth_day_of_month(n, weekday, month, year):
     """
     Return (year, month, day) tuple that represents nth weekday of month in year.
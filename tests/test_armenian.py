@@ -6,16 +6,29 @@ from convertdate import julianday
 from convertdate.armenian import (
     _valid_date,
     from_gregorian,
+    from_gregorian_array,
     from_jd,
+    from_jd_array,
+    from_jdn,
+    from_jdn_array,
     from_julian,
     leap,
     month_length,
     to_gregorian,
+    to_gregorian_array,
     to_jd,
+    to_jd_array,
+    to_jdn,
+    to_jdn_array,
     to_julian,
     tostring,
 )
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import CalTestCase
 
 
@@ -121,3 +134,21 @@ class TestArmenian(CalTestCase):
 
     def testTostring(self):
         self.assertEqual('14 trē 1469', tostring(1469, 4, 14))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_array(self):
+        for method, start in ((None, 1922868), ("sarkawag", 2117212)):
+            jdns = list(range(start, 2600000, 97))
+            years, months, days = from_jdn_array(jdns, method=method)
+            dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+            self.assertEqual(dates, [from_jdn(j, method=method) for j in jdns])
+            self.assertEqual(to_jdn_array(years, months, days, method=method).tolist(), jdns)
+            self.assertEqual(from_jd_array([j + 0.2 for j in jdns], method=method)[2].tolist(), days.tolist())
+
+        self.assertEqual(to_jd_array(536, 13, 6, method="sarkawag").tolist(), to_jd(536, 13, 6, method="sarkawag"))
+        self.assertRaises(ValueError, to_jd_array, 535, 13, 6, method="sarkawag")
+        self.assertRaises(ValueError, to_jd_array, [1, 1], [1, 14], 1)
+        self.assertRaises(ValueError, from_jdn_array, [1922501])
+        self.assertEqual(from_gregorian_array([1084], [8], [17], method="sarkawag")[1].tolist(), [1])
+        self.assertEqual(to_gregorian_array(1469, 4, 14)[0].tolist(), to_gregorian(1469, 4, 14)[0])
+        self.assertEqual(to_jdn_array(1469, 4, 14).tolist(), to_jdn(1469, 4, 14))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from convertdate import astro
+
+
+class TestAstro(unittest.TestCase):
+    def setUp(self):
+        astro.cache_clear()
+
+    def tearDown(self):
+        astro.set_cache_size(astro.CACHE_SIZE)
+
+    def test_equinox_solstice(self):
+        self.assertAlmostEqual(astro.equinox_solstice(2000, 'spring'), 2451623.817, places=3)
+        self.assertAlmostEqual(astro.equinox_solstice(2000, 'autumn'), 2451810.228, places=3)
+        ut = astro.equinox_solstice(2000, 'spring', ut=True)
+        self.assertAlmostEqual((astro.equinox_solstice(2000, 'spring') - ut) * 86400, 64, places=0)
+        self.assertRaises(ValueError, astro.equinox_solstice, 2000, 'fall')
+
+    def test_sunset(self):
+        # Tehran, 20 March 2000
+        sunset = astro.sunset(2000, 3, 20, 35.6944, 51.4215)
+        self.assertTrue(2451623.5 < sunset < 2451624.5)
+
+    def test_cache(self):
+        astro.equinox_solstice(2020, 'spring')
+        astro.equinox_solstice(2020, 'spring')
+        astro.equinox_solstice(2020, 'spring', ut=True)
+        info = astro.cache_info()['equinox_solstice']
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+
+        astro.set_cache_size(1)
+        astro.equinox_solstice(2020, 'spring')
+        astro.equinox_solstice(2021, 'spring')
+        astro.equinox_solstice(2020, 'spring')
+        info = astro.cache_info()['equinox_solstice']
+        self.assertEqual(info.maxsize, 1)
+        self.assertEqual(info.misses, 3)
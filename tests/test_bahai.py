@@ -5,6 +5,11 @@ import unittest
 
 from convertdate import bahai, gregorian
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import CalTestCase
 
 
@@ -110,6 +115,19 @@ class TestBahai(CalTestCase):
             for gyear in gyears:
                 self.assertEqual((3, date), bahai.gregorian_nawruz(gyear))
 
+    def test_nawruz_table(self):
+        for gyear in (1844, 1900, 2015, 2016, 2059, 2843):
+            with self.subTest(gyear=gyear):
+                self.assertEqual(bahai.gregorian_nawruz(gyear), bahai._gregorian_nawruz_astro(gyear))
+
+    def test_from_jd_nawruz(self):
+        # Naw-Rúz on 20 March
+        self.assertEqual(bahai.from_gregorian(2016, 3, 20), (173, 1, 1))
+        self.assertEqual(bahai.from_gregorian(2016, 3, 19), (172, bahai.ALA, 19))
+        # Naw-Rúz on 21 March
+        self.assertEqual(bahai.from_gregorian(2015, 3, 21), (172, 1, 1))
+        self.assertEqual(bahai.from_gregorian(2015, 3, 20), (171, bahai.ALA, 19))
+
     def test_ayyam_i_ha(self):
         # source: https://www.bahai.us/events/holy-days/
         # years with four days in Ayyám-i-Há
@@ -205,3 +223,19 @@ class TestBahai(CalTestCase):
 
     def test_returntype(self):
         self.assertSequenceType(bahai.from_gregorian(2020, 6, 4), int)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_array(self):
+        jdns = list(range(2394646, 2500000, 97))
+        years, months, days = bahai.from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [bahai.from_jdn(j) for j in jdns])
+        self.assertEqual(bahai.to_jdn_array(years, months, days).tolist(), jdns)
+        self.assertEqual(bahai.from_jd_array([j - 0.5 for j in jdns])[1].tolist(), months.tolist())
+        self.assertEqual(bahai.to_jd_array(175, 19, 4).tolist(), bahai.to_jd(175, 19, 4))
+
+        years, months, days = bahai.to_gregorian_array(181, 1, 1)
+        self.assertEqual((years.tolist(), months.tolist(), days.tolist()), (2024, 3, 20))
+        self.assertEqual(bahai.from_gregorian_array([2024], [3], [20])[0].tolist(), [181])
+        self.assertRaises(ValueError, bahai.to_jdn_array, 175, 19, 5)
+        self.assertRaises(ValueError, bahai.to_jdn_array, 175, 21, 1)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from convertdate import gregorian, holidays
+from convertdate.business import BusinessCalendar, observed_since
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestBusiness(unittest.TestCase):
+    def setUp(self):
+        self.cal = BusinessCalendar()
+
+    def test_is_business_day(self):
+        self.assertTrue(self.cal.is_business_day(gregorian.to_jd(2023, 12, 22)))
+        self.assertFalse(self.cal.is_business_day(gregorian.to_jd(2023, 12, 23)))
+        self.assertFalse(self.cal.is_business_day(gregorian.to_jd(2023, 12, 25)))
+        # July 4, 2020 was a saturday
+        self.assertFalse(self.cal.is_business_day(gregorian.to_jd(2020, 7, 3)))
+        self.assertTrue(self.cal.is_business_day(gregorian.to_jd(2020, 7, 6)))
+        # New year's day 2022 was observed on friday, December 31, 2021
+        self.assertFalse(self.cal.is_business_day(gregorian.to_jd(2021, 12, 31)))
+        self.assertTrue(self.cal.is_business_day(gregorian.to_jd(2022, 1, 3)))
+        # Julian days are mapped to the day that contains them
+        self.assertTrue(self.cal.is_business_day(gregorian.to_jd(2023, 12, 22) + 0.9))
+
+    def test_federal_holidays(self):
+        # Martin Luther King Jr. day was first observed in 1986, Juneteenth in 2021
+        self.assertTrue(self.cal.is_business_day(gregorian.to_jd(1985, 1, 21)))
+        self.assertFalse(self.cal.is_business_day(gregorian.to_jd(1986, 1, 20)))
+        self.assertTrue(self.cal.is_business_day(gregorian.to_jd(2020, 6, 19)))
+        self.assertFalse(self.cal.is_business_day(gregorian.to_jd(2021, 6, 18)))
+
+    def test_add_business_days(self):
+        def add(date, days):
+            return gregorian.from_jd(self.cal.add_business_days(gregorian.to_jd(*date), days))
+
+        self.assertEqual(add((2023, 12, 22), 0), (2023, 12, 22))
+        self.assertEqual(add((2023, 12, 22), 1), (2023, 12, 26))
+        self.assertEqual(add((2023, 12, 22), 2), (2023, 12, 27))
+        self.assertEqual(add((2023, 12, 26), -1), (2023, 12, 22))
+        self.assertEqual(add((2023, 12, 23), 0), (2023, 12, 26))
+        self.assertEqual(add((2023, 12, 23), 1), (2023, 12, 27))
+        self.assertEqual(add((2023, 12, 23), -1), (2023, 12, 22))
+        self.assertEqual(add((2021, 12, 30), 1), (2022, 1, 3))
+        self.assertEqual(add((2022, 1, 3), -1), (2021, 12, 30))
+        self.assertEqual(add((2020, 1, 1), 250), (2020, 12, 30))
+        self.assertEqual(add((2020, 12, 31), -250), (2020, 1, 3))
+
+        start = gregorian.to_jd(2000, 1, 3)
+        jd = self.cal.add_business_days(start, 5000)
+        self.assertEqual(self.cal.business_days_between(start, jd), 5000)
+        self.assertEqual(self.cal.add_business_days(jd, -5000), start)
+
+    def test_next_previous(self):
+        jd = gregorian.to_jd(2023, 12, 22)
+        self.assertEqual(gregorian.from_jd(self.cal.next_business_day(jd)), (2023, 12, 26))
+        self.assertEqual(gregorian.from_jd(self.cal.next_business_day(jd - 1)), (2023, 12, 22))
+        self.assertEqual(gregorian.from_jd(self.cal.previous_business_day(jd + 4)), (2023, 12, 22))
+        self.assertEqual(gregorian.from_jd(self.cal.previous_business_day(jd + 1)), (2023, 12, 22))
+
+    def test_business_days_between(self):
+        jd1, jd2 = gregorian.to_jd(2023, 12, 22), gregorian.to_jd(2024, 1, 3)
+        # 22, 26, 27, 28, 29 December and 2 January
+        self.assertEqual(self.cal.business_days_between(jd1, jd2), 6)
+        self.assertEqual(self.cal.business_days_between(jd2, jd1), -6)
+        self.assertEqual(self.cal.business_days_between(jd1, jd1), 0)
+        year = self.cal.business_days_between(gregorian.to_jd(2019, 1, 1), gregorian.to_jd(2020, 1, 1))
+        # Juneteenth was first observed in 2021
+        self.assertEqual(year, 261 - 10)
+
+    def test_options(self):
+        cal = BusinessCalendar(holidays=[holidays.christmas], weekend=[holidays.FRI, holidays.SAT])
+        self.assertTrue(cal.is_business_day(gregorian.to_jd(2023, 12, 24)))
+        self.assertFalse(cal.is_business_day(gregorian.to_jd(2023, 12, 25)))
+        self.assertFalse(cal.is_business_day(gregorian.to_jd(2023, 12, 29)))
+
+        cal = BusinessCalendar(holidays=[observed_since(2021, holidays.juneteenth)])
+        self.assertTrue(cal.is_business_day(gregorian.to_jd(2020, 6, 19)))
+        self.assertFalse(cal.is_business_day(gregorian.to_jd(2023, 6, 19)))
+
+        self.assertRaises(ValueError, BusinessCalendar, weekend=range(7))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_arrays(self):
+        start = gregorian.to_jd(1990, 1, 1)
+        jd = start + numpy.arange(0, 20000, 7.3)
+        days = (numpy.arange(len(jd)) % 801) - 400
+
+        added = self.cal.add_business_days_array(jd, days)
+        self.assertEqual(added.tolist(), [self.cal.add_business_days(j, int(n)) for j, n in zip(jd, days)])
+
+        added = self.cal.add_business_days_array(jd, 3)
+        self.assertEqual(added.tolist(), [self.cal.add_business_days(j, 3) for j in jd])
+
+        following = self.cal.next_business_day_array(jd)
+        self.assertEqual(following.tolist(), [self.cal.next_business_day(j) for j in jd])
+
+        counts = self.cal.business_days_between_array(jd, jd[::-1])
+        self.assertEqual(counts.tolist(), [self.cal.business_days_between(a, b) for a, b in zip(jd, jd[::-1])])
+
+        open_ = self.cal.is_business_day_array(jd)
+        self.assertEqual(open_.tolist(), [self.cal.is_business_day(j) for j in jd])
+
+        self.assertEqual(self.cal.add_business_days_array([], 1).shape, (0,))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_numpy_busday(self):
+        # convertdate's julian day numbers are 2440588 days ahead of numpy's datetime64[D]
+        dates = [f(y) for y in range(1999, 2022) for f in self.cal.holidays]
+        jdn = numpy.array([gregorian.to_jdn(*d) for d in dates if d is not None])
+        busdaycal = numpy.busdaycalendar(holidays=(jdn - 2440588).astype('datetime64[D]'))
+
+        jd = gregorian.to_jd(2000, 1, 1) + numpy.arange(0, 7000, 3)
+        dates = (jd + 0.5 - 2440588).astype('datetime64[D]')
+        expected = numpy.busday_offset(dates, 10, roll='forward', busdaycal=busdaycal)
+        added = self.cal.add_business_days_array(jd, 10)
+        self.assertEqual((added + 0.5 - 2440588).astype('datetime64[D]').tolist(), expected.tolist())
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_busdaycalendar(self):
+        cal = BusinessCalendar(weekend=[holidays.FRI, holidays.SAT])
+        busdaycal = cal.busdaycalendar(1999, 2021)
+        self.assertEqual(busdaycal.weekmask.tolist(), [True, True, True, True, False, False, True])
+
+        jd = gregorian.to_jd(2000, 1, 1) + numpy.arange(0, 7000, 3)
+        dates = (jd + 0.5 - 2440588).astype('datetime64[D]')
+        expected = numpy.busday_offset(dates, -7, roll='forward', busdaycal=busdaycal)
+        added = cal.add_business_days_array(jd, -7)
+        self.assertEqual((added + 0.5 - 2440588).astype('datetime64[D]').tolist(), expected.tolist())
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import pickle
+import unittest
+from datetime import timedelta
+
+from convertdate import dates, french_republican, gregorian, hebrew, islamic, persian
+from convertdate.gregorian import GregorianDate
+from convertdate.hebrew import HebrewDate
+from convertdate.persian import PersianDate
+
+
+class TestDates(unittest.TestCase):
+    def test_jdn(self):
+        d = HebrewDate(5784, 7, 1)
+        self.assertIsNone(d._jdn)
+        self.assertEqual(d.jdn, hebrew.to_jdn(5784, 7, 1))
+        self.assertEqual(d._jdn, d.jdn)
+        self.assertEqual(d.jd, hebrew.to_jd(5784, 7, 1))
+        self.assertEqual(tuple(d), (5784, 7, 1))
+        self.assertEqual(HebrewDate.from_jd(d.jd), d)
+        self.assertEqual(HebrewDate.from_jdn(d.jdn), d)
+
+    def test_immutable(self):
+        d = GregorianDate(2000, 1, 1)
+        self.assertRaises(AttributeError, setattr, d, 'year', 2001)
+        self.assertRaises(AttributeError, delattr, d, 'year')
+        self.assertFalse(hasattr(d, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(d)), d)
+
+    def test_compare(self):
+        d = HebrewDate(5784, 7, 1)
+        g = d.to('gregorian')
+        self.assertEqual(g, GregorianDate(2023, 9, 16))
+        self.assertEqual(d, g)
+        self.assertEqual(len({d, g, d.to('islamic')}), 1)
+        self.assertLess(HebrewDate(5783, 6, 29), g)
+        self.assertGreater(GregorianDate(2023, 9, 17), d)
+        self.assertEqual(sorted([GregorianDate(2024, 1, 1), d]), [d, GregorianDate(2024, 1, 1)])
+        self.assertNotEqual(d, (5784, 7, 1))
+
+    def test_arithmetic(self):
+        d = HebrewDate(5783, 6, 29)
+        self.assertEqual(d + timedelta(days=1), HebrewDate(5784, 7, 1))
+        self.assertEqual(tuple(timedelta(days=1) + d), (5784, 7, 1))
+        self.assertEqual(tuple(d - timedelta(days=29)), hebrew.from_jdn(d.jdn - 29))
+        self.assertEqual(GregorianDate(2024, 3, 1) - GregorianDate(2024, 2, 1), timedelta(days=29))
+        self.assertEqual(GregorianDate(2023, 9, 16) - d, timedelta(days=1))
+
+    def test_method(self):
+        p = PersianDate(1403, 1, 1, method=33)
+        self.assertEqual(p.jdn, persian.to_jdn(1403, 1, 1, method=33))
+        self.assertEqual((p - timedelta(days=1)).method, 33)
+        self.assertEqual(repr(p), 'PersianDate(1403, 1, 1, method=33)')
+
+        f = p.to('french_republican', method='romme')
+        self.assertIsInstance(f, french_republican.FrenchRepublicanDate)
+        self.assertEqual(tuple(f), french_republican.from_jdn(p.jdn, method='romme'))
+
+    def test_to(self):
+        d = GregorianDate(2000, 1, 1)
+        self.assertEqual(tuple(d.to('islamic')), islamic.from_gregorian(2000, 1, 1))
+        self.assertIs(dates._date_class('gregorian'), gregorian.GregorianDate)
+        self.assertRaises(ValueError, d.to, 'klingon')
+        self.assertRaises(ValueError, d.to, 'mayan')
+
+    def test_subclass(self):
+        with self.assertRaises(TypeError):
+
+            class KlingonDate(dates.CalendarDate):
+                calendar = 'klingon'
+                _to_jdn = staticmethod(gregorian.to_jdn)
+
+        self.assertNotIn('klingon', dates._REGISTRY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+import convertdate
+from convertdate import dispatch, french_republican, gregorian, hebrew, islamic, persian
+
+
+class TestDispatch(unittest.TestCase):
+    def test_convert(self):
+        self.assertEqual(convertdate.convert((5784, 7, 1), src='hebrew', dst='persian'), (1402, 6, 25))
+        self.assertEqual(
+            dispatch.convert((5784, 7, 1), 'hebrew', 'gregorian'), gregorian.from_jd(hebrew.to_jd(5784, 7, 1))
+        )
+
+    def test_jd(self):
+        self.assertEqual(dispatch.convert(2451544.5, 'jd', 'islamic'), islamic.from_jd(2451544.5))
+        self.assertEqual(dispatch.convert((2000, 1, 1), 'gregorian', 'jd'), 2451544.5)
+        self.assertEqual(dispatch.convert(2451544.5, 'jd', 'jd'), 2451544.5)
+        self.assertEqual(dispatch.convert(0.5, 'dublin', 'gregorian'), (1900, 1, 1))
+
+    def test_options(self):
+        self.assertEqual(
+            dispatch.convert((20, 1, 1), 'french_republican', 'gregorian', method='romme'),
+            french_republican.to_gregorian(20, 1, 1, method='romme'),
+        )
+        self.assertEqual(
+            dispatch.convert(
+                (20, 1, 1), 'french_republican', 'persian', src_opts={'method': 'romme'}, dst_opts={'method': 33}
+            ),
+            persian.from_jd(french_republican.to_jd(20, 1, 1, method='romme'), method=33),
+        )
+        self.assertRaises(TypeError, dispatch.convert, (2000, 1, 1), 'gregorian', 'julian', method='romme')
+        self.assertRaises(ValueError, dispatch.convert, (2000, 1, 1), 'gregorian', 'klingon')
+
+    def test_convert_many(self):
+        dates = [(1, 1, 1), (2, 1, 1), (3, 13, 6)]
+        result = convertdate.convert_many(dates, src='french_republican', dst='gregorian', method='romme')
+        self.assertEqual(list(result), [french_republican.to_gregorian(*d, method='romme') for d in dates])
+
+    def test_plan_cache(self):
+        dispatch.plan.cache_clear()
+        dispatch.convert((2000, 1, 1), 'gregorian', 'hebrew')
+        dispatch.convert((2000, 1, 2), 'gregorian', 'hebrew')
+        self.assertEqual(dispatch.plan.cache_info().hits, 1)
@@ -5,6 +5,11 @@ import unittest
 from convertdate import french_republican as fr
 from convertdate import gregorian
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 year_starts = [
     ((1, 1, 1), (1792, 9, 22)),
     ((2, 1, 1), (1793, 9, 22)),
@@ -142,6 +147,13 @@ class TestFrenchRepublican(unittest.TestCase):
 
         self.assertRaises(ValueError, fr.leap, 100, method='foo')
 
+    def test_month_length(self):
+        self.assertEqual(fr.month_length(3, 12), 30)
+        self.assertEqual(fr.month_length(3, 13), 6)
+        self.assertEqual(fr.month_length(4, 13), 5)
+        self.assertEqual(fr.month_length(20, 13, method='continuous'), 5)
+        self.assertRaises(ValueError, fr.month_length, 4, 14)
+
     def test_french_republican_decade(self):
         self.assertEqual(fr.decade(1), 1)
 
@@ -298,6 +310,18 @@ class TestFrenchRepublican(unittest.TestCase):
         self.assertEqual(fr.premier_da_la_annee(e1 - 10), e0)
         self.assertEqual(fr.premier_da_la_annee(e1 + 100), e1)
 
+    def test_year_start(self):
+        for (an, _, _), gdate in year_starts:
+            self.assertEqual(fr.year_start(an), gregorian.to_jdn(*gdate))
+
+        fr.year_start.cache_clear()
+        fr.from_gregorian(2020, 1, 1)
+        fr.from_gregorian(2020, 1, 2)
+        self.assertGreater(fr.year_start.cache_info().hits, 0)
+
+        for an in range(1, 400, 7):
+            self.assertEqual(fr.year_start(an) - 0.5, fr.premier_da_la_annee(fr.year_start(an) + 20))
+
     def test_french_republican_months(self):
         self.assertEqual(fr.MOIS[0], "Vendémiaire")
         self.assertEqual(fr.MOIS[1], "Brumaire")
@@ -323,3 +347,52 @@ class TestFrenchRepublican(unittest.TestCase):
         self.assertEqual(fr.day_name(4, 18), "Pierre à chaux")
         self.assertEqual(fr.day_name(12, 15), "Truite")
         self.assertEqual(fr.day_name(13, 1), "La Fête de la Vertu")
+
+    def test_french_republican_schematic_leap(self):
+        self.assertFalse(fr.leap(100, 'romme'))
+        self.assertTrue(fr.leap(112, 'romme'))
+        self.assertTrue(fr.leap(400, 'romme'))
+        self.assertFalse(fr.leap(128, 'madler'))
+        self.assertTrue(fr.leap(144, 'madler'))
+
+        for year, method in ((100, 'romme'), (128, 'madler')):
+            self.assertRaises(ValueError, fr.to_jd, year, 13, 6, method=method)
+            jd = fr.to_jd(year, 13, 5, method=method)
+            self.assertEqual(fr.from_jd(jd + 1, method=method), (year + 1, 1, 1))
+
+        for year, method in ((112, 'romme'), (144, 'madler'), (400, 'romme')):
+            jd = fr.to_jd(year, 13, 6, method=method)
+            self.assertEqual(fr.from_jd(jd, method=method), (year, 13, 6))
+            self.assertEqual(fr.from_jd(jd + 1, method=method), (year + 1, 1, 1))
+
+        for method in ('continuous', 'romme', 'madler'):
+            for year in range(1, 2000):
+                length = fr.to_jd(year + 1, 1, 1, method=method) - fr.to_jd(year, 1, 1, method=method)
+                self.assertEqual(length, 365 + fr.leap(year, method), (method, year))
+
+    def test_french_republican_iter_days(self):
+        for method in ('continuous', 'romme', 'madler'):
+            for year in range(15, 1300):
+                start = fr.to_jd(year, 12, 29, method=method)
+                days = list(fr.iter_days(start, start + 10, method=method))
+                self.assertEqual(days, [fr.from_jd(start + i, method=method) for i in range(10)], (method, year))
+                self.assertEqual(days.count((year, 13, 6)), fr.leap(year, method))
+
+        start, end = fr.to_jd(100, 1, 1, method='romme'), fr.to_jd(500, 1, 1, method='romme')
+        days = list(fr.iter_days(start, end, method='romme'))
+        self.assertEqual(days, [fr.from_jd(start + i, method='romme') for i in range(int(end - start))])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_french_republican_array(self):
+        for method, end in ((None, 2450000), ('continuous', 3000000), ('romme', 3000000), ('madler', 3000000)):
+            jdns = list(range(fr.EPOCH_JDN, end, 883))
+            years, months, days = fr.from_jdn_array(jdns, method=method)
+            dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+            self.assertEqual(dates, [fr.from_jdn(j, method=method) for j in jdns], method)
+            self.assertEqual(fr.to_jdn_array(years, months, days, method=method).tolist(), jdns)
+            self.assertEqual(fr.from_jd_array([j - 0.5 for j in jdns], method=method)[2].tolist(), days.tolist())
+
+        self.assertEqual(fr.to_jd_array(3, 13, 6, method='romme').tolist(), fr.to_jd(3, 13, 6, method='romme'))
+        self.assertRaises(ValueError, fr.to_jd_array, [3, 100], 13, 6, method='romme')
+        self.assertEqual(fr.from_gregorian_array(1792, 9, 22)[0].tolist(), 1)
+        self.assertEqual(fr.to_gregorian_array([2], [1], [1])[0].tolist(), [1793])
@@ -1,8 +1,38 @@
 # -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
 import time
+import unittest
 from datetime import datetime, timezone
 
-from convertdate import coptic, dublin, gregorian, hebrew, islamic, iso, julian, julianday, ordinal, persian, utils
+import convertdate
+from convertdate import (
+    armenian,
+    bahai,
+    coptic,
+    dublin,
+    french_republican,
+    gregorian,
+    hebrew,
+    holidays,
+    indian_civil,
+    islamic,
+    iso,
+    julian,
+    julianday,
+    mayan,
+    ordinal,
+    persian,
+    positivist,
+    umalqura,
+    utils,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from . import CalTestCase
 
@@ -39,6 +69,31 @@ class TestConvertdate(CalTestCase):
         am = hebrew.to_jd(1, hebrew.TISHRI, 1)
         self.assertEqual(julian.from_jd(am), (-3760, 10, 7))
 
+    def test_hebrew_year_structure(self):
+        new_year, days, lengths, offsets, starts = hebrew.year_structure(5784)
+        self.assertEqual(new_year, hebrew.to_jdn(5784, hebrew.TISHRI, 1))
+        self.assertEqual(days, 383)
+        self.assertEqual(days, sum(lengths))
+        self.assertEqual(offsets[hebrew.TISHRI - 1], 0)
+        self.assertEqual(offsets[hebrew.NISAN - 1], sum(lengths[hebrew.TISHRI - 1 :]))
+        self.assertEqual(starts, tuple(offsets[m - 1] for m in hebrew.MONTH_ORDER_LEAP))
+        self.assertEqual(hebrew.year_days(5783), 355)
+        self.assertEqual(hebrew.month_length(5783, hebrew.HESHVAN), 30)
+        self.assertEqual(hebrew.month_length(5785, hebrew.KISLEV), 30)
+        self.assertRaises(ValueError, hebrew.month_length, 5784, 14)
+
+        hebrew.year_structure.cache_clear()
+        hebrew.from_gregorian(2024, 1, 1)
+        hebrew.from_gregorian(2024, 1, 2)
+        self.assertGreater(hebrew.year_structure.cache_info().hits, 0)
+
+    def test_hebrew_from_jd_new_year(self):
+        # days around the new year, including years with postponements
+        for year in (5700, 5701, 5782, 5783, 5784, 5785):
+            jd = hebrew.to_jd(year, hebrew.TISHRI, 1)
+            self.assertEqual(hebrew.from_jd(jd), (year, hebrew.TISHRI, 1))
+            self.assertEqual(hebrew.from_jd(jd - 1), (year - 1, hebrew.ELUL, 29))
+
     def test_islamic(self):
         self.assertEqual(self.jd, islamic.to_jd(*islamic.from_jd(self.jd)))
         self.reflexive(islamic)
@@ -149,3 +204,108 @@ class TestConvertdate(CalTestCase):
         self.assertSequenceType(iso.from_gregorian(2020, 6, 4), int)
         self.assertSequenceType(julian.from_gregorian(2020, 6, 4), int)
         self.assertSequenceType(persian.from_gregorian(2020, 6, 4), int)
+
+    def test_jdn(self):
+        modules = (
+            armenian,
+            bahai,
+            coptic,
+            french_republican,
+            gregorian,
+            hebrew,
+            indian_civil,
+            islamic,
+            julian,
+            mayan,
+            persian,
+            positivist,
+            umalqura,
+        )
+        for module in modules:
+            for jdn in range(2400000, 2500000, 997):
+                date = module.from_jdn(jdn)
+                self.assertEqual(date, module.from_jd(jdn - 0.5))
+                self.assertSequenceType(date, int)
+                self.assertEqual(module.to_jdn(*date), jdn)
+                self.assertIsInstance(module.to_jdn(*date), int)
+
+        self.assertEqual(iso.to_jdn(2020, 1, 1), gregorian.to_jdn(2019, 12, 30))
+        self.assertEqual(iso.from_jdn(gregorian.to_jdn(2021, 1, 3)), (2020, 53, 7))
+        self.assertEqual(ordinal.from_jdn(ordinal.to_jdn(2020, 366)), (2020, 366))
+
+    def test_hebrew_occurrences(self):
+        start, end = gregorian.to_jd(2000, 1, 1), gregorian.to_jd(2020, 1, 1)
+        passovers = hebrew.occurrences(hebrew.NISAN, 15, start, end)
+        self.assertEqual([gregorian.from_jd(jd) for jd in passovers], [holidays.passover(y) for y in range(2000, 2020)])
+
+        # Veadar only occurs in leap years
+        purims = hebrew.occurrences(hebrew.VEADAR, 14, start, end)
+        self.assertEqual([gregorian.from_jd(jd)[0] for jd in purims], [2000, 2003, 2005, 2008, 2011, 2014, 2016, 2019])
+        expected = [hebrew.to_jd(y, hebrew.HESHVAN, 30) for y in range(5761, 5781) if hebrew.month_length(y, 8) == 30]
+        self.assertEqual(hebrew.occurrences(hebrew.HESHVAN, 30, start, end), expected)
+
+    def test_iter_days(self):
+        start, end = gregorian.to_jd(1990, 1, 1), gregorian.to_jd(2010, 1, 1)
+        modules = (bahai, coptic, gregorian, hebrew, indian_civil, islamic, julian, positivist, umalqura)
+        cases = [(m, {}) for m in modules] + [
+            (armenian, {'method': 'sarkawag'}),
+            (french_republican, {}),
+            (persian, {}),
+            (persian, {'method': 33}),
+        ]
+        for module, options in cases:
+            days = list(module.iter_days(start, end, **options))
+            self.assertEqual(days, [module.from_jd(start + i, **options) for i in range(int(end - start))])
+
+        self.assertEqual(list(hebrew.iter_days(2460202.5, 2460204.5)), [(5783, 6, 29), (5784, 7, 1)])
+
+    def test_hebrew_negative_jd(self):
+        for jd in (-5000.5, -1.5, -0.5, 0.5):
+            self.assertEqual(hebrew.to_jd(*hebrew.from_jd(jd)), jd)
+
+    def test_lazy_import(self):
+        code = (
+            "import sys, convertdate; from convertdate import gregorian, julian; "
+            "assert 'pymeeus' not in sys.modules, 'pymeeus'; "
+            "assert 'convertdate.hebrew' not in sys.modules, 'hebrew'; "
+            "assert convertdate.hebrew.to_jd(5776, 7, 1) == 2457279.5; "
+            "assert 'convertdate.hebrew' in sys.modules"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        proc = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=False)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+
+    def test_module_attributes(self):
+        self.assertIn('persian', dir(convertdate))
+        self.assertIs(convertdate.persian, persian)
+        self.assertRaises(AttributeError, getattr, convertdate, 'klingon')
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_hebrew_array(self):
+        jdns = list(range(-5000, 2600000, 997)) + [2460202, 2460203]
+        years, months, days = hebrew.from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [hebrew.from_jdn(j) for j in jdns])
+        self.assertEqual(hebrew.to_jdn_array(years, months, days).tolist(), jdns)
+        self.assertEqual(hebrew.to_jd_array(years, months, days).tolist(), [hebrew.to_jd(*d) for d in dates])
+        self.assertEqual(hebrew.from_jd_array([2460202.5, 2460203.5])[1].tolist(), [6, 7])
+
+        years, months, days = hebrew.to_gregorian_array([5784, 5784], [7, 13], [1, 1])
+        self.assertEqual(list(zip(years.tolist(), months.tolist(), days.tolist())), [(2023, 9, 16), (2024, 3, 11)])
+        self.assertEqual(hebrew.from_gregorian_array(2024, 3, 11)[1].tolist(), 13)
+
+        # 5783 is a common year, and Heshvan 5784 has 29 days
+        self.assertRaises(ValueError, hebrew.to_jdn_array, [5784, 5783], [13, 13], [1, 1])
+        self.assertRaises(ValueError, hebrew.to_jdn_array, [5784], [8], [30])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_coptic_array(self):
+        jdns = list(range(1000000, 2600000, 997)) + [2284878, 2284879]
+        years, months, days = coptic.from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [coptic.from_jdn(j) for j in jdns])
+        self.assertEqual(coptic.to_jdn_array(years, months, days).tolist(), jdns)
+        self.assertEqual(coptic.to_jd_array(1259, 13, [5, 6]).tolist(), [2284877.5, 2284878.5])
+        self.assertEqual(coptic.from_jd_array([2437970.5])[2].tolist(), [23])
+        self.assertEqual(coptic.from_gregorian_array(2017, 1, 7)[1].tolist(), 4)
+        self.assertEqual(coptic.to_gregorian_array(1727, 11, 11)[2].tolist(), 18)
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 import time
+import unittest
 
 from convertdate import gregorian, julian
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import CalTestCase
 
 
@@ -98,3 +104,29 @@ class TestGregorian(CalTestCase):
         self.assertRaises(ValueError, gregorian.to_jd, 2014, 3, 32)
         self.assertRaises(ValueError, gregorian.to_jd, 2014, 4, 31)
         self.assertRaises(ValueError, gregorian.to_jd, 2014, 5, -1)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_to_jd_array(self):
+        dates = [gregorian.from_jd(j + 0.5) for j in self.jdcs] + [(-1000, 1, 1), (0, 12, 31), (2000, 2, 29)]
+        years, months, days = zip(*dates)
+        expected = [gregorian.to_jd(*d) for d in dates]
+        self.assertEqual(gregorian.to_jd_array(years, months, days).tolist(), expected)
+        self.assertEqual(gregorian.to_jd_array(2000, [1, 3], 1).tolist(), [2451544.5, 2451604.5])
+
+        self.assertRaises(ValueError, gregorian.to_jd_array, [2014, 1900], [2, 2], [28, 29])
+        self.assertRaises(ValueError, gregorian.to_jd_array, [2014], [13], [1])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_from_jd_array(self):
+        jds = [j + 0.5 for j in self.jdcs] + list(range(113957, 1574957, 365)) + [2418934.0, 2456967.5]
+        years, months, days = gregorian.from_jd_array(jds)
+        self.assertEqual(list(zip(years.tolist(), months.tolist(), days.tolist())), [gregorian.from_jd(j) for j in jds])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_jdn_array(self):
+        jdns = numpy.arange(2159677, 2488395, 97, dtype=numpy.int32)
+        years, months, days = gregorian.from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [gregorian.from_jdn(j) for j in jdns.tolist()])
+        self.assertEqual(gregorian.to_jdn_array(years, months, days).tolist(), jdns.tolist())
+        self.assertEqual(gregorian.to_jdn_array(years, months, days).dtype, numpy.int64)
@@ -2,7 +2,12 @@
 import unittest
 from datetime import datetime
 
-from convertdate import holidays, julian
+from convertdate import gregorian, holidays, julian
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestHolidays(unittest.TestCase):
@@ -42,6 +47,67 @@ class TestHolidays(unittest.TestCase):
         h.set_year(2010)
         assert h.year == 2010
 
+        h.year = 2014
+        self.assertEqual(h.christmas, (2014, 12, 25))
+        self.assertIs(h.thanksgiving, h.thanksgiving)
+        h.set_year(2015)
+        self.assertEqual(h.christmas, (2015, 12, 25))
+        h.year = 2016
+        self.assertEqual(h.christmas, (2016, 12, 26))
+
+    def test_table(self):
+        table = holidays.Holidays.table(2014, 2016)
+        self.assertIn('christmas', holidays.Holidays.names())
+        self.assertNotIn('year', holidays.Holidays.names())
+
+        christmas = gregorian.to_jd(2015, 12, 25)
+        self.assertTrue(table.is_holiday(christmas))
+        self.assertIn(christmas + 0.25, table)
+        self.assertEqual(table.holidays_on(christmas), ('christmas',))
+        self.assertFalse(table.is_holiday(christmas + 2))
+        self.assertEqual(table.holidays_on(christmas + 2), ())
+        self.assertFalse(table.is_holiday(gregorian.to_jd(2013, 12, 25)))
+
+        # July 4, 2015 was a saturday, so independence day was observed on friday
+        self.assertEqual(
+            table.between(gregorian.to_jd(2015, 7, 1), gregorian.to_jd(2015, 7, 4)),
+            [(gregorian.to_jd(2015, 7, 3), ('independence_day',))],
+        )
+        found = table.between(gregorian.to_jd(2014, 1, 1), gregorian.to_jd(2016, 12, 31))
+        self.assertEqual(len(found), len(table))
+        self.assertEqual([jd for jd, _ in found], sorted(jd for jd, _ in found))
+
+        for year in (2014, 2015, 2016):
+            h = holidays.Holidays(year)
+            for name in holidays.Holidays.names():
+                self.assertIn(name, table.holidays_on(gregorian.to_jd(*getattr(h, name))))
+
+        some = holidays.Holidays.table(2015, 2015, names=['passover', 'easter'])
+        self.assertEqual(len(some), 2)
+        self.assertEqual(some.holidays_on(gregorian.to_jd(2015, 4, 5)), ('easter',))
+
+        self.assertRaises(ValueError, holidays.Holidays.table, 2015, 2015, names=['boxing_day'])
+
+    def test_table_lunar(self):
+        # ramadan(2000) is December 9, 1999. Ramadan began in 2000 on November 28
+        table = holidays.Holidays.table(2000, 2000, names=['ramadan'])
+        self.assertEqual(table.between(0, 3e6), [(gregorian.to_jd(2000, 11, 28), ('ramadan',))])
+
+        table = holidays.Holidays.table(1990, 2040, names=['ramadan', 'eid_alfitr', 'purim', 'tisha_bav'])
+        for name in ('ramadan', 'eid_alfitr'):
+            expected = [gregorian.to_jd(*date) for date, n in holidays.iter_islamic_holidays(1990, 2040) if n == name]
+            self.assertEqual([jd for jd, names in table.between(0, 3e6) if name in names], expected)
+
+        for year in range(1990, 2041):
+            h = holidays.Holidays(year)
+            self.assertIn('purim', table.holidays_on(gregorian.to_jd(*h.purim)))
+            self.assertIn('tisha_bav', table.holidays_on(gregorian.to_jd(*h.tisha_bav)))
+
+        # New year's day 2022 was observed on December 31, 2021
+        table = holidays.Holidays.table(2021, 2021, names=['new_years'])
+        self.assertEqual(len(table), 2)
+        self.assertTrue(table.is_holiday(gregorian.to_jd(2021, 12, 31)))
+
     def test_events(self):
         assert holidays.new_years(2013) == (2013, 1, 1)
         assert holidays.martin_luther_king_day(2015) == (2015, 1, 19)
@@ -260,6 +326,30 @@ class TestHolidays(unittest.TestCase):
         assert self.h.lag_baomer == (2015, 5, 7)
         assert self.h.tu_beshvat == (2015, 2, 4)
 
+    def test_jewish_holidays_batch(self):
+        for year in range(1900, 2100):
+            for eve in (False, True):
+                result = holidays.jewish_holidays(year, eve=eve)
+                self.assertEqual(list(result), [name for name, _, _ in holidays.JEWISH_HOLIDAYS])
+                for name, date in result.items():
+                    self.assertEqual(date, getattr(holidays, name)(year, eve=eve), (year, name, eve))
+
+        self.assertEqual(holidays.jewish_holidays(2016)['purim'], (2016, 3, 24))
+        self.assertEqual(holidays.jewish_holidays(2015, eve=True)['passover'], (2015, 4, 3))
+
+        table = holidays.jewish_holidays_range(2019, 2023)
+        self.assertEqual(list(table), [2019, 2020, 2021, 2022, 2023])
+        self.assertEqual(
+            [table[y]['tisha_bav'] for y in table],
+            [
+                (2019, 8, 11),
+                (2020, 7, 30),
+                (2021, 7, 18),
+                (2022, 8, 7),
+                (2023, 7, 27),
+            ],
+        )
+
     def test_mexican_holidays(self):
         self.assertEqual(holidays.natalicio_benito_juarez(2015, False), (2015, 3, 21))
         self.assertEqual(holidays.natalicio_benito_juarez(2015), (2015, 3, 16))
@@ -282,6 +372,61 @@ class TestHolidays(unittest.TestCase):
         assert self.h.veterans_day == (2015, 11, 11)
         assert self.h.martin_luther_king_day == (2015, 1, 19)
 
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_easter_array(self):
+        years = numpy.arange(1, 4000)
+        for church in ('western', 'orthodox', 'eastern'):
+            dates = holidays.easter_array(years, church)
+            expected = [holidays.easter(y, church) for y in range(1, 4000)]
+            self.assertEqual(list(zip(*(x.tolist() for x in dates))), expected)
+
+            jds = holidays.easter_jd_array(years, church)
+            self.assertEqual(jds[2018], gregorian.to_jd(*holidays.easter(2019, church)))
+
+        years, months, days = holidays.easter_array([2019, 2020])
+        self.assertEqual(months.tolist(), [4, 4])
+        self.assertEqual(days.tolist(), [21, 12])
+        self.assertRaises(ValueError, holidays.easter_array, [2019], 'coptic')
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_holiday_array(self):
+        names = holidays.Holidays.names()
+        days = holidays.holiday_array(1938, 2042, names)
+        self.assertEqual(days.dtype, numpy.dtype('datetime64[D]'))
+        self.assertEqual(days.tolist(), sorted(set(days.tolist())))
+
+        table = holidays.Holidays.table(1938, 2042)
+        expected = [jd + 0.5 - holidays.DATETIME64_EPOCH_JDN for jd, _ in table.between(0, 3e6)]
+        self.assertEqual(days.astype('int64').tolist(), expected)
+
+        # Ramadan began twice in 2000 and 2033
+        days = holidays.holiday_array(1990, 2040, ['ramadan'])
+        expected = [date for date, name in holidays.iter_islamic_holidays(1990, 2040) if name == 'ramadan']
+        self.assertEqual(len(days), 53)
+        self.assertEqual([(d.year, d.month, d.day) for d in days.tolist()], expected)
+        self.assertIn(numpy.datetime64('2000-11-28'), days)
+        self.assertIn(numpy.datetime64('2033-11-23'), days)
+
+        # New year's day 2022 was observed on December 31, 2021
+        days = holidays.holiday_array(2021, 2021, names=['new_years', 'passover'])
+        expected = numpy.array(['2021-01-01', '2021-03-28', '2021-12-31'], dtype='datetime64[D]')
+        self.assertEqual(days.tolist(), expected.tolist())
+
+        self.assertEqual(len(holidays.holiday_array(2021, 2021, names=[])), 0)
+        self.assertRaises(ValueError, holidays.holiday_array, 2021, 2021, names=['boxing_day'])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_busdaycalendar(self):
+        busdaycal = holidays.busdaycalendar(2023, 2024, names=['christmas', 'new_years'])
+        self.assertEqual(
+            numpy.busday_offset(numpy.datetime64('2023-12-22'), 2, busdaycal=busdaycal),
+            numpy.datetime64('2023-12-27'),
+        )
+        self.assertEqual(
+            numpy.busday_count(numpy.datetime64('2023-12-22'), numpy.datetime64('2024-01-03'), busdaycal=busdaycal),
+            6,
+        )
+
     def test_usa_holidays_observed(self):
         self.assertSequenceEqual(holidays.independence_day(2015), (2015, 7, 4))
         assert holidays.independence_day(2015, True) == (2015, 7, 3)
@@ -290,6 +435,8 @@ class TestHolidays(unittest.TestCase):
         assert holidays.washingtons_birthday(2020, True) == (2020, 2, 17)
         assert holidays.new_years(2022, True) == (2021, 12, 31)
         self.assertSequenceEqual(holidays.christmas(2021, True), (2021, 12, 24))
+        assert holidays.juneteenth(2022, True) == (2022, 6, 20)
+        assert holidays.juneteenth(2021, True) == (2021, 6, 18)
 
     def test_deprecated_columbus_day(self):
         with self.assertRaises(DeprecationWarning):
@@ -315,3 +462,24 @@ class TestHolidays(unittest.TestCase):
         with self.subTest():
             for name, date in holidays_2021.items():
                 self.assertEqual(getattr(h21, name), date, name)
+
+        self.assertEqual(holidays.ramadan(2021, eve=True), (2021, 4, 12))
+        self.assertEqual(holidays.eid_aladha(2021, eve=True), (2021, 7, 19))
+
+    def test_iter_islamic_holidays(self):
+        found = list(holidays.iter_islamic_holidays(2000, 2001))
+        self.assertEqual(found[:2], [((2000, 1, 8), 'eid_alfitr'), ((2000, 3, 16), 'eid_aladha')])
+        # Eid al-Fitr fell twice in 2000
+        alfitr = [d for d, name in found if name == 'eid_alfitr']
+        self.assertEqual(alfitr, [(2000, 1, 8), (2000, 12, 28), (2001, 12, 17)])
+        self.assertEqual(found, sorted(found))
+
+        found = set(holidays.iter_islamic_holidays(1990, 2040))
+        for year in range(1990, 2041):
+            for name, _, _ in holidays.ISLAMIC_HOLIDAYS:
+                date = getattr(holidays, name)(year)
+                if date[0] == year:
+                    self.assertIn((date, name), found)
+
+        eves = list(holidays.iter_islamic_holidays(2000, 2001, eve=True))
+        self.assertEqual(eves[:2], [((2000, 1, 7), 'eid_alfitr'), ((2000, 3, 15), 'eid_aladha')])
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 import time
+import unittest
 
 from convertdate import gregorian, indian_civil
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import CalTestCase
 
 
@@ -40,8 +46,44 @@ class TestConvertdate(CalTestCase):
     def test_month_length_indian_civil(self):
         self.assertEqual(indian_civil.month_length(1922, 1), 31)
         self.assertEqual(indian_civil.month_length(1923, 1), 30)
+        self.assertEqual(indian_civil.month_length(1822, 1), 30)
+        self.assertEqual(indian_civil.month_length(1878, 1), 31)
 
     def test_monthcalendar_indian_civil(self):
         self.assertEqual(indian_civil.monthcalendar(1936, 8).pop(0).pop(4), 1)
         self.assertEqual(indian_civil.monthcalendar(1927, 2).pop(0).pop(4), 1)
         self.assertEqual(indian_civil.monthcalendar(1922, 1).pop().pop(4), 31)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_jd_array(self):
+        jds = list(range(-1763, 2600000, 997)) + [self.c, self.x, 1.5, -1.5, 2451544.9]
+        years, months, days = indian_civil.from_jd_array(jds)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [indian_civil.from_jd(j) for j in jds])
+        jds = indian_civil.to_jd_array(years, months, days)
+        self.assertEqual(jds.tolist(), [indian_civil.to_jd(*d) for d in dates])
+        self.assertEqual(indian_civil.to_jdn_array(years, months, days).dtype, numpy.int64)
+
+        jdns = numpy.arange(2159677, 2488395, 7)
+        years, months, days = indian_civil.from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [indian_civil.from_jdn(j) for j in jdns.tolist()])
+        self.assertEqual(indian_civil.to_jdn_array(years, months, days).tolist(), jdns.tolist())
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_gregorian_array(self):
+        years, months, days = indian_civil.from_gregorian_array([2016, 2016, 2017], [2, 3, 1], [29, 21, 1])
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [indian_civil.from_gregorian(*d) for d in [(2016, 2, 29), (2016, 3, 21), (2017, 1, 1)]])
+
+        years, months, days = indian_civil.to_gregorian_array(1938, numpy.arange(1, 13), 1)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [indian_civil.to_gregorian(1938, m, 1) for m in range(1, 13)])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_month_length_array(self):
+        years = numpy.arange(1800, 2000)
+        lengths = indian_civil.month_length_array(years[:, None], numpy.arange(1, 13))
+        expected = [[indian_civil.month_length(y, m) for m in range(1, 13)] for y in years.tolist()]
+        self.assertEqual(lengths.tolist(), expected)
+        self.assertEqual(indian_civil.month_length_array([1922, 1923], 1).tolist(), [31, 30])
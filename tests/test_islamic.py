@@ -0,0 +1,120 @@
+import unittest
+
+from convertdate import convert, gregorian, islamic
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import CalTestCase
+
+
+class TestIslamic(CalTestCase):
+    def test_reflexive(self):
+        self.reflexive(islamic)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_jd_array(self):
+        jds = list(range(1900000, 2600000, 997)) + [1948439.5, 1948439.0, 1948085.5, 1948084.5, 2459000.9]
+        years, months, days = islamic.from_jd_array(jds)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [islamic.from_jd(j) for j in jds])
+        self.assertEqual(islamic.to_jd_array(years, months, days).tolist(), [islamic.to_jd(*d) for d in dates])
+        self.assertEqual(islamic.to_jdn_array(years, months, days).tolist(), [islamic.to_jdn(*d) for d in dates])
+        self.assertEqual(islamic.to_jdn_array(years, months, days).dtype, numpy.int64)
+
+        jdns = numpy.arange(1900000, 2600000, 13)
+        years, months, days = islamic.from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [islamic.from_jdn(j) for j in jdns.tolist()])
+        self.assertEqual(islamic.to_jdn_array(years, months, days).tolist(), jdns.tolist())
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_gregorian_array(self):
+        years, months, days = islamic.from_gregorian_array([2021, 2023], [4, 3], [13, 23])
+        self.assertEqual(list(zip(years.tolist(), months.tolist(), days.tolist())), [(1442, 9, 1), (1444, 9, 1)])
+
+        dates = [(y, 9, 1) for y in range(1300, 1500)]
+        years, months, days = islamic.to_gregorian_array(*zip(*dates))
+        converted = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(converted, [islamic.to_gregorian(*d) for d in dates])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_leap_month_length_array(self):
+        years = numpy.arange(-100, 1600)
+        self.assertEqual(islamic.leap_array(years).tolist(), [islamic.leap(y) for y in years.tolist()])
+
+        lengths = islamic.month_length_array(years[:, None], numpy.arange(1, 13))
+        self.assertEqual(lengths.shape, (len(years), 12))
+        self.assertEqual(lengths.tolist(), [[islamic.month_length(y, m) for m in range(1, 13)] for y in years.tolist()])
+        self.assertEqual(lengths.sum(axis=1).tolist(), [355 if islamic.leap(y) else 354 for y in years.tolist()])
+
+    def test_schemes(self):
+        for scheme, leap_years in [
+            ('Ic', [2, 5, 7, 10, 13, 15, 18, 21, 24, 26, 29]),
+            ('IIc', [2, 5, 7, 10, 13, 16, 18, 21, 24, 26, 29]),
+            ('IIIa', [2, 5, 8, 10, 13, 16, 19, 21, 24, 27, 29]),
+            ('IVc', [2, 5, 8, 11, 13, 16, 19, 21, 24, 27, 30]),
+        ]:
+            self.assertEqual([y for y in range(1441, 1471) if islamic.leap(y, scheme)], [y + 1440 for y in leap_years])
+
+        self.assertEqual(islamic.from_gregorian(2024, 7, 7), (1445, 12, 30))
+        self.assertEqual(islamic.from_gregorian(2024, 7, 7, scheme='IIc'), (1445, 12, 30))
+        self.assertEqual(islamic.from_gregorian(2024, 7, 7, scheme='IIa'), (1446, 1, 1))
+        self.assertEqual(islamic.to_jd(1, 1, 1, scheme='Ic'), islamic.EPOCH)
+        self.assertEqual(islamic.to_jd(1, 1, 1, scheme='IVa'), islamic.EPOCH - 1)
+
+        self.assertEqual(islamic.to_jd(1445, 1, 1, scheme=15), islamic.to_jd(1445, 1, 1, scheme='Ic'))
+        self.assertEqual(islamic.to_jd(1445, 1, 1, scheme=16), islamic.to_jd(1445, 1, 1))
+        self.assertEqual(islamic.month_length(1455, 12, 'habash'), 29)
+        self.assertEqual(islamic.month_length(1456, 12, 'habash'), 30)
+        self.assertEqual(islamic.month_length(1456, 12, 'fatimid'), 30)
+        self.assertRaises(ValueError, islamic.to_jd, 1445, 1, 1, scheme='V')
+        self.assertRaises(ValueError, islamic.from_jd, 2459000.5, scheme=[])
+
+        for scheme in islamic.SCHEMES:
+            for jd in range(1948000, 2600000, 3001):
+                self.assertEqual(islamic.to_jd(*islamic.from_jd(jd + 0.5, scheme), scheme=scheme), jd + 0.5)
+            days = list(islamic.iter_days(2459000.5, 2459800.5, scheme=scheme))
+            self.assertEqual(days, [islamic.from_jd(2459000.5 + i, scheme) for i in range(800)])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_scheme_arrays(self):
+        jdns = numpy.arange(1700000, 2600000, 97)
+        for scheme in islamic.SCHEMES:
+            years, months, days = islamic.from_jdn_array(jdns, scheme)
+            dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+            self.assertEqual(dates, [islamic.from_jdn(j, scheme) for j in jdns.tolist()])
+            self.assertEqual(islamic.to_jdn_array(years, months, days, scheme).tolist(), jdns.tolist())
+            self.assertEqual(
+                islamic.leap_array(years, scheme).tolist(), [islamic.leap(y, scheme) for y in years.tolist()]
+            )
+            self.assertEqual(
+                islamic.month_length_array(years, months, scheme).tolist(),
+                [islamic.month_length(y, m, scheme) for y, m in zip(years.tolist(), months.tolist())],
+            )
+
+    def test_date_scheme(self):
+        date = islamic.IslamicDate(1446, 1, 1, scheme='IIa')
+        self.assertEqual(date.to('gregorian'), gregorian.GregorianDate(2024, 7, 7))
+        self.assertEqual(repr(date), "IslamicDate(1446, 1, 1, scheme='IIa')")
+        self.assertEqual(gregorian.GregorianDate(2024, 7, 7).to('islamic', scheme='IIa'), date)
+        self.assertEqual(convert((2024, 7, 7), 'gregorian', 'islamic', scheme='IIa'), (1446, 1, 1))
+
+    def test_occurrences(self):
+        start, end = gregorian.to_jd(2000, 1, 1), gregorian.to_jd(2001, 1, 1)
+        # 1 Shawwal fell twice in 2000
+        dates = [gregorian.from_jd(jd) for jd in islamic.occurrences(10, 1, start, end)]
+        self.assertEqual(dates, [(2000, 1, 8), (2000, 12, 28)])
+        self.assertEqual(islamic.occurrences(10, 1, start + 8, end), [gregorian.to_jd(2000, 12, 28)])
+        self.assertEqual(islamic.occurrences(10, 1, start + 8, start + 300), [])
+
+        start, end = gregorian.to_jd(1900, 1, 1), gregorian.to_jd(2100, 1, 1)
+        expected = [jd for jd in (islamic.to_jd(y, 9, 1) for y in range(1300, 1550)) if start <= jd < end]
+        self.assertEqual(islamic.occurrences(9, 1, start, end), expected)
+
+        # Dhu al-Hijjah 30 only occurs in leap years
+        jds = islamic.occurrences(12, 30, islamic.to_jd(1441, 1, 1), islamic.to_jd(1471, 1, 1), scheme='Ic')
+        years = [islamic.from_jd(jd, 'Ic')[0] for jd in jds]
+        self.assertEqual(years, [y for y in range(1441, 1471) if islamic.leap(y, 'Ic')])
@@ -1,4 +1,11 @@
-from convertdate import julian
+import unittest
+
+from convertdate import gregorian, julian
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from . import CalTestCase
 
@@ -51,3 +58,30 @@ class TestJulian(CalTestCase):
 
     def test_returntype(self):
         self.assertSequenceType(julian.from_gregorian(2020, 6, 4), int)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_jd_array(self):
+        jds = list(range(-1763, 2500000, 997)) + [C, 2400000.5, 2299160.9]
+        years, months, days = julian.from_jd_array(jds)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [julian.from_jd(j) for j in jds])
+        self.assertEqual(julian.to_jd_array(years, months, days).tolist(), [julian.to_jd(*d) for d in dates])
+        self.assertEqual(julian.to_jdn_array(years, months, days).tolist(), [julian.to_jdn(*d) for d in dates])
+        self.assertEqual(julian.from_jdn_array(julian.to_jdn_array(years, months, days))[2].tolist(), days.tolist())
+
+        self.assertEqual(julian.to_jd_array(1900, 2, [28, 29]).tolist(), [2415090.5, 2415091.5])
+        self.assertRaises(ValueError, julian.to_jd_array, [2014, 1900], [2, 2], [29, 29])
+        self.assertRaises(ValueError, julian.to_jd_array, [2014], [4], [31])
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_gregorian_array(self):
+        years, months, days = julian.to_gregorian_array([1582, 1858, -500], [10, 11, 3], [5, 5, 1])
+        self.assertEqual(
+            list(zip(years.tolist(), months.tolist(), days.tolist())), [(1582, 10, 15), (1858, 11, 17), (-500, 2, 24)]
+        )
+
+        dates = [gregorian.from_jd(j) for j in range(113957, 2600000, 3001)]
+        years, months, days = julian.from_gregorian_array(*zip(*dates))
+        converted = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(converted, [julian.from_gregorian(*d) for d in dates])
+        self.assertRaises(ValueError, julian.from_gregorian_array, [1900], [2], [29])
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import importlib
+import os
+import tempfile
+import unittest
+
+from convertdate import gregorian, hebrew, lookup, persian
+
+
+class TestLookup(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        self.start = gregorian.to_jd(2000, 1, 1)
+        self.end = gregorian.to_jd(2002, 1, 1)
+        lookup.build(self.path, self.start, self.end, calendars=('hebrew', 'persian'))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_from_jd(self):
+        with lookup.LookupTable(self.path) as table:
+            self.assertEqual(table.calendars, ('hebrew', 'persian'))
+            self.assertEqual(table.days, 731)
+
+            for jd in range(int(self.start) - 2, int(self.end) + 2):
+                self.assertEqual(table.from_jd('hebrew', jd + 0.5), hebrew.from_jd(jd + 0.5))
+                self.assertEqual(table.from_jd('persian', jd + 0.5), persian.from_jd(jd + 0.5))
+
+            self.assertEqual(table.from_jd('hebrew', self.start + 0.25), hebrew.from_jd(self.start + 0.25))
+
+    def test_fractional_jd(self):
+        start = gregorian.to_jd(1999, 12, 20)
+        lookup.build(self.path, start, start + 20)
+
+        with lookup.LookupTable(self.path) as table:
+            self.assertEqual(table.calendars, lookup.CALENDARS)
+            for calendar in lookup.CALENDARS:
+                module = importlib.import_module('convertdate.' + calendar)
+                for i in range(-8, 88):
+                    jd = start - 2 + i / 4
+                    self.assertEqual(table.from_jd(calendar, jd), module.from_jd(jd), (calendar, jd))
+
+    def test_fallback(self):
+        with lookup.LookupTable(self.path) as table:
+            self.assertIn(self.start, table)
+            self.assertNotIn(self.end, table)
+            self.assertEqual(table.from_jd('hebrew', self.end + 100), hebrew.from_jd(self.end + 100))
+            self.assertEqual(table.from_jd('julian', self.start), (1999, 12, 19))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, lookup.build, self.path, self.end, self.start)
+
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 64)
+
+        self.assertRaises(ValueError, lookup.LookupTable, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 import time
+import unittest
 
 from convertdate import gregorian, mayan
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import CalTestCase
 
 
@@ -87,3 +93,15 @@ class TestMayan(CalTestCase):
 
         with self.assertRaises(ValueError):
             mayan.from_jd(mayan.EPOCH - 1)
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_array(self):
+        jdns = list(range(mayan.EPOCH_JDN, 3000000, 997))
+        counts = mayan.from_jdn_array(jdns)
+        self.assertEqual(list(zip(*(c.tolist() for c in counts))), [mayan.from_jdn(j) for j in jdns])
+        self.assertEqual(mayan.to_jdn_array(*counts).tolist(), jdns)
+        self.assertEqual(mayan.to_jd_array(13, 0, 0, 0, [0, 1]).tolist(), [mayan.to_jd(13, 0, 0, 0, k) for k in (0, 1)])
+        self.assertEqual([c.tolist() for c in mayan.from_jd_array([mayan.EPOCH + 1])], [[0], [0], [0], [0], [1]])
+        self.assertEqual([c.tolist() for c in mayan.from_gregorian_array(2012, 12, 21)], [13, 0, 0, 0, 0])
+        self.assertEqual([c.tolist() for c in mayan.to_gregorian_array(13, 0, 0, 0, 0)], [2012, 12, 21])
+        self.assertRaises(ValueError, mayan.from_jd_array, [mayan.EPOCH - 1])
@@ -1,6 +1,13 @@
 # -*- coding: utf-8 -*-
+import unittest
+
 from convertdate import gregorian, persian
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import CalTestCase
 
 # fmt: off
@@ -45,6 +52,14 @@ class testPersian(CalTestCase):
         self.assertAlmostEqual(persian.equinox_jd(1620), 2312831, places=0)
         self.assertAlmostEqual(persian.equinox_jd(2021), 2459294, places=0)
 
+    def test_equinox_table(self):
+        for gyear in (-1000, -1, 0, 622, 1620, 2021, 3000):
+            with self.subTest(y=gyear):
+                self.assertEqual(persian.equinox_jd(gyear), persian._equinox_jd_meeus(gyear))
+
+        # outside of the table, pymeeus is used and raises for unsupported years
+        self.assertRaises(ValueError, persian.equinox_jd, 3001)
+
     def test_inverse(self):
         self.assertEqual(self.jd, persian.to_jd(*persian.from_jd(self.jd)))
 
@@ -106,3 +121,49 @@ class testPersian(CalTestCase):
     def test_monthcalendar_persian(self):
         self.assertEqual(persian.monthcalendar(1393, 8).pop(0).pop(4), 1)
         self.assertEqual(persian.monthcalendar(1393, 8).pop().pop(0), 25)
+
+    def test_arithmetic_methods(self):
+        for method in (33, 'khayyam', 2820, 'birashk'):
+            with self.subTest(method=method):
+                self.reflexive_method(method)
+                self.assertEqual(persian.to_jd(1400, 1, 1, method=method), 2459294.5)
+                self.assertEqual(persian.from_jd(2459294.5, method=method), (1400, 1, 1))
+
+        self.assertEqual(persian.from_gregorian(2025, 3, 21, method='birashk'), (1404, 1, 2))
+        self.assertEqual(persian.from_gregorian(2025, 3, 21, method='khayyam'), (1404, 1, 1))
+        self.assertEqual(persian.to_gregorian(1403, 12, 30, method=33), (2025, 3, 20))
+        self.assertRaises(ValueError, persian.to_jd, 1400, 1, 1, method='foo')
+
+    def test_arithmetic_leap(self):
+        self.assertTrue(persian.leap(1399, method=33))
+        self.assertTrue(persian.leap(1403, method=33))
+        self.assertFalse(persian.leap(1404, method=33))
+        self.assertFalse(persian.leap(1403, method=2820))
+        self.assertTrue(persian.leap(1404, method=2820))
+        self.assertEqual(persian.month_length(1403, 12, method=33), 30)
+        self.assertEqual(persian.month_length(1403, 12, method=2820), 29)
+        self.assertEqual(len(persian.monthcalendar(1393, 8, method=33)), 5)
+
+    def test_divergent_years(self):
+        self.assertEqual(persian.divergent_years(33, 1300, 1500), [])
+        self.assertEqual(persian.divergent_years(2820, 1400, 1410), [1404])
+
+    def reflexive_method(self, method):
+        for j in self.jdcs:
+            j = j + 0.5
+            self.assertEqual(j, persian.to_jd(*persian.from_jd(j, method=method), method=method))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_array(self):
+        for method, start in ((None, 2400000), (33, 1948320), (2820, 1948320)):
+            jdns = list(range(start, 2600000, 991))
+            years, months, days = persian.from_jdn_array(jdns, method=method)
+            dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+            self.assertEqual(dates, [persian.from_jdn(j, method=method) for j in jdns])
+            self.assertEqual(persian.to_jdn_array(years, months, days, method=method).tolist(), jdns)
+            self.assertEqual(persian.from_jd_array([j - 0.5 for j in jdns], method=method)[2].tolist(), days.tolist())
+
+        self.assertEqual(persian.to_jd_array(1403, 12, 30, method=33).tolist(), persian.to_jd(1403, 12, 30, method=33))
+        self.assertRaises(ValueError, persian.to_jd_array, 1403, 12, 30, method=2820)
+        self.assertEqual(persian.from_gregorian_array(2025, 3, 21, method='birashk')[2].tolist(), 2)
+        self.assertEqual(persian.to_gregorian_array([1404], [1], [1])[2].tolist(), [21])
@@ -2,7 +2,29 @@
 import unittest
 
 from convertdate.data import positivist as data
-from convertdate.positivist import EPOCH, dayname, festival, from_gregorian, from_jd, legal_date, to_gregorian, to_jd
+from convertdate.positivist import (
+    EPOCH,
+    dayname,
+    festival,
+    from_gregorian,
+    from_gregorian_array,
+    from_jd,
+    from_jd_array,
+    from_jdn,
+    from_jdn_array,
+    legal_date,
+    month_length,
+    to_gregorian,
+    to_gregorian_array,
+    to_jd,
+    to_jd_array,
+    to_jdn_array,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestGregorian(unittest.TestCase):
@@ -68,6 +90,15 @@ class TestGregorian(unittest.TestCase):
         self.assertEqual(from_jd(to_jd(50, 13, 25)), (50, 13, 25))
         self.assertEqual(from_jd(to_jd(200, 1, 5)), (200, 1, 5))
         self.assertEqual(from_jd(to_jd(250, 14, 1)), (250, 14, 1))
+        # last day of a 400-year Gregorian cycle
+        self.assertEqual(from_jd(to_jd(212, 14, 2)), (212, 14, 2))
+        self.assertEqual(from_jd(to_jd(212, 14, 2) + 1), (213, 1, 1))
+
+    def test_month_length(self):
+        self.assertEqual(month_length(212, 13), 28)
+        self.assertEqual(month_length(212, 14), 2)
+        self.assertEqual(month_length(213, 14), 1)
+        self.assertRaises(ValueError, month_length, 213, 15)
 
     def test_reflexive_jd2(self):
         assert len(from_jd(2375479.5)) == 3
@@ -92,3 +123,19 @@ class TestGregorian(unittest.TestCase):
     def test_festival(self):
         self.assertIsNone(festival(1, 2))
         self.assertEqual(festival(1, 1), data.FESTIVALS.get((1, 1)))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_array(self):
+        jdns = list(range(int(EPOCH + 0.5), 2600000, 97))
+        years, months, days = from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [from_jdn(j) for j in jdns])
+        self.assertEqual(to_jdn_array(years, months, days).tolist(), jdns)
+        self.assertEqual(from_jd_array([j + 0.2 for j in jdns])[2].tolist(), days.tolist())
+
+        self.assertEqual(to_jd_array(212, 14, [1, 2]).tolist(), [to_jd(212, 14, 1), to_jd(212, 14, 2)])
+        self.assertRaises(ValueError, to_jd_array, [212, 211], 14, 2)
+        self.assertRaises(ValueError, to_jd_array, 1, 15, 1)
+        self.assertRaises(ValueError, from_jdn_array, [int(EPOCH)])
+        self.assertEqual(from_gregorian_array(2016, 1, 1)[0].tolist(), 228)
+        self.assertEqual(to_gregorian_array([228], [1], [1])[0].tolist(), [2016])
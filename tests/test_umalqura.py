@@ -0,0 +1,78 @@
+import unittest
+
+from convertdate import dispatch, gregorian, islamic, umalqura
+from convertdate.umalqura import UmalquraDate
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from . import CalTestCase
+
+
+class TestUmalqura(CalTestCase):
+    def test_reflexive(self):
+        self.reflexive(umalqura)
+        self.reflexive(umalqura, range(umalqura.FIRST_JDN - 2000, umalqura.LAST_JDN + 2000, 7))
+
+    def test_known_dates(self):
+        self.assertEqual(umalqura.to_gregorian(1343, 1, 1), (1924, 8, 1))
+        self.assertEqual(umalqura.to_gregorian(1500, 12, 30), (2077, 11, 16))
+        self.assertEqual(umalqura.to_gregorian(1445, 9, 1), (2024, 3, 11))
+        self.assertEqual(umalqura.to_gregorian(1444, 10, 1), (2023, 4, 21))
+        self.assertEqual(umalqura.from_gregorian(2024, 7, 7), (1446, 1, 1))
+        self.assertEqual(islamic.from_gregorian(2024, 7, 7), (1445, 12, 30))
+
+    def test_month_length(self):
+        self.assertEqual(umalqura.month_length(1445, 8), 29)
+        self.assertEqual(umalqura.month_length(1445, 9), 30)
+        # The early years of the table have a few irregular months
+        self.assertEqual(umalqura.month_length(1343, 9), 28)
+        self.assertEqual(umalqura.month_length(1345, 5), 31)
+        for year in range(umalqura.FIRST_YEAR, umalqura.LAST_YEAR + 1):
+            lengths = [umalqura.month_length(year, m) for m in range(1, 13)]
+            self.assertEqual(sum(lengths), umalqura.to_jdn(year + 1, 1, 1) - umalqura.to_jdn(year, 1, 1))
+
+        self.assertEqual(umalqura.month_length(1600, 12), islamic.month_length(1600, 12))
+
+    def test_fallback(self):
+        for jdn in (umalqura.FIRST_JDN - 1, umalqura.LAST_JDN + 1, 1948439, 2816788):
+            self.assertEqual(umalqura.from_jdn(jdn), islamic.from_jdn(jdn))
+
+        self.assertEqual(umalqura.to_jd(1200, 5, 5), islamic.to_jd(1200, 5, 5))
+        self.assertEqual(umalqura.from_jdn(umalqura.FIRST_JDN), (1343, 1, 1))
+        self.assertEqual(umalqura.from_jdn(umalqura.LAST_JDN), (1500, 12, 30))
+
+    def test_iter_days(self):
+        for start in (umalqura.FIRST_JDN - 400.5, umalqura.LAST_JDN - 400.5):
+            days = list(umalqura.iter_days(start, start + 800))
+            self.assertEqual(days, [umalqura.from_jd(start + i) for i in range(800)])
+
+    def test_monthcalendar(self):
+        # 1 Ramadan 1445 was a monday
+        self.assertEqual(umalqura.monthcalendar(1445, 9)[0], [None, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(umalqura.format(1445, 9, 1), islamic.format(1445, 9, 1))
+
+    def test_date_and_dispatch(self):
+        date = UmalquraDate(1446, 1, 1)
+        self.assertEqual(date.to('gregorian'), gregorian.GregorianDate(2024, 7, 7))
+        self.assertEqual(dispatch.convert((1446, 1, 1), 'umalqura', 'gregorian'), (2024, 7, 7))
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_array(self):
+        jdns = list(range(umalqura.FIRST_JDN - 800, umalqura.LAST_JDN + 800, 13))
+        years, months, days = umalqura.from_jdn_array(jdns)
+        dates = list(zip(years.tolist(), months.tolist(), days.tolist()))
+        self.assertEqual(dates, [umalqura.from_jdn(j) for j in jdns])
+        self.assertEqual(umalqura.to_jdn_array(years, months, days).tolist(), [umalqura.to_jdn(*d) for d in dates])
+        self.assertEqual(umalqura.from_jd_array([umalqura.FIRST_JDN - 0.5])[2].tolist(), [1])
+        self.assertEqual(umalqura.to_jd_array(1200, 5, 5).tolist(), islamic.to_jd(1200, 5, 5))
+
+        years, months, days = umalqura.to_gregorian_array(1446, 1, 1)
+        self.assertEqual((years.tolist(), months.tolist(), days.tolist()), (2024, 7, 7))
+        self.assertEqual(umalqura.from_gregorian_array([2024], [7], [7])[0].tolist(), [1446])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,16 @@ class TestConvertdate(unittest.TestCase):
         self.assertEqual(utils.amod(12, 4), 4)
         self.assertEqual(utils.amod(100, 4), 4)
 
+    def test_iter_days(self):
+        # a calendar of two months of 2 and 3 days, with the year starting at Julian day 0.5
+        def from_jd(jd):
+            year, yday = divmod(int(jd - 0.5), 5)
+            return (year, 1, yday + 1) if yday < 2 else (year, 2, yday - 1)
+
+        days = list(utils.iter_days(1.5, 8.5, from_jd, lambda y, m: m + 1, lambda y: range(1, 3)))
+        self.assertEqual(days, [from_jd(jd + 0.5) for jd in range(1, 8)])
+        self.assertEqual(list(utils.iter_days(1.5, 1.5, from_jd, lambda y, m: m + 1, lambda y: range(1, 3))), [])
+
     def test_jwday(self):
         self.assertEqual(utils.jwday(2459252.5), 6)
         self.assertEqual(utils.weekday_before(0, 2459252.5), 2459252.5 - 6)